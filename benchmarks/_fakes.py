@@ -0,0 +1,183 @@
+"""
+Local stand-ins shared by the benchmarks.
+
+`resources/__init__.py` connects to MQTT and signs in over HTTP at import
+time, so benchmarks load the modules they measure straight from their source
+files and, where a network client is involved, replace it with a local fake.
+"""
+
+import importlib.util
+import os
+import sys
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault("API_USERNAME", "benchmark")
+os.environ.setdefault("API_PASSWORD", "benchmark")
+
+
+def load_source(module_name: str, relative_path: str) -> types.ModuleType:
+    """Import a repository module from its file without running package __init__ files."""
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(ROOT, relative_path))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeRedis:
+    """In-memory Redis with a simulated network round-trip time."""
+
+    def __init__(self, rtt: float = 0.0005, **_kwargs) -> None:
+        self.rtt = rtt
+        self.data = {}
+        self.round_trips = 0
+
+    def _round_trip(self) -> None:
+        self.round_trips += 1
+        if self.rtt:
+            time.sleep(self.rtt)
+
+    def ping(self) -> bool:
+        self._round_trip()
+        return True
+
+    def get(self, key):
+        self._round_trip()
+        return self.data.get(key)
+
+    def mget(self, keys):
+        self._round_trip()
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key, value) -> bool:
+        self._round_trip()
+        self.data[key] = value
+        return True
+
+    def delete(self, key) -> int:
+        self._round_trip()
+        return int(self.data.pop(key, None) is not None)
+
+    def close(self) -> None:
+        pass
+
+
+def install_fake_redis(rtt: float = 0.0005) -> FakeRedis:
+    """Register a fake `redis` package so resources/redis.py talks to FakeRedis."""
+    fake = FakeRedis(rtt=rtt)
+    module = types.ModuleType("redis")
+    module.Redis = lambda **kwargs: fake
+    module.ConnectionError = ConnectionError
+    sys.modules["redis"] = module
+    return fake
+
+
+class FakeHTTP:
+    """Serves fixed Store payloads in place of resources.http.HTTP."""
+
+    def __init__(self, payloads: dict) -> None:
+        self.payloads = payloads
+
+    def __getattr__(self, name):
+        if not name.startswith("get_"):
+            raise AttributeError(name)
+        key = name[len("get_"):]
+        return lambda conditional=False: list(self.payloads.get(key, []))
+
+
+def install_fake_resources(payloads: dict = None) -> FakeHTTP:
+    """Register a stand-in `resources` package so store.py and models.automation import without MQTT/HTTP/Redis."""
+    http = FakeHTTP(payloads or {})
+    module = types.ModuleType("resources")
+    # 서브모듈(resources.mqtt 등)은 실제 소스에서 import 되도록 패키지 경로 유지
+    module.__path__ = [os.path.join(ROOT, "resources")]
+    module.http = http
+    module.redis = types.SimpleNamespace(set=lambda key, value: True, get=lambda key: None)
+    module.mqtt = types.SimpleNamespace(
+        client=types.SimpleNamespace(message_callback_add=lambda topic, callback: None),
+        dispatcher=types.SimpleNamespace(add=lambda topic, handler: None, remove=lambda topic, handler: None),
+        publish_message=lambda topic, payload: None
+    )
+    sys.modules["resources"] = module
+    return http
+
+
+class FakeEZODevice:
+    """Atlas EZO board behind an I2C address: answers 254 until its command has finished."""
+
+    BUFFER_SIZE = 31
+
+    def __init__(self, moduletype: str, name: str, value: str, read_time: float, command_time: float = 0.3) -> None:
+        self.moduletype = moduletype
+        self.name = name
+        self.value = value
+        self.read_time = read_time
+        self.command_time = command_time
+        self._response = None
+        self._ready_at = 0.0
+        self.reads = 0
+
+    def command(self, cmd: str) -> None:
+        upper = cmd.upper()
+        if upper == "R":
+            self._response, delay = self.value, self.read_time
+        elif upper == "I":
+            self._response, delay = f"?I,{self.moduletype},2.16", self.command_time
+        elif upper == "NAME,?":
+            self._response, delay = f"?Name,{self.name}", self.command_time
+        else:
+            self._response, delay = "", self.command_time
+        self._ready_at = time.monotonic() + delay
+
+    def read(self, num_of_bytes: int) -> bytes:
+        self.reads += 1
+        if self._response is None:
+            return bytes([255])
+        if time.monotonic() < self._ready_at:
+            return bytes([254])
+        # 펌웨어처럼 응답 문자열 뒤를 NUL로 채우고, 라즈베리파이 글리치처럼 일부 바이트의 MSB를 세움
+        data = bytes([1]) + bytes(b | 0x80 for b in self._response.encode("ascii"))
+        return (data + b"\x00" * num_of_bytes)[:min(num_of_bytes, self.BUFFER_SIZE)]
+
+
+class FakeI2CFile:
+    """One end of the /dev/i2c-N file pair AtlasI2C opens; ioctl(I2C_SLAVE) selects the device."""
+
+    def __init__(self, bus: "FakeI2CBus") -> None:
+        self.bus = bus
+        self.address = None
+
+    def write(self, data: bytes) -> int:
+        self.bus.device(self.address).command(data.rstrip(b"\x00").decode("latin-1"))
+        return len(data)
+
+    def read(self, num_of_bytes: int) -> bytes:
+        return self.bus.device(self.address).read(num_of_bytes)
+
+    def close(self) -> None:
+        pass
+
+
+class FakeI2CBus:
+    """Replaces io.open('/dev/i2c-N') and fcntl.ioctl inside a loaded drivers/AtlasI2C.py module."""
+
+    def __init__(self, devices: dict) -> None:
+        self.devices = devices
+
+    def device(self, address) -> FakeEZODevice:
+        if address not in self.devices:
+            raise OSError(121, "Remote I/O error")
+        return self.devices[address]
+
+    def install(self, atlas_module: types.ModuleType) -> None:
+        atlas_module.io = types.SimpleNamespace(open=lambda file, mode, buffering: FakeI2CFile(self))
+
+        def ioctl(file, request, address):
+            file.address = address
+
+        atlas_module.fcntl = types.SimpleNamespace(ioctl=ioctl)
@@ -0,0 +1,83 @@
+"""
+Atlas EZO response parsing: the old text round trip (per-character glitch
+masking, "Success <info>: <value>" string, split back into a float) vs the
+bytes path (one bytes.translate, memoryview up to the NUL, float() on bytes).
+
+Usage:
+    python benchmarks/atlas_parse_benchmark.py --calls 200000
+"""
+
+import argparse
+import time
+
+from _fakes import load_source
+from tabulate import tabulate
+
+atlas_module = load_source("bench_atlas_i2c", "drivers/AtlasI2C.py")
+AtlasI2C = atlas_module.AtlasI2C
+
+
+class ConstantFile:
+    """/dev/i2c 읽기 스트림 대신 같은 응답을 계속 돌려줌"""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def read(self, num_of_bytes: int) -> bytes:
+        return self.data
+
+
+def make_device(raw: bytes) -> AtlasI2C:
+    device = AtlasI2C.__new__(AtlasI2C)
+    device._address, device._name, device._module = 0x63, "tank_ph", "pH"
+    device.file_read = ConstantFile(raw)
+    return device
+
+
+def text_round_trip(device) -> float:
+    """기존 경로: 문자 리스트 -> 문자열 -> split -> float"""
+    raw_data = device.file_read.read(31)
+    response = device.get_response(raw_data=raw_data)
+    is_valid, error_code = device.response_valid(response=response)
+    if not is_valid:
+        raise ValueError(error_code)
+    char_list = device.handle_raspi_glitch(response[1:])
+    text = "Success " + device.get_device_info() + ": " + str(''.join(char_list))
+    return float(text.split(':')[-1].strip().split('\x00')[0])
+
+
+def bytes_path(device) -> float:
+    """새 경로: translate + memoryview + float(bytes)"""
+    status, payload = device.read_bytes()
+    if status != 1:
+        raise ValueError(status)
+    return float(payload)
+
+
+def per_call_ns(fn, device, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn(device)
+    return (time.perf_counter() - started) / calls * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200000)
+    args = parser.parse_args()
+
+    rows = []
+    for label, payload in (("pH 6.21", b"6.21"), ("EC 1482.37", b"1482.37"), ("RTD 21.375", b"21.375")):
+        # 상태 바이트 + MSB 글리치가 섞인 응답 + NUL 패딩 (31바이트)
+        raw = (bytes([1]) + bytes(b | 0x80 for b in payload) + b"\x00" * 31)[:31]
+        device = make_device(raw)
+        assert text_round_trip(device) == bytes_path(device) == float(payload)
+        before = per_call_ns(text_round_trip, device, args.calls)
+        after = per_call_ns(bytes_path, device, args.calls)
+        rows.append([label, f"{before:.0f}", f"{after:.0f}", f"{before / after:.1f}x"])
+
+    print(tabulate(rows, headers=["Response", "Text round trip (ns)", "Bytes path (ns)", "Speedup"], tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Atlas EZO cycle time: fixed-sleep discovery and reads vs batched, readiness-
+polled I/O through AtlasReadScheduler.
+
+The boards are simulated behind a fake /dev/i2c file pair: each one answers
+254 (still processing) until its command's processing time has passed, like
+the real EZO firmware.
+
+Usage:
+    python benchmarks/atlas_read_benchmark.py --cycles 3
+"""
+
+import argparse
+import time
+
+from _fakes import FakeEZODevice, FakeI2CBus, load_source
+from tabulate import tabulate
+
+atlas_module = load_source("bench_atlas_i2c", "drivers/AtlasI2C.py")
+AtlasI2C = atlas_module.AtlasI2C
+
+from drivers.atlas_reader import AtlasReadScheduler, query_all, read_response, STATUS_SUCCESS  # noqa: E402
+
+
+def build_bus() -> FakeI2CBus:
+    # list_i2c_devices()가 반환하는 주소와 동일 (EZO 공장 기본값)
+    return FakeI2CBus({
+        0x63: FakeEZODevice("pH", "tank_ph", "6.21", read_time=0.9),
+        0x64: FakeEZODevice("EC", "tank_ec", "1.482", read_time=0.6),
+        0x66: FakeEZODevice("RTD", "tank_rtd", "21.375", read_time=0.6),
+    })
+
+
+def discover_sequential():
+    """기존 방식: 주소마다 명령별로 고정 대기"""
+    device = AtlasI2C()
+    found = []
+    for address in device.list_i2c_devices():
+        device.set_i2c_address(address)
+        moduletype = device.query("I").split(",")[1]
+        name = device.query("name,?").split(",")[1]
+        found.append(AtlasI2C(address=address, moduletype=moduletype, name=name))
+    return found
+
+
+def discover_batched():
+    """모든 장치에 한 번에 보내고 준비된 것부터 수집"""
+    probes = [AtlasI2C(address=address) for address in AtlasI2C().list_i2c_devices()]
+    options = dict(poll_delay=AtlasI2C.SHORT_TIMEOUT, poll_interval=0.05, timeout=3.0)
+    info = query_all(probes, "I", **options)
+    names = query_all(probes, "name,?", **options)
+    return [
+        AtlasI2C(address=probe.address, moduletype=info[probe.address][1].split(",")[1],
+                 name=names[probe.address][1].split(",")[1])
+        for probe in probes
+    ]
+
+
+def read_fixed_sleep(devices):
+    """기존 방식: 모두에 R 전송 후 LONG_TIMEOUT 고정 대기"""
+    for device in devices:
+        device.write("R")
+    time.sleep(AtlasI2C.LONG_TIMEOUT)
+    values = {}
+    for device in devices:
+        response = device.read()
+        values[device.moduletype] = float(response.split(':')[-1].strip().split('\x00')[0])
+    return values
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cycles", type=int, default=3)
+    parser.add_argument("--poll-interval", type=float, default=0.05)
+    args = parser.parse_args()
+
+    bus = build_bus()
+    bus.install(atlas_module)
+
+    before_discovery, devices = timed(discover_sequential)
+    after_discovery, batched_devices = timed(discover_batched)
+    assert [d.moduletype for d in devices] == [d.moduletype for d in batched_devices]
+
+    before_cycles = [timed(lambda: read_fixed_sleep(devices))[0] for _ in range(args.cycles)]
+
+    scheduler = AtlasReadScheduler(batched_devices, poll_interval=args.poll_interval)
+    stream = []
+    scheduler.subscribe(stream.append)
+    after_cycles = []
+    for _ in range(args.cycles):
+        elapsed, readings = timed(scheduler.read_cycle)
+        after_cycles.append(elapsed)
+        assert all(reading.status == STATUS_SUCCESS for reading in readings), readings
+
+    rows = [
+        ["discovery (I + name,?)", f"{before_discovery:.2f}", f"{after_discovery:.2f}"],
+        ["read cycle (avg)", f"{sum(before_cycles) / len(before_cycles):.2f}", f"{sum(after_cycles) / len(after_cycles):.2f}"],
+    ]
+    print(tabulate(rows, headers=["Operation", "Fixed sleep (s)", "Batched + polled (s)"], tablefmt="grid"))
+    print(f"scheduler: {scheduler.report()}")
+    print("stream:", ", ".join(f"{r.device}={r.value}@{r.timestamp:.2f}" for r in stream[-len(batched_devices):]))
+    # read_response()가 NUL 패딩/MSB 글리치를 처리하는지 확인
+    batched_devices[0].write("R")
+    time.sleep(1.0)
+    status, payload = read_response(batched_devices[0])
+    print("parsed:", status, bytes(payload))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+On/off timing accuracy of IntervalAutomation under load.
+
+Short-duration interval automations (default 0.5-1.5 s on, 1-2 s off) run on
+the real AutomationScheduler while CPU-bound threads compete for the GIL.
+Every status change is timestamped and compared with the ideal timeline
+(first toggle + n x interval + m x duration):
+
+- poll (before): the original thread loop, calling control() every --poll s
+- deadline, anchor to now (before): scheduler wakes at next_run_time(), but
+  each toggle restarts the clock from the moment control() ran
+- closed form (after): next_transition() gives the exact instant and the
+  timeline is anchored to planned instants, so lateness does not accumulate
+
+A second table checks the waterspray closed form (LED-dependent interval)
+against a 10 ms step search of the original rule over random start times.
+
+The script exits non-zero if the closed form misses its guarantees: p99
+lateness and max drift from the ideal timeline must stay under --limit
+(1 s), and the waterspray closed form must match the step search within its
+10 ms resolution.
+
+Usage:
+    python benchmarks/interval_timing_benchmark.py --automations 20 --seconds 20 --load-threads 4
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime
+
+from _fakes import install_fake_resources
+from tabulate import tabulate
+
+os.environ.setdefault("LOG_LEVEL", "warning")
+install_fake_resources()
+
+from managers.automation_scheduler import AutomationScheduler  # noqa: E402
+from models.Machine import BaseMachine  # noqa: E402
+from models.automation.interval import IntervalAutomation  # noqa: E402
+from utils.photoperiod import photoperiod  # noqa: E402
+from utils.schedule import Schedule  # noqa: E402
+
+
+class LegacyIntervalAutomation(IntervalAutomation):
+    """이전 control()/next_run_time(): 경과 시간 비교, 전환 시각은 실행 시점 기준"""
+
+    def next_run_time(self, now: datetime):
+        if not self.active:
+            return None
+        if self.state.last_toggle_at is None:
+            return now
+        length = self.duration if self.status else self._calculate_effective_interval()
+        return datetime.fromtimestamp(self.state.last_toggle_at + length)
+
+    def control(self):
+        now = time.time()
+        if self.state.last_toggle_at is None:
+            return self._handle_first_run(now)
+        elapsed = now - self.state.last_toggle_at
+        if self.status:
+            if elapsed >= self.duration:
+                self.update_device_status(False)
+                self.state.update_toggle_time(now)
+        elif elapsed >= self._calculate_effective_interval(now):
+            self.update_device_status(True)
+            self.state.update_toggle_time(now)
+        return None
+
+
+def make_automation(cls, index: int, duration: float, interval: float):
+    automation = cls(index, "interval", True, f"{duration}s", f"{interval}s")
+    automation.set_machine(BaseMachine(machine_id=index, name=f"spray{index}", pin=index, status=0))
+    events = []
+
+    def record(status: bool) -> None:
+        events.append((time.time(), bool(status)))
+        automation.status = status
+
+    automation.update_device_status = record
+    return automation, events
+
+
+def burn(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(i * i for i in range(2000))
+
+
+def analyze(runs):
+    lateness, drifts, on_errors = [], [], []
+    for automation, events in runs:
+        if not events:
+            continue
+        t0 = events[0][0]  # 첫 실행 (OFF로 시작)
+        toggles = [(t, s) for (t, s), (_, prev) in zip(events[1:], events) if s != prev]
+        d, interval = automation.duration, automation.base_interval
+        previous = t0
+        for k, (t, status) in enumerate(toggles, start=1):
+            ideal = t0 + ((k + 1) // 2) * interval + (k // 2) * d
+            drifts.append(abs(t - ideal))
+            lateness.append(t - previous - (interval if status else d))
+            if not status:
+                on_errors.append(abs(t - previous - d))
+            previous = t
+    return lateness, drifts, on_errors
+
+
+def run(mode: str, args, specs):
+    cls = LegacyIntervalAutomation if mode != "closed" else IntervalAutomation
+    runs = [make_automation(cls, i, d, iv) for i, (d, iv) in enumerate(specs, start=1)]
+    stop = threading.Event()
+    load = [threading.Thread(target=burn, args=(stop,), daemon=True) for _ in range(args.load_threads)]
+    for thread in load:
+        thread.start()
+
+    if mode == "poll":
+        def loop(automation):
+            while not stop.wait(args.poll):
+                automation.control()
+        automation_threads = [threading.Thread(target=loop, args=(a,), daemon=True) for a, _ in runs]
+        for automation, _ in runs:
+            automation.control()
+        for thread in automation_threads:
+            thread.start()
+        time.sleep(args.seconds)
+        stop.set()
+        for thread in automation_threads:
+            thread.join()
+    else:
+        scheduler = AutomationScheduler(workers=4, resync_interval=60)
+        for automation, _ in runs:
+            scheduler.add(automation)
+        scheduler.start()
+        time.sleep(args.seconds)
+        scheduler.stop()
+        stop.set()
+
+    for thread in load:
+        thread.join()
+    return analyze(runs)
+
+
+# 단계 탐색 해상도 (10 ms) + 부동소수점 여유
+STEP_SEARCH_TOLERANCE = 0.011
+
+
+def waterspray_check(samples: int, seed: int):
+    automation = IntervalAutomation(99, "interval", True, "1m", "30m")
+    automation.set_machine(BaseMachine(machine_id=99, name="waterspray", pin=99, status=0))
+    photoperiod.configure(Schedule.from_settings({"start_time": "06:00", "end_time": "18:00"}), True)
+    rng = random.Random(seed)
+    base = datetime(2024, 6, 3).timestamp()
+    worst = 0.0
+    crossing = 0
+    for _ in range(samples):
+        off_at = base + rng.uniform(0, 86400)
+        closed = automation._next_on_at(off_at)
+        # 원래 규칙: 경과 시간 >= 그 시점의 유효 interval 이 되는 첫 시각 (10ms 단위 탐색)
+        t = off_at + automation.base_interval
+        while t - off_at < automation._calculate_effective_interval(t):
+            t += 0.01
+        worst = max(worst, abs(closed - t))
+        crossing += off_at + automation.base_interval < closed < off_at + 2 * automation.base_interval
+    return [[samples, crossing, f"{worst * 1000:.1f} ms"]], worst
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--automations", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=20.0)
+    parser.add_argument("--load-threads", type=int, default=4, help="CPU-bound threads competing for the GIL")
+    parser.add_argument("--poll", type=float, default=1.0, help="poll period of the original thread loop (s)")
+    parser.add_argument("--samples", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=5)
+    parser.add_argument("--limit", type=float, default=1.0, help="max p99 lateness / drift for the closed form (s)")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    specs = [(round(rng.uniform(0.5, 1.5), 2), round(rng.uniform(1.0, 2.0), 2)) for _ in range(args.automations)]
+
+    rows, failures = [], []
+    for label, mode in (
+        (f"poll every {args.poll:g}s (before)", "poll"),
+        ("deadline, anchor to now (before)", "legacy"),
+        ("closed form (after)", "closed"),
+    ):
+        lateness, drifts, on_errors = run(mode, args, specs)
+        ordered = sorted(lateness)
+        p99 = ordered[int(len(ordered) * 0.99) - 1] if ordered else 0.0
+        if mode == "closed":
+            if not lateness:
+                failures.append("closed form: no toggles recorded")
+            elif p99 >= args.limit or max(drifts) >= args.limit:
+                failures.append(
+                    f"closed form: p99 lateness {p99:.3f}s / max drift {max(drifts):.3f}s not under {args.limit:g}s"
+                )
+        rows.append([
+            label, len(lateness),
+            f"{statistics.median(lateness) * 1000:.1f}", f"{p99 * 1000:.1f}",
+            f"{max(on_errors) * 1000:.1f}" if on_errors else "-",
+            f"{max(drifts) * 1000:.1f}" if drifts else "-",
+        ])
+
+    print(f"{args.automations} automations, {args.seconds:g}s, {args.load_threads} CPU load threads")
+    print(tabulate(rows, headers=["Mode", "Toggles", "Lateness p50 (ms)", "Lateness p99 (ms)",
+                                  "Max ON-duration error (ms)", "Max drift from ideal (ms)"], tablefmt="grid"))
+
+    print("\nWaterspray next ON (LED 06:00-18:00, interval 1800s, doubled while LED is off)")
+    waterspray_rows, worst = waterspray_check(args.samples, args.seed)
+    print(tabulate(waterspray_rows,
+                   headers=["Start times", "LED edge inside OFF phase", "Max |closed form - step search|"],
+                   tablefmt="grid"))
+    if worst > STEP_SEARCH_TOLERANCE:
+        failures.append(f"waterspray closed form differs from step search by {worst * 1000:.1f} ms")
+
+    if failures:
+        print("\nFAIL: " + "\nFAIL: ".join(failures))
+        sys.exit(1)
+    print("\nOK: closed form within limits, waterspray matches step search")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Synchronous StreamHandler + RotatingFileHandler vs the async log pipeline.
+
+Measures the latency a caller sees per logger.info() call and the overall
+records/sec until everything is on disk.
+
+Usage:
+    python benchmarks/log_pipeline_benchmark.py --records 50000 --threads 4
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+
+from _fakes import load_source
+from tabulate import tabulate
+
+FORMAT = '%(asctime)s | [%(levelname)s] | task:%(task_id)s | %(threadName)s | %(name)s: %(message)s'
+
+
+class TaskId(logging.Filter):
+    def filter(self, record):
+        record.task_id = '-'
+        return True
+
+
+def percentile(samples, point):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(round(point / 100 * (len(samples) - 1))))]
+
+
+def drive(logger, records: int, threads: int):
+    """여러 스레드에서 동시에 로그를 남기고 호출당 지연 시간 수집"""
+    latencies = [[] for _ in range(threads)]
+
+    def worker(index):
+        samples = latencies[index]
+        for i in range(records // threads):
+            t0 = time.perf_counter()
+            logger.info(f"Sensor temperature: 목표값 범위 내 (연속 카운트: {i % 3}/3, 현재값: 24.{i % 10})")
+            samples.append(time.perf_counter() - t0)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return [sample for samples in latencies for sample in samples]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=50000)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    pipeline_module = load_source("bench_logger_pipeline", "logger/pipeline.py")
+    formatter = logging.Formatter(FORMAT, datefmt='%Y-%m-%d %H-%M-%S')
+    devnull = open(os.devnull, "w")
+    rows = []
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        # 이전 방식: 호출 스레드에서 포맷 + 콘솔 + 파일 기록 (레코드마다 flush)
+        sync_logger = logging.getLogger("bench.sync")
+        sync_logger.propagate = False
+        sync_logger.setLevel(logging.DEBUG)
+        for handler in (logging.StreamHandler(devnull), RotatingFileHandler(
+                os.path.join(log_dir, "sync.log"), maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8")):
+            handler.setFormatter(formatter)
+            handler.addFilter(TaskId())
+            sync_logger.addHandler(handler)
+
+        started = time.perf_counter()
+        latencies = drive(sync_logger, args.records, args.threads)
+        elapsed = time.perf_counter() - started
+        rows.append(["sync handlers (before)", f"{len(latencies) / elapsed:,.0f}",
+                     f"{percentile(latencies, 50) * 1e6:.1f}", f"{percentile(latencies, 99) * 1e6:.1f}",
+                     f"{max(latencies) * 1e3:.2f}", 0])
+
+        # 비동기 파이프라인: 호출 스레드는 큐에 넣기만 함
+        pipeline = pipeline_module.AsyncLogPipeline(formatter, queue_size=10000, stream=devnull)
+        pipeline.handler.addFilter(TaskId())
+        pipeline.register("bench.async", pipeline_module.BatchedRotatingFileHandler(
+            os.path.join(log_dir, "async.log"), maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"))
+        async_logger = logging.getLogger("bench.async")
+        async_logger.propagate = False
+        async_logger.setLevel(logging.DEBUG)
+        async_logger.addHandler(pipeline.handler)
+        pipeline.start()
+
+        started = time.perf_counter()
+        latencies = drive(async_logger, args.records, args.threads)
+        pipeline.stop(timeout=60)  # 모든 레코드가 파일에 기록될 때까지 포함
+        elapsed = time.perf_counter() - started
+        dropped = sum(pipeline.handler.take_dropped().values())
+        rows.append(["async pipeline (after)", f"{pipeline.written / elapsed:,.0f}",
+                     f"{percentile(latencies, 50) * 1e6:.1f}", f"{percentile(latencies, 99) * 1e6:.1f}",
+                     f"{max(latencies) * 1e3:.2f}", dropped])
+
+    print(f"{args.records} records from {args.threads} threads")
+    print(tabulate(rows, headers=["Mode", "records/s written", "call p50 (us)", "call p99 (us)", "call max (ms)", "dropped"],
+                   tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
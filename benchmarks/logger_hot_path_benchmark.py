@@ -0,0 +1,93 @@
+"""
+Hot-path cost of a log call: per-call ThreadLogger.get_logger() lookup vs the
+cached per-thread binding, and RotatingFileHandler's per-record stat/seek
+rollover check vs DailyRotatingFileHandler on the writer thread.
+
+Usage:
+    python benchmarks/logger_hot_path_benchmark.py --calls 200000
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from _fakes import load_source
+from tabulate import tabulate
+
+LOG_DIR = tempfile.mkdtemp(prefix="logger-bench-")
+os.environ["LOG_DIR"] = LOG_DIR
+os.environ["LOG_SAMPLE_DEBUG"] = "0"  # 큐/기록 비용을 빼고 호출 경로만 측정
+
+from logger.custom_logger import CustomLogger  # noqa: E402
+
+
+def per_call_ns(fn, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls * 1e9
+
+
+class StatCounter:
+    """Count os.stat calls (os.path.exists/isfile go through it)."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._stat = os.stat
+
+    def __enter__(self):
+        def counting_stat(*args, **kwargs):
+            self.count += 1
+            return self._stat(*args, **kwargs)
+        os.stat = counting_stat
+        return self
+
+    def __exit__(self, *exc):
+        os.stat = self._stat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200000)
+    parser.add_argument("--records", type=int, default=50000)
+    args = parser.parse_args()
+
+    logger = CustomLogger().set_machine("temperature")
+    logger.debug("warm up")
+    thread_logger = logger._thread_logger
+
+    caller_rows = [
+        ["lookup: ThreadLogger.get_logger() (before)",
+         f"{per_call_ns(lambda: thread_logger.get_logger(logger.machine_name), args.calls):.0f}"],
+        ["lookup: cached binding (after)", f"{per_call_ns(logger._logger, args.calls):.0f}"],
+        ["debug(): lookup every call (before)",
+         f"{per_call_ns(lambda: thread_logger.get_logger(logger.machine_name).debug('x'), args.calls):.0f}"],
+        ["debug(): cached binding (after)", f"{per_call_ns(lambda: logger.debug('x'), args.calls):.0f}"],
+    ]
+
+    pipeline_module = load_source("bench_logger_pipeline", "logger/pipeline.py")
+    formatter = logging.Formatter('%(asctime)s | [%(levelname)s] | %(name)s: %(message)s')
+    record = logging.LogRecord("automation/temperature", logging.INFO, __file__, 0,
+                               "Sensor temperature: 목표값 범위 내 (현재값: 24.1)", None, None)
+
+    writer_rows = []
+    for label, handler in (
+        ("RotatingFileHandler check (before)", pipeline_module.BatchedRotatingFileHandler(
+            os.path.join(LOG_DIR, "rotating.log"), maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8")),
+        ("DailyRotatingFileHandler (after)", pipeline_module.DailyRotatingFileHandler(
+            LOG_DIR, "daily.log", subdir="automation", maxBytes=10 * 1024 * 1024, backupCount=5)),
+    ):
+        handler.setFormatter(formatter)
+        with StatCounter() as stats:
+            ns = per_call_ns(lambda: handler.handle(record), args.records)
+        handler.close()
+        writer_rows.append([label, f"{ns:.0f}", f"{stats.count / args.records:.1f}"])
+
+    print(tabulate(caller_rows, headers=["Caller hot path", "ns / call"], tablefmt="grid"))
+    print(tabulate(writer_rows, headers=["Writer thread", "ns / record", "stat() / record"], tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
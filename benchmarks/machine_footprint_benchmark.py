@@ -0,0 +1,86 @@
+"""
+Device-state footprint: dict-backed BaseMachine vs __slots__, and per-tick
+allocations of BaseAutomation.get_machine() with and without a bound machine.
+
+Usage:
+    python benchmarks/machine_footprint_benchmark.py --devices 10000 --ticks 100
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from _fakes import install_fake_resources
+from tabulate import tabulate
+
+install_fake_resources()
+
+from models.Machine import BaseMachine  # noqa: E402
+from models.automation import RangeAutomation  # noqa: E402
+from settings.mqtt_topics import MQTTTopics  # noqa: E402
+
+
+class DictMachine:
+    """BaseMachine as it was before __slots__ (per-instance __dict__)."""
+
+    def __init__(self, machine_id=None, pin=None, name=None, status=None, switch_created_at=None):
+        self.machine_id = machine_id
+        self.name = name
+        self.mqtt_topic = MQTTTopics.switch(name) if name else None
+        self.pin = pin
+        self.status = status
+        self.switch_created_at = switch_created_at
+
+
+def measure(fn):
+    """Return (bytes still allocated, peak bytes) for objects kept alive by fn()."""
+    gc.collect()
+    tracemalloc.start()
+    kept = fn()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--devices", type=int, default=10000)
+    parser.add_argument("--automations", type=int, default=100)
+    parser.add_argument("--ticks", type=int, default=100)
+    args = parser.parse_args()
+
+    def build(cls):
+        return lambda: [cls(machine_id=i, pin=i % 40, name=f"device-{i}", status=0) for i in range(args.devices)]
+
+    dict_bytes, _ = measure(build(DictMachine))
+    slot_bytes, _ = measure(build(BaseMachine))
+
+    automations = []
+    for i in range(args.automations):
+        automation = RangeAutomation(i, "range", False, "08:00", "20:00", None)
+        automation.set_machine(BaseMachine(machine_id=i, pin=i % 40, name=f"device-{i}", status=0))
+        automations.append(automation)
+
+    def ticks():
+        # 반환된 객체를 모두 붙잡아 두어 틱마다 새로 할당된 양을 측정
+        return [automation.get_machine() for _ in range(args.ticks) for automation in automations]
+
+    shared_bytes, _ = measure(ticks)
+    for automation in automations:
+        automation.machine = None
+    fresh_bytes, _ = measure(ticks)
+    calls = args.ticks * args.automations
+
+    print(tabulate([
+        [f"{args.devices} machines, __dict__", f"{dict_bytes / 1024:.0f}", f"{dict_bytes / args.devices:.0f}"],
+        [f"{args.devices} machines, __slots__", f"{slot_bytes / 1024:.0f}", f"{slot_bytes / args.devices:.0f}"],
+    ], headers=["Device table", "KiB", "bytes / device"], tablefmt="grid"))
+    print(tabulate([
+        ["new BaseMachine per call (before)", f"{fresh_bytes / 1024:.0f}", f"{fresh_bytes / calls:.0f}"],
+        ["bound Store machine (after)", f"{shared_bytes / 1024:.0f}", f"{shared_bytes / calls:.0f}"],
+    ], headers=[f"get_machine() x{calls}", "KiB", "bytes / call"], tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Payload size and encode/decode throughput: JSON schema vs the compact layout.
+
+Generates a mix of environment readings (floats), switch commands (bools)
+and current readings (ints) in the standard {"pattern", "data": {"name",
+"value"}} schema, then for each format:
+
+- encodes every payload (publisher side)
+- parses every payload into a DispatchedMessage (the dispatcher's only
+  parse; this replaced MQTTMessage.from_message in the subscriber path)
+- checks the handler sees the same payload dict and value as with JSON
+
+Wire bytes are the full MQTT 3.1.1 QoS 0 PUBLISH packet (fixed header,
+topic, payload), i.e. what crosses the site link per message.
+
+Usage:
+    python benchmarks/mqtt_codec_benchmark.py --messages 200000
+"""
+
+import argparse
+import json
+import random
+import time
+
+from _fakes import install_fake_resources, load_source
+from tabulate import tabulate
+
+install_fake_resources()
+
+codec_module = load_source("bench_utils_mqtt_codec", "utils/mqtt_codec.py")
+mqtt_module = load_source("bench_resources_mqtt", "resources/mqtt.py")
+
+FAMILIES = ("environment", "switch", "current")
+
+
+def make_messages(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    sensors = ["ph", "ec", "water_temperature", "temperature", "humidity", "co2"]
+    devices = [f"device{i}" for i in range(20)]
+    messages = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.7:
+            topic, value = f"environment/{rng.choice(sensors)}", round(rng.uniform(5, 1500), 2)
+        elif roll < 0.9:
+            topic, value = f"switch/{rng.choice(devices)}", rng.random() < 0.5
+        else:
+            topic, value = f"current/{rng.choice(devices)}", rng.randint(0, 3000)
+        messages.append((topic, codec_module.standard_payload(topic, value)))
+    return messages
+
+
+def wire_size(topic: str, payload: bytes) -> int:
+    """QoS 0 PUBLISH 패킷 크기 (고정 헤더 + 토픽 길이 2바이트 + 토픽 + 페이로드)"""
+    remaining = 2 + len(topic.encode()) + len(payload)
+    length_bytes = 1 if remaining < 128 else 2 if remaining < 16384 else 3
+    return 1 + length_bytes + remaining
+
+
+def run(label: str, encode, messages):
+    begin = time.perf_counter()
+    encoded = [encode(topic, payload) for topic, payload in messages]
+    encode_seconds = time.perf_counter() - begin
+
+    received_at = time.perf_counter()
+    begin = time.perf_counter()
+    parsed = [mqtt_module.DispatchedMessage(topic, raw, received_at)
+              for (topic, _), raw in zip(messages, encoded)]
+    decode_seconds = time.perf_counter() - begin
+
+    mismatched = sum(message.payload != payload or message.value != payload["data"]["value"]
+                     for message, (_, payload) in zip(parsed, messages))
+    count = len(messages)
+    payload_bytes = sum(len(raw) for raw in encoded)
+    wire_bytes = sum(wire_size(topic, raw) for (topic, _), raw in zip(messages, encoded))
+    return [
+        label,
+        f"{payload_bytes / count:.1f}", f"{wire_bytes / count:.1f}",
+        f"{encode_seconds / count * 1e6:.2f}", f"{decode_seconds / count * 1e6:.2f}",
+        f"{count / encode_seconds / 1000:,.0f}", f"{count / decode_seconds / 1000:,.0f}",
+        mismatched,
+    ], wire_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--rate", type=float, default=50.0, help="site publish rate (msg/s) for the link estimate")
+    args = parser.parse_args()
+
+    messages = make_messages(args.messages)
+    json_codec = codec_module.PayloadCodec(compact_families=())
+    compact_codec = codec_module.PayloadCodec(compact_families=FAMILIES)
+    encoder = "orjson" if codec_module.orjson is not None else "json"
+
+    rows, wire = [], {}
+    for label, encode in (
+        ("JSON, json.dumps (legacy)", lambda topic, payload: json.dumps(payload).encode()),
+        (f"JSON, PayloadCodec ({encoder})", json_codec.encode),
+        (f"compact, PayloadCodec ({','.join(FAMILIES)})", compact_codec.encode),
+    ):
+        row, wire[label] = run(label, encode, messages)
+        rows.append(row)
+
+    print(f"{args.messages} messages (70% environment float, 20% switch bool, 10% current int)")
+    print(tabulate(rows, headers=["Format", "Payload B/msg", "Wire B/msg", "Encode µs/msg", "Decode µs/msg",
+                                  "Encode kmsg/s", "Decode kmsg/s", "Mismatched"], tablefmt="grid"))
+
+    print(f"\nLink estimate at {args.rate:g} msg/s")
+    print(tabulate([[label, f"{total / args.messages * args.rate * 86400 / 1e6:.1f}"] for label, total in wire.items()],
+                   headers=["Format", "MB/day"], tablefmt="grid"))
+    print(f"\ncompact codec: {compact_codec.report()}")
+
+
+if __name__ == "__main__":
+    main()
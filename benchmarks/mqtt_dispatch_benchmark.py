@@ -0,0 +1,108 @@
+"""
+Per-callback parsing (MQTTMessage.from_message + TopicType + dataclasses in
+every subscriber) vs the central MessageDispatcher that parses once.
+
+Replays a mix of environment/switch messages for N automations; switch
+messages also reach the current monitor's "switch/#" subscription, so the
+old path parsed them twice.
+
+Usage:
+    python benchmarks/mqtt_dispatch_benchmark.py --automations 200 --messages 50000
+"""
+
+import argparse
+import json
+import random
+import time
+import types
+
+from _fakes import install_fake_resources, load_source
+from tabulate import tabulate
+
+install_fake_resources()
+
+from models.automation.models import MQTTMessage, MQTTPayloadData, SwitchMessage, TopicType  # noqa: E402
+from utils.metrics import LatencyRecorder  # noqa: E402
+
+
+def legacy_callback(name):
+    """BaseAutomation._on_mqtt_message + _handle_*_message before the dispatcher."""
+    def callback(client, userdata, message):
+        mqtt_message = MQTTMessage.from_message(message)
+        topic_type = TopicType.from_topic(mqtt_message.topic)
+        if not topic_type:
+            return
+        payload_data = MQTTPayloadData(
+            pattern=mqtt_message.topic,
+            data=SwitchMessage(name=mqtt_message.topic_parts[1], value=mqtt_message.payload['data']['value'])
+        )
+        if payload_data.data.name == name:
+            float(payload_data.data.value)
+    return callback
+
+
+def legacy_monitor_callback(client, userdata, message):
+    """CurrentMonitorManager switch/# callback (parsed the payload again)."""
+    payload = json.loads(message.payload)
+    payload.get('data', {}).get('value')
+
+
+def run(deliver, messages):
+    latency = LatencyRecorder(size=len(messages))
+    started = time.perf_counter()
+    for message in messages:
+        t0 = time.perf_counter()
+        deliver(message)
+        latency.record(time.perf_counter() - t0)
+    return time.perf_counter() - started, latency
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--automations", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=50000)
+    args = parser.parse_args()
+
+    mqtt_module = load_source("bench_resources_mqtt", "resources/mqtt.py")
+    names = [f"sensor-{i}" for i in range(args.automations)]
+    messages = []
+    for _ in range(args.messages):
+        kind = "environment" if random.random() < 0.8 else "switch"
+        payload = json.dumps({"pattern": "", "data": {"name": "", "value": round(random.uniform(10, 30), 2)}})
+        messages.append(types.SimpleNamespace(topic=f"{kind}/{random.choice(names)}", payload=payload.encode()))
+
+    # 이전 방식: 토픽마다 message_callback_add, 콜백마다 파싱
+    callbacks = {}
+    for name in names:
+        for kind in ("automation", "environment", "switch"):
+            callbacks[f"{kind}/{name}"] = legacy_callback(name)
+
+    def legacy_deliver(message):
+        callbacks[message.topic](None, None, message)
+        if message.topic.startswith("switch/"):
+            legacy_monitor_callback(None, None, message)
+
+    # 디스패처: 한 번 파싱해서 관심 있는 핸들러에만 전달
+    dispatcher = mqtt_module.MessageDispatcher()
+    for name in names:
+        dispatcher.add(f"environment/{name}", lambda message: float(message.value))
+        dispatcher.add(f"switch/{name}", lambda message: bool(message.value))
+    dispatcher.add("switch/#", lambda message: message.value)
+
+    rows = []
+    for label, deliver in (
+        ("per-callback parse (before)", legacy_deliver),
+        ("MessageDispatcher (after)", lambda message: dispatcher.on_message(None, None, message)),
+    ):
+        elapsed, latency = run(deliver, messages)
+        p = latency.percentiles((50, 99))
+        rows.append([
+            label, f"{len(messages) / elapsed:,.0f}",
+            f"{p[50] * 1e6:.1f}", f"{p[99] * 1e6:.1f}"
+        ])
+
+    print(tabulate(rows, headers=["Path", "msgs/s", "p50 (us)", "p99 (us)"], tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+Broker restart scenario: publishes lost while disconnected vs the outbox.
+
+A local mosquitto stand-in (this file run with --serve: a minimal MQTT 3.1.1
+broker that records every PUBLISH it receives) is started, SIGKILLed in the
+middle of a run and restarted on the same port. Meanwhile switch automations
+keep sending commands and the nutrient loop keeps publishing sensor batches
+through the real resources.mqtt.MQTTClient (paho-mqtt required).
+
+- drop when disconnected (before): publish_message returned False while
+  `connected` was False, so commands sent during the outage were lost
+- outbox (after): the latest message per topic is kept and replayed in
+  order from on_connect
+
+Commands stop when the broker comes back, so the last command of a topic is
+often one issued during the outage. Reported: commands issued during the
+outage, topics whose last value at the broker differs from the last value
+the automations sent (the state divergence CurrentMonitorManager would only
+catch later), whether the replay after reconnect arrives in the order each
+topic was last written, and the time from reconnect until the broker holds
+the final state of every topic.
+
+Exits non-zero unless the outbox mode ends with 0 diverged topics and a
+replay in last-write order.
+
+Usage:
+    python benchmarks/mqtt_outbox_scenario.py --devices 8 --kill-at 2 --outage 3
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import random
+import signal
+import socket
+import struct
+import itertools
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from _fakes import install_fake_resources
+from tabulate import tabulate
+
+os.environ.setdefault("LOG_LEVEL", "warning")
+
+
+# --- mosquitto stand-in ------------------------------------------------------
+
+async def _read_packet(reader):
+    header = await reader.readexactly(1)
+    multiplier, length = 1, 0
+    while True:
+        byte = (await reader.readexactly(1))[0]
+        length += (byte & 0x7F) * multiplier
+        if not byte & 0x80:
+            break
+        multiplier *= 128
+    return header[0], await reader.readexactly(length) if length else b""
+
+
+def serve(port: int, record_path: str) -> None:
+    """CONNECT/PUBLISH(QoS 0/1)/SUBSCRIBE/PINGREQ만 처리하고 수신한 PUBLISH를 기록하는 브로커"""
+    record = open(record_path, "a", buffering=1)
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                first, body = await _read_packet(reader)
+                kind = first >> 4
+                if kind == 1:  # CONNECT
+                    record.write(json.dumps({"connect": time.time()}) + "\n")
+                    writer.write(b"\x20\x02\x00\x00")
+                elif kind == 3:  # PUBLISH
+                    qos = (first >> 1) & 3
+                    topic_length = struct.unpack("!H", body[:2])[0]
+                    topic = body[2:2 + topic_length].decode()
+                    offset = 2 + topic_length
+                    if qos:
+                        writer.write(b"\x40\x02" + body[offset:offset + 2])
+                        offset += 2
+                    record.write(json.dumps({"topic": topic, "payload": body[offset:].decode(), "at": time.time()}) + "\n")
+                elif kind == 8:  # SUBSCRIBE
+                    filters, offset = 0, 2
+                    while offset < len(body):
+                        offset += 2 + struct.unpack("!H", body[offset:offset + 2])[0] + 1
+                        filters += 1
+                    writer.write(bytes([0x90, 2 + filters]) + body[:2] + b"\x00" * filters)
+                elif kind == 12:  # PINGREQ
+                    writer.write(b"\xd0\x00")
+                elif kind == 14:  # DISCONNECT
+                    break
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        writer.close()
+
+    async def main():
+        server = await asyncio.start_server(handle, "127.0.0.1", port, reuse_address=True)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
+
+
+class StandInBroker:
+    """--serve 모드로 자기 자신을 실행하는 브로커 프로세스"""
+
+    def __init__(self, port: int, record_path: str) -> None:
+        self.port = port
+        self.record_path = record_path
+        self.process = None
+
+    def start(self) -> None:
+        self.process = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--serve", str(self.port), "--record", self.record_path]
+        )
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            try:
+                socket.create_connection(("127.0.0.1", self.port), timeout=0.2).close()
+                return
+            except OSError:
+                time.sleep(0.05)
+        raise RuntimeError("stand-in broker did not start")
+
+    def kill(self) -> None:
+        self.process.send_signal(signal.SIGKILL)
+        self.process.wait()
+
+    def stop(self) -> None:
+        self.process.terminate()
+        self.process.wait()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# --- scenario ------------------------------------------------------------------
+
+def run(mode: str, args, mqtt_module):
+    port = free_port()
+    record_path = tempfile.mktemp(suffix=".jsonl")
+    broker = StandInBroker(port, record_path)
+    broker.start()
+    try:
+        return _run_against(broker, mode, args, mqtt_module)
+    finally:
+        if broker.process.poll() is None:
+            broker.stop()
+        if os.path.exists(record_path):
+            os.unlink(record_path)
+
+
+def _run_against(broker: StandInBroker, mode: str, args, mqtt_module):
+    port, record_path = broker.port, broker.record_path
+    client = mqtt_module.MQTTClient(host="127.0.0.1", port=port, client_id=f"outbox-{mode}")
+    client.connection.min_delay, client.connection.max_delay = 0.2, 0.5
+    client.publisher.start()
+    client.start()
+    client.wait_until_connected(5)
+
+    if mode == "drop":
+        def publish(topic, payload):
+            # 이전 publish_message: 연결되지 않았으면 버림
+            if not client.connected:
+                return False
+            return client.client.publish(topic, json.dumps(payload)).rc == 0
+    else:
+        publish = client.publish_message
+
+    last_value, last_write, lock, outage = {}, {}, threading.Lock(), {"issued": 0, "refused": 0}
+    sequence = itertools.count()
+    broker_down = threading.Event()
+    stop = threading.Event()
+
+    def command(topic, payload, value):
+        with lock:
+            # 발행과 기록을 같은 잠금 안에서 해서 토픽별 마지막 작성 순서를 정확히 남김
+            accepted = publish(topic, payload)
+            # 자동화는 발행 결과와 무관하게 상태를 바꾼 것으로 간주 (BaseAutomation.send_mqtt_message)
+            last_value[topic] = value
+            last_write[topic] = next(sequence)
+            if broker_down.is_set():
+                outage["issued"] += 1
+                outage["refused"] += not accepted
+
+    def automation(index: int) -> None:
+        rng = random.Random(index)
+        topic = f"switch/device{index}"
+        while not stop.wait(rng.uniform(0.2, 0.6)):
+            value = rng.random() < 0.5
+            command(topic, {"pattern": topic, "data": {"name": f"device{index}", "value": value}}, value)
+
+    def sensors() -> None:
+        rng = random.Random(0)
+        while not stop.wait(0.5):
+            for name in ("ph", "ec", "water_temperature"):
+                value = round(rng.uniform(5, 30), 2)
+                topic = f"environment/{name}"
+                command(topic, {"pattern": topic, "data": {"name": name, "value": value}}, value)
+
+    threads = [threading.Thread(target=automation, args=(i,)) for i in range(args.devices)]
+    threads.append(threading.Thread(target=sensors))
+    for thread in threads:
+        thread.start()
+
+    time.sleep(args.kill_at)
+    broker_down.set()
+    broker.kill()
+    time.sleep(args.outage)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    broker.start()
+
+    # 재연결 후 outbox와 발행 큐가 비워질 때까지 대기
+    deadline = time.time() + 10
+    while time.time() < deadline and (not client.connected or client.publisher.outbox or client.publisher.depth):
+        time.sleep(0.05)
+    time.sleep(args.settle)
+    client.disconnect()
+
+    with open(record_path) as file:
+        records = [json.loads(line) for line in file]
+    reconnected_at = max(record["connect"] for record in records if "connect" in record)
+    received, arrived, replayed = {}, {}, []
+    for record in records:
+        if "topic" in record:
+            value = json.loads(record["payload"])["data"]["value"]
+            received[record["topic"]] = value
+            arrived[(record["topic"], json.dumps(value))] = record["at"]
+            if record["at"] >= reconnected_at:
+                replayed.append(record["topic"])
+    diverged = sum(received.get(topic) != value for topic, value in last_value.items())
+    restored = [arrived[(topic, json.dumps(value))] - reconnected_at
+                for topic, value in last_value.items() if received.get(topic) == value]
+    restore_ms = f"{max(0.0, max(restored)) * 1000:.0f}" if restored and not diverged else "-"
+    # 재연결 후 받은 메시지(= outbox 재전송)가 토픽별 마지막 작성 순서와 같은지
+    in_order = bool(replayed) and replayed == sorted(set(replayed), key=last_write.__getitem__)
+    row = [outage["issued"], outage["refused"], len(last_value), diverged,
+           ("yes" if in_order else "no") if replayed else "-", restore_ms]
+    return row, client.publisher, diverged, in_order
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--serve", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--record", help=argparse.SUPPRESS)
+    parser.add_argument("--devices", type=int, default=8)
+    parser.add_argument("--kill-at", type=float, default=2.0)
+    parser.add_argument("--outage", type=float, default=3.0)
+    parser.add_argument("--settle", type=float, default=1.0, help="wait after reconnect before comparing")
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.record)
+        return
+
+    install_fake_resources()
+    mqtt_module = importlib.import_module("resources.mqtt")  # 실제 MQTTClient (paho 사용)
+
+    rows, publisher, failures = [], None, []
+    for label, mode in (("drop when disconnected (before)", "drop"), ("outbox (after)", "outbox")):
+        row, used, diverged, in_order = run(mode, args, mqtt_module)
+        rows.append([label] + row)
+        publisher = used
+        if mode == "outbox":
+            if diverged:
+                failures.append(f"outbox: {diverged} topics diverged after reconnect")
+            if not in_order:
+                failures.append("outbox: replay after reconnect is not in last-write order")
+
+    print(f"{args.devices} switch devices + sensors, broker SIGKILLed at {args.kill_at:g}s for {args.outage:g}s")
+    print(tabulate(rows, headers=["Mode", "Published during outage", "Refused", "Topics",
+                                  "Diverged topics at broker", "Replay in last-write order",
+                                  "State restored after reconnect (ms)"],
+                   tablefmt="grid"))
+    print(f"\noutbox: {publisher.outbox.report()}")
+
+    if failures:
+        print("\nFAIL: " + "\nFAIL: ".join(failures))
+        sys.exit(1)
+    print("\nOK: outbox restored every topic, replayed in last-write order")
+
+
+if __name__ == "__main__":
+    main()
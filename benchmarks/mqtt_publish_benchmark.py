@@ -0,0 +1,252 @@
+"""
+Inline publish_message (json.dumps + client.publish on the caller's thread)
+vs the MQTTPublisher queue.
+
+Several automation threads send bursts of switch commands (a relay flapping
+ON/OFF before settling) while a sensor loop publishes pH/EC/temperature
+batches. The fake paho client holds a socket lock for --write-ms per packet
+and a fake broker acknowledges QoS 1 messages after --rtt-ms.
+
+Reported per mode: time the caller is blocked inside publish, packets sent
+to the broker, whether every switch topic ended at its last commanded
+state, end-to-end ack latency (call to PUBACK) and the peak number of
+unacknowledged messages.
+
+Usage:
+    python benchmarks/mqtt_publish_benchmark.py --devices 10 --seconds 5 --qos 1
+"""
+
+import argparse
+import heapq
+import json
+import os
+import random
+import threading
+import time
+
+from _fakes import load_source
+from tabulate import tabulate
+
+os.environ.setdefault("LOG_LEVEL", "warning")
+
+publisher_module = load_source("bench_resources_mqtt_publisher", "resources/mqtt_publisher.py")
+metrics = load_source("bench_utils_metrics", "utils/metrics.py")
+codec_module = load_source("bench_utils_mqtt_codec", "utils/mqtt_codec.py")
+
+
+class FakeBrokerClient:
+    """paho Client stand-in: serialized socket writes and delayed PUBACKs"""
+
+    def __init__(self, write_seconds: float, rtt: float) -> None:
+        self.write_seconds = write_seconds
+        self.rtt = rtt
+        self.on_publish = None
+        self.sent = 0
+        self.last_payload = {}
+        self.unacked = 0
+        self.max_unacked = 0
+        self._mid = 0
+        self._socket = threading.Lock()
+        self._acks = []
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._broker, daemon=True)
+        self._thread.start()
+
+    def max_inflight_messages_set(self, count: int) -> None:
+        pass
+
+    def publish(self, topic, payload=None, qos=0, retain=False):
+        with self._socket:
+            time.sleep(self.write_seconds)
+            self._mid += 1
+            mid = self._mid
+            self.sent += 1
+            self.last_payload[topic] = payload
+        with self._cond:
+            if qos > 0:
+                self.unacked += 1
+                self.max_unacked = max(self.max_unacked, self.unacked)
+                heapq.heappush(self._acks, (time.perf_counter() + self.rtt, mid))
+                self._cond.notify()
+        return type("Info", (), {"rc": 0, "mid": mid})()
+
+    def _broker(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopping and (not self._acks or self._acks[0][0] > time.perf_counter()):
+                    self._cond.wait(max(0.0, self._acks[0][0] - time.perf_counter()) if self._acks else None)
+                if self._stopping and not self._acks:
+                    return
+                _, mid = heapq.heappop(self._acks)
+                self.unacked -= 1
+            if self.on_publish:
+                self.on_publish(self, None, mid)
+
+    def close(self) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        self._thread.join()
+
+
+class InlinePublisher:
+    """이전 MQTTClient.publish_message: 호출 스레드에서 직렬화 + 전송"""
+
+    def __init__(self, client: FakeBrokerClient) -> None:
+        self.client = client
+        self.ack_latency = metrics.LatencyRecorder(size=100_000)
+        self._started = {}
+        self._lock = threading.Lock()
+        client.on_publish = self.on_publish
+
+    def publish(self, topic, payload, qos=0, coalesce=False) -> bool:
+        started = time.perf_counter()
+        info = self.client.publish(topic, json.dumps(payload), qos=qos)
+        if qos > 0:
+            with self._lock:
+                self._started[info.mid] = started
+        return True
+
+    def publish_many(self, messages, qos=0) -> int:
+        return sum(self.publish(topic, payload, qos) for topic, payload in messages)
+
+    def on_publish(self, client, userdata, mid) -> None:
+        now = time.perf_counter()
+        # PUBACK가 등록보다 먼저 올 수 있으므로 잠시 대기
+        for _ in range(1000):
+            with self._lock:
+                started = self._started.pop(mid, None)
+            if started is not None:
+                self.ack_latency.record(now - started)
+                return
+            time.sleep(0.0001)
+
+
+def run(mode: str, args):
+    client = FakeBrokerClient(args.write_ms / 1000, args.rtt_ms / 1000)
+    if mode == "inline":
+        publisher = InlinePublisher(client)
+    else:
+        publisher = publisher_module.MQTTPublisher(
+            client, queue_size=10_000, max_in_flight=args.max_in_flight, coalesce_window=args.window_ms / 1000
+        )
+        client.on_publish = publisher.on_publish
+        publisher.start()
+
+    blocked = metrics.LatencyRecorder(size=200_000)
+    commanded = {}
+    stop = threading.Event()
+    requested = [0]
+    lock = threading.Lock()
+
+    def automation(index: int) -> None:
+        rng = random.Random(index)
+        topic = f"switch/device{index}"
+        while not stop.is_set():
+            # 릴레이가 몇 번 흔들린 뒤 최종 상태로 안정되는 명령 묶음
+            for value in [rng.random() < 0.5 for _ in range(rng.randint(1, 4))]:
+                payload = {"pattern": topic, "data": {"name": f"device{index}", "value": value}}
+                started = time.perf_counter()
+                publisher.publish(topic, payload, qos=args.qos, coalesce=True)
+                blocked.record(time.perf_counter() - started)
+                with lock:
+                    commanded[topic] = value
+                    requested[0] += 1
+                time.sleep(0.005)
+            stop.wait(rng.uniform(0.1, 0.3))
+
+    def sensors() -> None:
+        rng = random.Random(0)
+        while not stop.is_set():
+            batch = [(f"environment/{name}", {"pattern": f"environment/{name}",
+                                              "data": {"name": name, "value": round(rng.uniform(5, 30), 2)}})
+                     for name in ("ph", "ec", "water_temperature")]
+            started = time.perf_counter()
+            publisher.publish_many(batch, qos=args.qos)
+            blocked.record(time.perf_counter() - started)
+            with lock:
+                requested[0] += len(batch)
+            stop.wait(0.02)
+
+    threads = [threading.Thread(target=automation, args=(i,)) for i in range(args.devices)]
+    threads.append(threading.Thread(target=sensors))
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    if mode != "inline":
+        publisher.stop()
+    time.sleep(args.rtt_ms / 1000 * 2 + 0.05)
+    client.close()
+
+    wrong = sum(
+        json.loads(client.last_payload[topic])["data"]["value"] != value for topic, value in commanded.items()
+    )
+    blocked_p = blocked.percentiles((50, 99))
+    ack_p = publisher.ack_latency.percentiles((50, 99))
+    return [
+        requested[0], client.sent, wrong,
+        f"{blocked_p[50] * 1e6:.0f}", f"{blocked_p[99] * 1e6:.0f}",
+        f"{ack_p[50] * 1000:.1f}" if ack_p else "-", f"{ack_p[99] * 1000:.1f}" if ack_p else "-",
+        client.max_unacked,
+    ], publisher
+
+
+def bench_encode(count: int):
+    payload = {"pattern": "environment/ph", "data": {"name": "ph", "value": 6.12}}
+    begin = time.perf_counter()
+    for _ in range(count):
+        json.dumps(payload).encode()
+    legacy = time.perf_counter() - begin
+    begin = time.perf_counter()
+    for _ in range(count):
+        codec_module.encode_payload(payload)
+    current = time.perf_counter() - begin
+    encoder = "orjson" if codec_module.orjson is not None else "json (compact)"
+    return [
+        ["json.dumps (before)", f"{legacy / count * 1e6:.2f}", "1.00x"],
+        [f"encode_payload ({encoder})", f"{current / count * 1e6:.2f}", f"{legacy / current:.2f}x"],
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--devices", type=int, default=10)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--qos", type=int, default=1)
+    parser.add_argument("--write-ms", type=float, default=0.3, help="socket write time per packet")
+    parser.add_argument("--rtt-ms", type=float, default=20.0, help="broker round trip for PUBACK")
+    parser.add_argument("--max-in-flight", type=int, default=20)
+    parser.add_argument("--window-ms", type=float, default=50.0, help="switch command coalescing window")
+    parser.add_argument("--encode", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rows = []
+    publisher = None
+    for label, mode in (("inline publish_message (before)", "inline"), ("MQTTPublisher queue (after)", "queue")):
+        row, used = run(mode, args)
+        rows.append([label] + row)
+        if mode == "queue":
+            publisher = used
+
+    print(f"{args.devices} switch devices + sensor batches, {args.seconds:g}s, QoS {args.qos}, "
+          f"write {args.write_ms:g} ms, RTT {args.rtt_ms:g} ms")
+    print(tabulate(rows, headers=["Mode", "Requested", "Sent to broker", "Wrong final states",
+                                  "Caller blocked p50 (µs)", "Caller blocked p99 (µs)",
+                                  "Ack p50 (ms)", "Ack p99 (ms)", "Peak unacked"], tablefmt="grid"))
+
+    print("\nPer-topic publish rates (queue)")
+    rates = sorted(publisher.topic_rates().items(), key=lambda item: item[1], reverse=True)[:6]
+    print(tabulate([[topic, publisher.rates[topic].count, publisher.rates[topic].coalesced, f"{rate * 60:.1f}"]
+                    for topic, rate in rates],
+                   headers=["Topic", "Sent", "Coalesced", "Rate (/min, 60 s EWMA)"], tablefmt="grid"))
+
+    print(f"\nPayload encoding ({args.encode} messages)")
+    print(tabulate(bench_encode(args.encode), headers=["Encoder", "µs / message", "Speedup"], tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Time the paho network thread spends inside on_message: handlers run inline
+vs handed to the dispatcher's keyed worker queue.
+
+A slow handler (simulated control() + publish + disk log) blocks the network
+loop for its full duration when run inline; with the queue the callback only
+enqueues and stale readings for the same topic are coalesced.
+
+Usage:
+    python benchmarks/mqtt_queue_benchmark.py --devices 20 --messages 5000 --handler-ms 5
+"""
+
+import argparse
+import json
+import random
+import time
+import types
+
+from _fakes import install_fake_resources, load_source
+from tabulate import tabulate
+
+install_fake_resources()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--devices", type=int, default=20)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--handler-ms", type=float, default=5.0, help="simulated handler duration")
+    parser.add_argument("--rate", type=float, default=2000, help="incoming messages per second")
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    mqtt_module = load_source("bench_resources_mqtt", "resources/mqtt.py")
+    metrics = load_source("bench_utils_metrics", "utils/metrics.py")
+    names = [f"sensor-{i}" for i in range(args.devices)]
+    messages = [
+        types.SimpleNamespace(
+            topic=f"environment/{random.choice(names)}",
+            payload=json.dumps({"data": {"value": random.uniform(10, 30)}}).encode()
+        )
+        for _ in range(args.messages)
+    ]
+
+    rows = []
+    for label, queued in (("inline handlers (before)", False), ("keyed worker queue (after)", True)):
+        dispatcher = mqtt_module.MessageDispatcher(workers=args.workers, queue_size=1000)
+        handled = [0]
+
+        def handler(message):
+            time.sleep(args.handler_ms / 1000)
+            handled[0] += 1
+
+        for name in names:
+            dispatcher.add(f"environment/{name}", handler)
+        if queued:
+            dispatcher.start()
+
+        callback = metrics.LatencyRecorder(size=len(messages))
+        interval = 1 / args.rate
+        started = time.perf_counter()
+        for index, message in enumerate(messages):
+            # 브로커가 일정한 속도로 보내는 것처럼 도착 시각을 맞춤
+            delay = started + index * interval - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            t0 = time.perf_counter()
+            dispatcher.on_message(None, None, message)
+            callback.record(time.perf_counter() - t0)
+        network_seconds = time.perf_counter() - started
+        dispatcher.stop()
+
+        p = callback.percentiles((50, 99))
+        rows.append([
+            label, f"{p[50] * 1e3:.3f}", f"{p[99] * 1e3:.3f}", f"{callback.max * 1e3:.1f}",
+            f"{network_seconds:.1f}", handled[0], dispatcher.queue.coalesced, dispatcher.queue.max_depth
+        ])
+
+    print(f"{args.messages} messages at {args.rate:.0f}/s, {args.devices} topics, handler {args.handler_ms} ms")
+    print(tabulate(rows, headers=[
+        "Mode", "on_message p50 (ms)", "p99 (ms)", "max (ms)", "loop busy (s)", "handled", "coalesced", "max depth"
+    ], tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Recovery after broker outages: paho loop_start() defaults vs MQTTConnectionManager.
+
+A fleet of --clients controllers is connected to the mosquitto stand-in from
+mqtt_outbox_scenario.py. The broker is SIGKILLed for each --outages
+duration and restarted; recovery is the time from the broker restart until a
+client has its SUBACK back (it receives sensor messages again, i.e. full
+control). The broker also records CONNECT packets, so the peak number of
+connects within 100 ms shows how synchronized the fleet's retries are.
+
+- paho defaults (before): loop_start() with reconnect_delay 1 s doubling to
+  120 s, no jitter
+- connection manager (after): immediate first retry, then
+  MQTT_RECONNECT_MIN_DELAY doubling to MQTT_RECONNECT_MAX_DELAY with
+  MQTT_RECONNECT_JITTER
+
+Usage:
+    python benchmarks/mqtt_reconnect_benchmark.py --clients 20 --outages 1 4 10
+"""
+
+import argparse
+import importlib
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from _fakes import install_fake_resources
+from mqtt_outbox_scenario import StandInBroker, free_port
+from tabulate import tabulate
+
+os.environ.setdefault("LOG_LEVEL", "error")
+install_fake_resources()
+mqtt_module = importlib.import_module("resources.mqtt")
+paho = importlib.import_module("paho.mqtt.client")
+
+
+class LegacyClient:
+    """이전 방식: paho loop_start() 자동 재연결 + on_connect에서 구독"""
+
+    def __init__(self, index: int, port: int, subscribed) -> None:
+        self.client = paho.Client(client_id=f"legacy-{index}")
+        self.client.on_connect = lambda client, userdata, flags, rc: client.subscribe([("environment/#", 0)])
+        self.client.on_subscribe = lambda client, userdata, mid, *args: subscribed(self)
+        self.client.connect("127.0.0.1", port, keepalive=60)
+        self.client.loop_start()
+
+    def close(self) -> None:
+        self.client.loop_stop()
+        self.client.disconnect()
+
+
+class ManagedClient:
+    """현재 방식: MQTTClient + MQTTConnectionManager"""
+
+    def __init__(self, index: int, port: int, subscribed) -> None:
+        self.mqtt = mqtt_module.MQTTClient(host="127.0.0.1", port=port, client_id=f"managed-{index}")
+        on_subscribed = self.mqtt.connection.on_subscribed
+
+        def hook():
+            on_subscribed()
+            subscribed(self)
+
+        self.mqtt.connection.on_subscribed = hook
+        self.mqtt.start()
+
+    def close(self) -> None:
+        self.mqtt.disconnect()
+
+
+def run(cls, args):
+    port = free_port()
+    record_path = tempfile.mktemp(suffix=".jsonl")
+    broker = StandInBroker(port, record_path)
+    broker.start()
+    lock = threading.Condition()
+    subscribed_at = {}
+
+    def subscribed(client) -> None:
+        with lock:
+            subscribed_at[id(client)] = time.time()
+            lock.notify_all()
+
+    def wait_all(since: float, timeout: float) -> bool:
+        deadline = time.time() + timeout
+        with lock:
+            while sum(at >= since for at in subscribed_at.values()) < args.clients:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                lock.wait(remaining)
+        return True
+
+    clients = []
+    rows = []
+    try:
+        started = time.time()
+        clients = [cls(index, port, subscribed) for index in range(args.clients)]
+        wait_all(started, 10)
+        for outage in args.outages:
+            time.sleep(0.5)
+            broker.kill()
+            time.sleep(outage)
+            restarted = time.time()
+            broker.start()
+            complete = wait_all(restarted, args.timeout)
+            with lock:
+                recovery = sorted(at - restarted for at in subscribed_at.values() if at >= restarted)
+            with open(record_path) as file:
+                connects = [json.loads(line)["connect"] for line in file if '"connect"' in line]
+            connects = sorted(t for t in connects if t >= restarted)
+            peak = max((sum(1 for t in connects if start <= t < start + 0.1) for start in connects), default=0)
+            rows.append([
+                f"{outage:g}",
+                f"{len(recovery)}/{args.clients}" + ("" if complete else " (timeout)"),
+                f"{statistics.median(recovery):.2f}" if recovery else "-",
+                f"{recovery[-1]:.2f}" if recovery else "-",
+                peak,
+            ])
+    finally:
+        for client in clients:
+            client.close()
+        broker.stop()
+        os.unlink(record_path)
+    return rows, clients
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--outages", type=float, nargs="+", default=[1.0, 4.0, 10.0], help="outage lengths (s)")
+    parser.add_argument("--timeout", type=float, default=150.0, help="max wait for recovery per outage (s)")
+    args = parser.parse_args()
+
+    rows = []
+    managed = None
+    for label, cls in (("paho defaults (before)", LegacyClient), ("connection manager (after)", ManagedClient)):
+        mode_rows, clients = run(cls, args)
+        rows.extend([label] + row for row in mode_rows)
+        if cls is ManagedClient:
+            managed = clients[0].mqtt.connection
+
+    print(f"{args.clients} clients, broker outages {', '.join(f'{o:g}s' for o in args.outages)}")
+    print(tabulate(rows, headers=["Mode", "Outage (s)", "Recovered", "Recovery p50 (s)", "Recovery max (s)",
+                                  "Peak CONNECTs / 100 ms"], tablefmt="grid"))
+    print(f"\nclient 0: {managed.report()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Shared LED photoperiod service vs per-automation time-string checks.
+
+1. Cost of one "is the LED on" check: the removed led_time_utils.is_led_on
+   (datetime.now().strftime('%H:%M') + string comparisons on every call) vs
+   photoperiod.is_on() (cached phase) and photoperiod.effective_target().
+2. Correctness over one day at 1 s resolution for API-style "HH:MM:SS"
+   times: comparing '%H:%M' strings with "06:00:00" is off for a minute at
+   each edge.
+3. Consistency after an LED settings change over MQTT: N Target automations
+   that each kept a led_time_range copy vs the shared service fed by the LED
+   Range automation.
+4. Edge publication: the service runs on the AutomationScheduler and pushes
+   each LED edge to subscribers; reports the delay from edge to callback.
+
+Usage:
+    python benchmarks/photoperiod_benchmark.py --calls 200000 --automations 50
+"""
+
+import argparse
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+from _fakes import install_fake_resources
+from tabulate import tabulate
+
+os.environ.setdefault("LOG_LEVEL", "warning")
+install_fake_resources()
+
+from managers.automation_scheduler import AutomationScheduler  # noqa: E402
+from models.Machine import BaseMachine  # noqa: E402
+from models.automation import RangeAutomation, TargetAutomation  # noqa: E402
+from utils.photoperiod import PhotoperiodService, photoperiod  # noqa: E402
+from utils.schedule import Schedule  # noqa: E402
+
+
+def legacy_is_led_on(led_time_range) -> bool:
+    """이전 utils.led_time_utils.is_led_on"""
+    if not led_time_range or not led_time_range.get('active'):
+        return False
+    current_time = datetime.now().strftime('%H:%M')
+    start_time = led_time_range.get('start_time')
+    end_time = led_time_range.get('end_time')
+    if not start_time or not end_time:
+        return False
+    if start_time <= end_time:
+        return start_time <= current_time < end_time
+    return current_time >= start_time or current_time < end_time
+
+
+def legacy_is_led_on_at(led_time_range, wall: datetime) -> bool:
+    current_time = wall.strftime('%H:%M')
+    start_time, end_time = led_time_range['start_time'], led_time_range['end_time']
+    if start_time <= end_time:
+        return start_time <= current_time < end_time
+    return current_time >= start_time or current_time < end_time
+
+
+class FakeStore:
+    def __init__(self, led_settings: dict) -> None:
+        self.led_settings = led_settings
+
+    def get_machine(self, machine_id):
+        return None
+
+    def get_machine_by_name(self, name):
+        return BaseMachine(machine_id=1, name="led", pin=1, status=0) if name == "led" else None
+
+    def get_automation_by_device_name(self, name):
+        return self.led_settings if name == "led" else None
+
+
+def bench_calls(calls: int):
+    led_time_range = {"start_time": "06:00:00", "end_time": "18:00:00", "active": True}
+    service = PhotoperiodService()
+    service.configure(Schedule.from_settings(led_time_range), True)
+
+    begin = time.perf_counter()
+    for _ in range(calls):
+        legacy_is_led_on(led_time_range)
+    legacy = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    for _ in range(calls):
+        service.is_on()
+    cached = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    for _ in range(calls):
+        service.effective_target(25.0)
+    target = time.perf_counter() - begin
+
+    return [
+        ["is_led_on (before)", f"{legacy / calls * 1e6:.2f}", "1.00x"],
+        ["photoperiod.is_on()", f"{cached / calls * 1e6:.3f}", f"{legacy / cached:.1f}x"],
+        ["photoperiod.effective_target()", f"{target / calls * 1e6:.3f}", f"{legacy / target:.1f}x"],
+    ]
+
+
+def check_day():
+    led_time_range = {"start_time": "06:00:00", "end_time": "18:00:00", "active": True}
+    schedule = Schedule.from_settings(led_time_range)
+    day = datetime(2024, 6, 3)
+    legacy_wrong = 0
+    for second in range(86400):
+        wall = day + timedelta(seconds=second)
+        expected = 6 * 3600 <= second < 18 * 3600
+        legacy_wrong += legacy_is_led_on_at(led_time_range, wall) != expected
+        assert schedule.is_on(wall) == expected
+    return [["is_led_on (before)", legacy_wrong], ["Schedule / photoperiod", 0]]
+
+
+def check_consistency(count: int):
+    # 변경 전에는 지금 LED ON, 변경 후에는 LED OFF가 되도록 현재 시각 기준으로 설정
+    now = datetime.now()
+    old = {"start_time": (now - timedelta(hours=1)).strftime("%H:%M"),
+           "end_time": (now + timedelta(hours=1)).strftime("%H:%M"), "active": True}
+    new = {"start_time": (now + timedelta(hours=2)).strftime("%H:%M"),
+           "end_time": (now + timedelta(hours=3)).strftime("%H:%M"), "active": True}
+    store = FakeStore(old)
+    photoperiod.load(store)
+
+    led = RangeAutomation(1, "range", True, old["start_time"], old["end_time"], None)
+    led.update_device_status = lambda status: setattr(led, "status", status)
+    led.set_machine(BaseMachine(machine_id=1, name="led", pin=1, status=0))
+
+    targets, copies, pushes = [], [], [0]
+    for index in range(count):
+        automation = TargetAutomation(100 + index, "target", True, 25.0, 0.5)
+        automation.set_machine(BaseMachine(machine_id=100 + index, name=f"zone{index}", pin=index, status=0))
+        automation._load_control_devices(store)
+        automation.value = 24.0
+        automation.reschedule_callback = lambda name, due_at: pushes.__setitem__(0, pushes[0] + 1)
+        targets.append(automation)
+        copies.append(dict(old))  # 이전 방식: 자동화마다 load_led_time_range 결과를 보관
+
+    # LED 설정 변경 (MQTT automation/led 메시지와 같은 경로)
+    led.apply_settings({"active": True, **new})
+    expected = 25.0 - photoperiod.off_target_offset
+    stale_copies = sum(
+        (25.0 if legacy_is_led_on(copy) else 20.0) != expected for copy in copies
+    )
+    stale_shared = sum(photoperiod.effective_target(automation.target) != expected for automation in targets)
+    return [
+        ["per-automation copies (before)", count, stale_copies, 0],
+        ["shared photoperiod", count, stale_shared, pushes[0]],
+    ]
+
+
+def check_edges(edges: int):
+    service = PhotoperiodService()
+    received = []
+    done = threading.Event()
+
+    def on_change(led_on: bool) -> None:
+        received.append((time.time(), led_on))
+        if len(received) > edges:
+            done.set()
+
+    service.subscribe(on_change)
+    # 1초 간격으로 ON/OFF가 바뀌는 창 (초 단위 설정)
+    start = datetime.now().replace(microsecond=0) + timedelta(seconds=2)
+    windows = [{"start": (start + timedelta(seconds=2 * i)).strftime("%H:%M:%S"),
+                "end": (start + timedelta(seconds=2 * i + 1)).strftime("%H:%M:%S")} for i in range(edges // 2 + 1)]
+    edge_times = sorted(
+        (start + timedelta(seconds=k)).timestamp() for k in range(2 * len(windows))
+    )
+    scheduler = AutomationScheduler(workers=2, resync_interval=60)
+    scheduler.add(service)
+    scheduler.start()
+    service.configure(Schedule.from_settings({"windows": windows}), True)
+    done.wait(edges + 5)
+    scheduler.stop()
+
+    delays = []
+    for timestamp, _ in received[1:]:  # 첫 알림은 설정 변경
+        edge = max((t for t in edge_times if t <= timestamp), default=None)
+        if edge is not None:
+            delays.append(timestamp - edge)
+    return [[len(delays), service.edges_published,
+             f"{sum(delays) / len(delays) * 1000:.1f}" if delays else "-",
+             f"{max(delays) * 1000:.1f}" if delays else "-"]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--automations", type=int, default=50)
+    parser.add_argument("--edges", type=int, default=6)
+    args = parser.parse_args()
+
+    print(f"LED check cost ({args.calls} calls)")
+    print(tabulate(bench_calls(args.calls), headers=["Call", "µs / call", "Speedup"], tablefmt="grid"))
+
+    print("\nWrong seconds over one day (LED 06:00:00-18:00:00)")
+    print(tabulate(check_day(), headers=["Check", "Wrong seconds"], tablefmt="grid"))
+
+    print("\nAfter an LED settings change over MQTT")
+    print(tabulate(check_consistency(args.automations),
+                   headers=["LED state source", "Target automations", "Stale effective targets", "Reschedules pushed"],
+                   tablefmt="grid"))
+
+    print("\nEdge publication through the scheduler")
+    print(tabulate(check_edges(args.edges),
+                   headers=["Edges received", "Edges published", "Mean delay (ms)", "Max delay (ms)"],
+                   tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
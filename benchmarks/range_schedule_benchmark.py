@@ -0,0 +1,188 @@
+"""
+Compiled Range schedule vs the previous per-tick parsing.
+
+1. Cost of answering "should be on now" + "next transition" per control()
+   tick: the old RangeAutomation re-parsed start_time/end_time and rebuilt
+   datetime.combine() objects on every call; utils.schedule.Schedule is
+   compiled once and answers from a cached segment.
+2. Correctness: random multi-window / weekday-mask schedules are checked
+   against a brute-force wall-clock reference at random instants over a year
+   (hours around DST changes excluded, where wall time is ambiguous).
+3. DST: transitions of a daily 01:30-02:30 window around the spring-forward
+   and fall-back dates of --timezone.
+
+Usage:
+    python benchmarks/range_schedule_benchmark.py --ticks 200000 --timezone America/New_York
+"""
+
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from tabulate import tabulate
+
+from _fakes import load_source
+
+schedule_module = load_source("utils.schedule", "utils/schedule.py")
+Schedule = schedule_module.Schedule
+TimeWindow = schedule_module.TimeWindow
+resolve_timezone = schedule_module.resolve_timezone
+DAY_SECONDS = schedule_module.DAY_SECONDS
+
+
+def legacy_tick(start_time: str, end_time: str, now: datetime):
+    """이전 RangeAutomation.control() + next_run_time()의 계산 경로"""
+    today = now.date()
+    start_hour, start_minute = map(int, start_time.split(':'))
+    end_hour, end_minute = map(int, end_time.split(':'))
+    start = datetime.combine(today, datetime.min.time().replace(hour=start_hour, minute=start_minute))
+    end = datetime.combine(today, datetime.min.time().replace(hour=end_hour, minute=end_minute))
+    if end <= start:
+        end += timedelta(days=1)
+    if now > end:
+        start += timedelta(days=1)
+        end += timedelta(days=1)
+    should_be_on = start <= now < end
+
+    edges = []
+    for day_offset in (0, 1):
+        day = today + timedelta(days=day_offset)
+        edges.append(datetime.combine(day, datetime.min.time().replace(hour=start_hour, minute=start_minute)))
+        edges.append(datetime.combine(day, datetime.min.time().replace(hour=end_hour, minute=end_minute)))
+    return should_be_on, min((edge for edge in edges if edge > now), default=None)
+
+
+def bench_ticks(ticks: int):
+    started = datetime(2024, 3, 1, 0, 0)
+    instants = [started + timedelta(seconds=i * 5) for i in range(ticks)]
+
+    begin = time.perf_counter()
+    for now in instants:
+        legacy_tick("06:00", "18:00", now)
+    legacy = time.perf_counter() - begin
+
+    schedule = Schedule([TimeWindow(6 * 3600, 18 * 3600)])
+    begin = time.perf_counter()
+    for now in instants:
+        schedule.is_on(now)
+        schedule.next_transition(now)
+    compiled = time.perf_counter() - begin
+
+    multi = Schedule.from_settings({"windows": [
+        {"start": "05:00", "end": "09:00", "days": "mon-fri"},
+        {"start": "12:00", "end": "13:30"},
+        {"start": "20:00", "end": "02:00", "days": "fri,sat"},
+    ]})
+    begin = time.perf_counter()
+    for now in instants:
+        multi.is_on(now)
+        multi.next_transition(now)
+    multi_time = time.perf_counter() - begin
+
+    return [
+        ["per-tick parse (before)", "1", f"{legacy / ticks * 1e6:.2f}", "1.00x"],
+        ["compiled schedule", "1", f"{compiled / ticks * 1e6:.2f}", f"{legacy / compiled:.2f}x"],
+        ["compiled schedule", "3 + weekday masks", f"{multi_time / ticks * 1e6:.2f}", f"{legacy / multi_time:.2f}x"],
+    ]
+
+
+def reference_is_on(windows, tz, timestamp: float) -> bool:
+    """벽시계 기준 무차별 계산"""
+    wall = datetime.fromtimestamp(timestamp, tz).replace(tzinfo=None)
+    for window in windows:
+        length = window.end - window.start
+        if length <= 0:
+            length += DAY_SECONDS
+        for back in (0, 1):
+            day = wall.date() - timedelta(days=back)
+            if not window.days & (1 << day.weekday()):
+                continue
+            start = datetime.combine(day, datetime.min.time()) + timedelta(seconds=window.start)
+            if start <= wall < start + timedelta(seconds=length):
+                return True
+    return False
+
+
+def random_schedule(rng: random.Random):
+    windows = []
+    for _ in range(rng.randint(1, 4)):
+        start = rng.randrange(0, 96) * 900
+        end = rng.randrange(0, 96) * 900
+        days = rng.randrange(1, 128)
+        windows.append(TimeWindow(start, end, days))
+    return windows
+
+
+def near_dst(tz, timestamp: float) -> bool:
+    return (datetime.fromtimestamp(timestamp - 7200, tz).utcoffset()
+            != datetime.fromtimestamp(timestamp + 7200, tz).utcoffset())
+
+
+def check_correctness(tz, schedules: int, samples: int, seed: int):
+    rng = random.Random(seed)
+    year_start = datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()
+    checked = mismatched = transition_errors = 0
+    for _ in range(schedules):
+        windows = random_schedule(rng)
+        schedule = Schedule(windows, tz)
+        for _ in range(samples):
+            timestamp = year_start + rng.uniform(0, 366 * DAY_SECONDS)
+            if near_dst(tz, timestamp):
+                continue
+            now = datetime.fromtimestamp(timestamp, tz)
+            checked += 1
+            state = schedule.is_on(now)
+            mismatched += state != reference_is_on(windows, tz, timestamp)
+            edge = schedule.next_transition(now)
+            if edge is not None and not near_dst(tz, edge.timestamp()):
+                # 전환 직전/직후 상태가 실제로 바뀌는지 확인
+                before = reference_is_on(windows, tz, edge.timestamp() - 1)
+                after = reference_is_on(windows, tz, edge.timestamp())
+                transition_errors += before != state or after == state
+    return checked, mismatched, transition_errors
+
+
+def dst_rows(tz):
+    schedule = Schedule([TimeWindow(int(1.5 * 3600), int(2.5 * 3600))], tz)
+    rows = []
+    for year_day in range(1, 366):
+        day = date(2024, 1, 1) + timedelta(days=year_day)
+        noon = datetime.combine(day, datetime.min.time(), tz) + timedelta(hours=12)
+        previous = datetime.combine(day - timedelta(days=1), datetime.min.time(), tz) + timedelta(hours=12)
+        if noon.utcoffset() == previous.utcoffset():
+            continue
+        now = previous
+        for _ in range(2):
+            edge = schedule.next_transition(now)
+            state = schedule.is_on(edge)
+            rows.append([str(day), edge.isoformat(), "ON" if state else "OFF",
+                         datetime.fromtimestamp(edge.timestamp(), timezone.utc).strftime("%H:%M UTC")])
+            now = edge
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=200_000)
+    parser.add_argument("--timezone", default="America/New_York")
+    parser.add_argument("--schedules", type=int, default=200)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.ticks} ticks")
+    print(tabulate(bench_ticks(args.ticks), headers=["Path", "Windows", "µs / tick", "Speedup"], tablefmt="grid"))
+
+    tz = resolve_timezone(args.timezone)
+    checked, mismatched, transition_errors = check_correctness(tz, args.schedules, args.samples, args.seed)
+    print(f"\nCorrectness ({args.timezone}, {args.schedules} random schedules)")
+    print(tabulate([[checked, mismatched, transition_errors]],
+                   headers=["Instants checked", "is_on mismatches", "next_transition errors"], tablefmt="grid"))
+
+    print(f"\nDST transitions of a daily 01:30-02:30 window ({args.timezone})")
+    print(tabulate(dst_rows(tz), headers=["DST date", "Next transition", "State after", "Instant"], tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Per-key GET vs batched MGET for the current monitor's Redis reads.
+
+Usage:
+    python benchmarks/redis_batch_benchmark.py --rtt-ms 0.5 --devices 10 50 100 500
+"""
+
+import argparse
+import time
+
+from _fakes import install_fake_redis, load_source
+from tabulate import tabulate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="simulated network round-trip (ms)")
+    parser.add_argument("--devices", type=int, nargs="+", default=[10, 50, 100, 500])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    fake = install_fake_redis(rtt=args.rtt_ms / 1000)
+    redis_module = load_source("bench_resources_redis", "resources/redis.py")
+    client = redis_module.redis_client
+
+    rows = []
+    for count in args.devices:
+        names = [f"device-{i}" for i in range(count)]
+        for name in names:
+            fake.data[f"current/{name}"] = "true"
+            fake.data[f"switch/{name}"] = "false"
+        keys = [key for name in names for key in (f"current/{name}", f"switch/{name}")]
+
+        results = {}
+        for label, fetch in (
+            ("GET x2N", lambda: [client.get(key) for key in keys]),
+            ("MGET", lambda: client.get_many(keys)),
+        ):
+            fake.round_trips = 0
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                fetch()
+            elapsed = (time.perf_counter() - started) / args.repeat
+            results[label] = (fake.round_trips // args.repeat, elapsed * 1000)
+
+        rows.append([
+            count,
+            results["GET x2N"][0], f"{results['GET x2N'][1]:.2f}",
+            results["MGET"][0], f"{results['MGET'][1]:.2f}",
+        ])
+
+    print(tabulate(
+        rows,
+        headers=["Devices", "GET round trips", "GET ms/poll", "MGET round trips", "MGET ms/poll"],
+        tablefmt="grid"
+    ))
+
+
+if __name__ == "__main__":
+    main()
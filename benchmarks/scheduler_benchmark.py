@@ -0,0 +1,131 @@
+"""
+Thread-per-automation vs AutomationScheduler benchmark.
+
+Runs N dummy automations for a few seconds under both models and reports
+thread count, resident memory, Python heap usage, control() runs and wakeups.
+
+Usage:
+    python benchmarks/scheduler_benchmark.py --automations 1000 --seconds 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("API_USERNAME", "benchmark")
+os.environ.setdefault("API_PASSWORD", "benchmark")
+
+from tabulate import tabulate
+from managers.automation_scheduler import AutomationScheduler
+
+
+class DummyAutomation:
+    """control()과 next_run_time()만 흉내내는 자동화"""
+
+    def __init__(self, name: str, period: float) -> None:
+        self.name = name
+        self.period = period
+        self.runs = 0
+        self.reschedule_callback = None
+
+    def control(self) -> None:
+        self.runs += 1
+
+    def next_run_time(self, now: datetime) -> datetime:
+        return now + timedelta(seconds=self.period)
+
+
+def rss_kb() -> int:
+    """현재 프로세스의 VmRSS (kB)"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def run_threads(automations, seconds: float, poll_interval: float) -> dict:
+    """기존 방식: 자동화마다 스레드 하나, 고정 주기 폴링"""
+    stop_event = threading.Event()
+    wakeups = [0]
+
+    def loop(automation):
+        while not stop_event.is_set():
+            automation.control()
+            wakeups[0] += 1
+            stop_event.wait(poll_interval)
+
+    threads = [threading.Thread(target=loop, args=(a,), daemon=True) for a in automations]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    result = {"threads": threading.active_count(), "rss_kb": rss_kb()}
+    stop_event.set()
+    for thread in threads:
+        thread.join()
+    result["wakeups"] = wakeups[0]
+    return result
+
+
+def run_scheduler(automations, seconds: float, workers: int) -> dict:
+    """스케줄러 방식: 타이머 스레드 1개 + 고정 워커 풀"""
+    scheduler = AutomationScheduler(workers=workers, resync_interval=60)
+    for automation in automations:
+        scheduler.add(automation)
+    scheduler.start()
+    time.sleep(seconds)
+    result = {"threads": threading.active_count(), "rss_kb": rss_kb()}
+    scheduler.stop()
+    runs = sum(scheduler.get_stats(a.name).runs for a in automations)
+    result["wakeups"] = scheduler.wakeups + runs
+    lateness = max(scheduler.get_stats(a.name).max_lateness for a in automations)
+    result["max_lateness_ms"] = f"{lateness * 1000:.1f}"
+    return result
+
+
+def measure(label: str, fn, *args) -> list:
+    automations = [DummyAutomation(f"device-{i}", random.uniform(1.0, 5.0)) for i in range(ARGS.automations)]
+    baseline_rss = rss_kb()
+    tracemalloc.start()
+    result = fn(automations, *args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    runs = sum(a.runs for a in automations)
+    return [
+        label,
+        result["threads"],
+        result["rss_kb"] - baseline_rss,
+        peak // 1024,
+        runs,
+        result["wakeups"],
+        result.get("max_lateness_ms", "-"),
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--automations", type=int, default=1000)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--poll-interval", type=float, default=1.0,
+                        help="thread 모드의 고정 폴링 주기 (AUTOMATION_INTERVAL 축소판)")
+    ARGS = parser.parse_args()
+
+    rows = [
+        measure("thread-per-automation", run_threads, ARGS.seconds, ARGS.poll_interval),
+        measure("scheduler", run_scheduler, ARGS.seconds, ARGS.workers),
+    ]
+    print(tabulate(
+        rows,
+        headers=["Mode", "Threads", "RSS Δ (kB)", "tracemalloc peak (kB)", "control() runs", "Wakeups", "Max late (ms)"],
+        tablefmt="grid"
+    ))
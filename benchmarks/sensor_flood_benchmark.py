@@ -0,0 +1,118 @@
+"""
+Replay a 100 Hz environment flood into a TargetAutomation with and without
+reading coalescing (min control interval + deadband).
+
+Time is virtual: readings are stamped at the sensor rate and the trailing
+runs that the automation asks the scheduler for are executed when the
+virtual clock reaches them, so the replay finishes as fast as the CPU allows
+and the CPU time measured is the time spent handling the flood.
+
+Usage:
+    python benchmarks/sensor_flood_benchmark.py --hz 100 --seconds 60 --min-interval 1 --deadband 0.05
+"""
+
+import argparse
+import heapq
+import json
+import math
+import random
+import time
+
+from _fakes import install_fake_resources
+from tabulate import tabulate
+
+install_fake_resources()
+
+import models.automation.target as target_module  # noqa: E402
+from models.Machine import BaseMachine  # noqa: E402
+from models.automation import TargetAutomation  # noqa: E402
+from resources.mqtt import DispatchedMessage  # noqa: E402
+
+
+class Heater:
+    """Control device stand-in (TargetAutomation calls update_status on it)."""
+
+    name = "heater"
+
+    def __init__(self) -> None:
+        self.status = False
+
+    def update_status(self, status: bool) -> None:
+        self.status = status
+
+
+class VirtualClock:
+    """time.time() replacement driven by the replay loop."""
+
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+def replay(readings, hz: float, min_interval: float, deadband: float):
+    clock = VirtualClock()
+    target_module.time = clock
+
+    automation = TargetAutomation(1, "target", True, 25.0, 0.5)
+    automation.coalescer.min_interval = min_interval
+    automation.coalescer.deadband = deadband
+    due_runs = []
+    automation.reschedule_callback = lambda name, due_at=None: due_at is not None and heapq.heappush(due_runs, due_at)
+    automation.set_machine(BaseMachine(machine_id=1, name="temperature", pin=4, status=0))
+    automation.increase_device = Heater()
+
+    controls = [0]
+    original_control = automation.control
+
+    def counting_control():
+        controls[0] += 1
+        return original_control()
+
+    automation.control = counting_control
+
+    started_cpu = time.process_time()
+    for index, value in enumerate(readings):
+        clock.now += 1 / hz
+        while due_runs and due_runs[0] <= clock.now:
+            heapq.heappop(due_runs)
+            automation.control()  # 스케줄러가 실행하는 지연 제어
+        payload = json.dumps({"data": {"value": value}}).encode()
+        automation._handle_environment_message(DispatchedMessage("environment/temperature", payload, 0.0))
+    cpu = time.process_time() - started_cpu
+
+    target_module.time = time
+    return cpu, controls[0], automation.coalescer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hz", type=float, default=100)
+    parser.add_argument("--seconds", type=float, default=60)
+    parser.add_argument("--min-interval", type=float, default=1.0)
+    parser.add_argument("--deadband", type=float, default=0.05)
+    args = parser.parse_args()
+
+    count = int(args.hz * args.seconds)
+    # 천천히 변하는 온도 + 센서 노이즈
+    readings = [
+        round(24.0 + 2.0 * math.sin(i / count * 2 * math.pi) + random.gauss(0, 0.02), 3)
+        for i in range(count)
+    ]
+
+    rows = []
+    for label, min_interval, deadband in (
+        ("every reading (before)", 0.0, 0.0),
+        (f"min interval {args.min_interval}s", args.min_interval, 0.0),
+        (f"min interval {args.min_interval}s + deadband {args.deadband}", args.min_interval, args.deadband),
+    ):
+        cpu, controls, coalescer = replay(readings, args.hz, min_interval, deadband)
+        rows.append([label, count, controls, f"{cpu:.2f}", coalescer.deferred, coalescer.skipped])
+
+    print(f"{count} readings at {args.hz:.0f} Hz ({args.seconds:.0f}s of sensor time)")
+    print(tabulate(rows, headers=["Mode", "Readings", "control() runs", "CPU (s)", "deferred", "skipped"], tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
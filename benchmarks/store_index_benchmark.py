@@ -0,0 +1,84 @@
+"""
+Linear scans over store.machines / store.automations vs the Store indexes.
+
+Builds a real Store from in-memory payloads, then times the lookups done at
+automation registration (machine by id for every automation), by the nutrient
+procedures (machine by name, case-insensitive), by load_led_time_range
+(automation by device name) and for sensors by name.
+
+Usage:
+    python benchmarks/store_index_benchmark.py --devices 10000 --lookups 1000
+"""
+
+import argparse
+import random
+import time
+
+from _fakes import install_fake_resources, load_source
+from tabulate import tabulate
+
+
+def build_payloads(count: int) -> dict:
+    machines = [{"id": i, "pin": i % 40, "name": f"Device-{i}", "created_at": None} for i in range(count)]
+    switches = [{"device_id": i, "status": 0, "created_at": None} for i in range(count)]
+    automations = [
+        {"id": i, "device_id": {"id": i, "name": f"Device-{i}"}, "category": "interval", "settings": {}, "active": 1}
+        for i in range(count)
+    ]
+    sensors = [{"id": i, "name": f"Sensor-{i}", "pin": i % 40, "created_at": None} for i in range(count)]
+    return {"machines": machines, "switches": switches, "automations": automations, "sensors": sensors}
+
+
+def timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--devices", type=int, default=10000)
+    parser.add_argument("--lookups", type=int, default=1000, help="name lookups per scenario")
+    args = parser.parse_args()
+
+    install_fake_resources(build_payloads(args.devices))
+    store = load_source("bench_store", "store.py").Store()
+
+    ids = list(range(args.devices))
+    names = [f"device-{random.randrange(args.devices)}" for _ in range(args.lookups)]
+    device_names = [f"Device-{random.randrange(args.devices)}" for _ in range(args.lookups)]
+    sensor_names = [f"Sensor-{random.randrange(args.devices)}" for _ in range(args.lookups)]
+
+    def scan_machine_by_id():
+        for machine_id in ids:
+            next((m for m in store.machines if m.machine_id == machine_id), None)
+
+    def scan_machine_by_name():
+        for name in names:
+            next((m for m in store.machines if m.name.lower() == name.lower()), None)
+
+    def scan_automation_by_device_name():
+        for name in device_names:
+            next((a for a in store.automations if a.get("device_id", {}).get("name") == name), None)
+
+    def scan_sensor_by_name():
+        for name in sensor_names:
+            next((s for s in store.sensors if s.get("name") == name), None)
+
+    rows = [
+        [f"machine by id x{len(ids)} (startup)", f"{timed(scan_machine_by_id):.1f}",
+         f"{timed(lambda: [store.get_machine(i) for i in ids]):.3f}"],
+        [f"machine by name x{len(names)}", f"{timed(scan_machine_by_name):.1f}",
+         f"{timed(lambda: [store.get_machine_by_name(n, ignore_case=True) for n in names]):.3f}"],
+        [f"automation by device name x{len(names)}", f"{timed(scan_automation_by_device_name):.1f}",
+         f"{timed(lambda: [store.get_automation_by_device_name(n) for n in device_names]):.3f}"],
+        [f"sensor by name x{len(sensor_names)}", f"{timed(scan_sensor_by_name):.1f}",
+         f"{timed(lambda: [store.get_sensor_by_name(n) for n in sensor_names]):.3f}"],
+        ["rebuild indexes", "-", f"{timed(store._rebuild_indexes):.3f}"],
+    ]
+    print(f"{args.devices} devices")
+    print(tabulate(rows, headers=["Lookup", "linear scan (ms)", "index (ms)"], tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Store refresh cost: full reload vs conditional GET with nothing changed vs one-row change.
+
+Starts a local HTTP server that serves the eight Store endpoints with ETag
+support, then drives the real HTTP client and utils.diff.diff_records the
+same way Store.refresh() does.
+
+Usage:
+    python benchmarks/store_refresh_benchmark.py --rows 500 --repeat 20
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from _fakes import load_source
+from tabulate import tabulate
+
+ENDPOINTS = {
+    "AUTOMATION_READ_URL": "/automations",
+    "INTERVAL_DEVICE_STATES_READ_URL": "/switches/interval-states",
+    "ENVIRONMENT_EACH_LATEST_READ_URL": "/environment/each-latest",
+    "ENVIRONMENT_TYPE_READ_URL": "/environment/types",
+    "SWITCH_EACH_LATEST_READ_URL": "/switches/each-latest",
+    "MACHINE_READ_URL": "/device/machine",
+    "SENSOR_READ_URL": "/device/sensor",
+    "CURRENT_READ_URL": "/current/read-all",
+}
+BODIES = {}
+
+
+class Handler(BaseHTTPRequestHandler):
+    """ETag를 지원하는 최소 API 서버"""
+
+    def do_POST(self):
+        self._send(200, json.dumps({"accessToken": "benchmark"}).encode())
+
+    def do_GET(self):
+        body = BODIES[self.path]
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, b"", etag)
+        else:
+            self._send(200, body, etag)
+
+    def _send(self, status, body, etag=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def set_machines(rows: int, pin_offset: int = 0) -> None:
+    machines = [{"id": i, "name": f"device-{i}", "pin": i + pin_offset if i == 0 else i} for i in range(rows)]
+    BODIES[ENDPOINTS["MACHINE_READ_URL"]] = json.dumps(machines).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500, help="rows per endpoint")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for name, path in ENDPOINTS.items():
+        BODIES[path] = json.dumps([{"id": i, "device_id": i, "name": f"row-{i}"} for i in range(args.rows)]).encode()
+    set_machines(args.rows)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    os.environ["SIGNIN_URL"] = base + "/signin"
+    for name, path in ENDPOINTS.items():
+        os.environ[name] = base + path
+
+    http_module = load_source("bench_resources_http", "resources/http.py")
+    diff_module = load_source("bench_utils_diff", "utils/diff.py")
+    client = http_module.HTTP()
+    getters = [
+        client.get_automations, client.get_interval_device_states, client.get_environments,
+        client.get_environment_type, client.get_switches, client.get_machines,
+        client.get_sensors, client.get_currents,
+    ]
+
+    def full_reload():
+        return [getter() for getter in getters]
+
+    previous = {"machines": client.get_machines()}
+
+    def conditional_refresh():
+        results = [getter(conditional=True) for getter in getters]
+        machines = results[5]
+        if machines is not None:
+            diff = diff_module.diff_records(previous["machines"], machines, key=lambda m: m["id"])
+            previous["machines"] = machines
+            return diff
+        return None
+
+    def timed(fn, before=None):
+        samples = []
+        for i in range(args.repeat):
+            if before:
+                before(i)
+            started = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - started)
+        return sum(samples) / len(samples) * 1000
+
+    conditional_refresh()  # ETag 캐시 채우기
+    rows = [
+        ["full reload (restart)", f"{timed(full_reload):.2f}"],
+        ["conditional, nothing changed", f"{timed(conditional_refresh):.2f}"],
+        ["conditional, one machine row changed",
+         f"{timed(conditional_refresh, before=lambda i: set_machines(args.rows, pin_offset=i + 1)):.2f}"],
+    ]
+    print(tabulate(rows, headers=["Scenario", "ms / refresh"], tablefmt="grid"))
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Overhead of eager f-string log calls vs lazy %-args / key=value fields, and
+writer-thread formatting cost of the text, key=value and JSON-lines formatters.
+
+The caller table runs with LOG_LEVEL=info, so the DEBUG rows show what a
+filtered call costs, and with LOG_SAMPLE_INFO=0, so the INFO rows include
+record creation but not queueing or I/O.
+
+Usage:
+    python benchmarks/structured_log_benchmark.py --calls 200000
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+
+from _fakes import load_source
+from tabulate import tabulate
+
+LOG_DIR = tempfile.mkdtemp(prefix="structured-log-bench-")
+os.environ["LOG_DIR"] = LOG_DIR
+os.environ["LOG_LEVEL"] = "info"
+os.environ["LOG_SAMPLE_INFO"] = "0"
+
+from logger.custom_logger import CustomLogger  # noqa: E402
+
+FORMAT = '%(asctime)s | [%(levelname)s] | task:%(task_id)s | %(threadName)s | %(name)s: %(message)s'
+
+
+def per_call_ns(fn, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200000)
+    args = parser.parse_args()
+
+    logger = CustomLogger().set_machine("temperature")
+    name, value, target, count = "temperature", 24.13, 24.0, 2
+
+    caller_cases = [
+        ("DEBUG filtered, f-string (before)",
+         lambda: logger.debug(f"Sensor {name}: 목표값 범위 내 (연속 카운트: {count}/3, 현재값: {value}, 유효목표: {target})")),
+        ("DEBUG filtered, lazy %-args",
+         lambda: logger.debug("Sensor %s: 목표값 범위 내 (연속 카운트: %d/3)", name, count)),
+        ("DEBUG filtered, key=value fields",
+         lambda: logger.debug("Sensor %s: 목표값 범위 내", name, count=count, value=value, target=target)),
+        ("INFO record, f-string (before)",
+         lambda: logger.info(f"Sensor {name}: 목표값 범위 내 (연속 카운트: {count}/3, 현재값: {value}, 유효목표: {target})")),
+        ("INFO record, key=value fields",
+         lambda: logger.info("Sensor %s: 목표값 범위 내", name, count=count, value=value, target=target)),
+    ]
+    caller_rows = [[label, f"{per_call_ns(fn, args.calls):.0f}"] for label, fn in caller_cases]
+
+    formatters = load_source("bench_logger_formatters", "logger/formatters.py")
+    text_record = logging.LogRecord(
+        "automation/temperature", logging.INFO, __file__, 0,
+        f"Sensor {name}: 목표값 범위 내 (연속 카운트: {count}/3, 현재값: {value}, 유효목표: {target})", None, None
+    )
+    field_record = logging.LogRecord(
+        "automation/temperature", logging.INFO, __file__, 0, "Sensor %s: 목표값 범위 내", (name,), None
+    )
+    field_record.fields = {"count": count, "value": value, "target": target}
+    for record in (text_record, field_record):
+        record.task_id = '-'
+
+    json_formatter = formatters.JsonLineFormatter()
+    json.loads(json_formatter.format(field_record))  # 한 줄이 그대로 파싱되는지 확인
+
+    formatter_rows = []
+    for label, formatter, record in (
+        ("logging.Formatter, f-string message (before)", logging.Formatter(FORMAT), text_record),
+        ("KeyValueFormatter, fields", formatters.KeyValueFormatter(FORMAT), field_record),
+        ("JsonLineFormatter, fields", json_formatter, field_record),
+    ):
+        line = formatter.format(record)
+        formatter_rows.append([label, f"{per_call_ns(lambda: formatter.format(record), args.calls // 4):.0f}", len(line.encode())])
+
+    print(tabulate(caller_rows, headers=["Caller", "ns / call"], tablefmt="grid"))
+    print(tabulate(formatter_rows, headers=["Writer-thread formatter", "ns / record", "bytes / line"], tablefmt="grid"))
+    print("example:", json_formatter.format(field_record))
+
+
+if __name__ == "__main__":
+    main()
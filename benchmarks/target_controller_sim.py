@@ -0,0 +1,214 @@
+"""
+Closed-loop simulation of TargetAutomation against a thermal plant model,
+comparing the hysteresis (bang-bang) mode with PID + time-proportional relay
+mode on overshoot, tracking error and actuator toggles. Overshoot is the
+worst excursion outside target ± margin (either direction) once the air has
+first reached the band.
+
+Plant: a heated room with ambient losses. The heater's effect reaches the air
+through a first-order lag (element warm-up) and the sensor adds its own lag
+and Gaussian noise, which is what makes on/off control overshoot. Halfway
+through, the ambient temperature drops (night) as a load disturbance.
+
+The simulation runs on a virtual clock: sensor readings arrive every
+--sample-period seconds through the environment handler, and control() is
+also called whenever the automation's next_run_time() is due, as the
+scheduler would.
+
+The script exits non-zero if PID mode does not beat hysteresis on both heater
+toggles and overshoot, or if a settings change in the middle of an ON phase
+loses the relay state (the rebuilt relay must still report the heater as on).
+
+Usage:
+    python benchmarks/target_controller_sim.py --hours 12
+    python benchmarks/target_controller_sim.py --kp 0.8 --ki 0.001 --cycle 300 --min-on 15
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+from datetime import datetime
+
+from _fakes import install_fake_resources
+from tabulate import tabulate
+
+os.environ.setdefault("LOG_LEVEL", "warning")  # 제어 로그가 시뮬레이션 시간을 지배하지 않도록
+install_fake_resources()
+
+import models.automation.target as target_module  # noqa: E402
+from models.Machine import BaseMachine  # noqa: E402
+from models.automation import TargetAutomation  # noqa: E402
+from resources.mqtt import DispatchedMessage  # noqa: E402
+
+
+class Actuator:
+    """Control device stand-in that counts state changes."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.status = False
+        self.toggles = 0
+
+    def update_status(self, status: bool) -> None:
+        if status != self.status:
+            self.toggles += 1
+        self.status = status
+
+
+class VirtualClock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+class ThermalPlant:
+    """Room air heated through a lagging element, losing heat to ambient."""
+
+    def __init__(self, start: float, ambient: float, tau: float, gain: float,
+                 heater_lag: float, sensor_lag: float, noise: float, rng: random.Random) -> None:
+        self.air = start
+        self.element = 0.0
+        self.sensor = start
+        self.ambient = ambient
+        self.tau = tau
+        self.gain = gain
+        self.heater_lag = heater_lag
+        self.sensor_lag = sensor_lag
+        self.noise = noise
+        self.rng = rng
+
+    def step(self, heater_on: bool, dt: float) -> None:
+        self.element += ((1.0 if heater_on else 0.0) - self.element) * dt / self.heater_lag
+        self.air += ((self.ambient - self.air) / self.tau + self.gain * self.element) * dt
+        self.sensor += (self.air - self.sensor) * dt / self.sensor_lag
+
+    def read(self) -> float:
+        return round(self.sensor + self.rng.gauss(0, self.noise), 2)
+
+
+def simulate(args, mode: str, pid=None):
+    clock = VirtualClock()
+    target_module.time = clock
+    automation = TargetAutomation(1, "target", True, args.target, args.margin, mode=mode, pid=pid)
+    automation.coalescer.min_interval = 0.0
+    automation.set_machine(BaseMachine(machine_id=1, name="temperature", pin=4, status=0))
+    heater = Actuator("heater")
+    automation.increase_device = heater
+
+    plant = ThermalPlant(args.start, args.ambient, args.tau, args.gain, args.heater_lag,
+                         args.sensor_lag, args.noise, random.Random(args.seed))
+    started = clock.now
+    seconds = int(args.hours * 3600)
+    reached = False
+    overshoot = 0.0
+    settle_errors = []
+    in_band = 0
+    scheduled_runs = 0
+    due = None
+
+    for second in range(seconds):
+        clock.now = started + second
+        if second == seconds // 2:
+            plant.ambient -= args.night_drop
+
+        if second % args.sample_period == 0:
+            payload = json.dumps({"data": {"value": plant.read()}}).encode()
+            automation._handle_environment_message(DispatchedMessage("environment/temperature", payload, 0.0))
+            due = automation.next_run_time(datetime.fromtimestamp(clock.now))
+        elif due is not None and clock.now >= due.timestamp():
+            # 스케줄러가 릴레이 전환 시각에 control()을 실행하는 것과 동일
+            automation.control()
+            scheduled_runs += 1
+            due = automation.next_run_time(datetime.fromtimestamp(clock.now))
+
+        plant.step(heater.status, 1.0)
+        # 목표 범위에 처음 들어온 뒤부터 평가 (초기 승온 구간 제외)
+        reached = reached or plant.air >= args.target - args.margin
+        if reached:
+            overshoot = max(overshoot, abs(plant.air - args.target) - args.margin)
+            settle_errors.append(plant.air - args.target)
+            in_band += abs(plant.air - args.target) <= args.margin
+
+    relay_kept = True
+    if mode == "pid":
+        # 설정 변경(재구성) 후에도 켜진 히터를 릴레이가 on으로 알고 있어야 함
+        heater.status = True
+        automation.increase_relay.restore(False)
+        automation._build_controller(mode, pid)
+        relay_kept = automation.increase_relay.on
+    target_module.time = __import__("time")
+    rms = math.sqrt(sum(e * e for e in settle_errors) / len(settle_errors)) if settle_errors else float("nan")
+    band = in_band / len(settle_errors) * 100 if settle_errors else 0.0
+    return {
+        "toggles": heater.toggles,
+        "overshoot": overshoot,
+        "rms": rms,
+        "band": band,
+        "scheduled": scheduled_runs,
+        "relay_kept": relay_kept,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hours", type=float, default=12)
+    parser.add_argument("--target", type=float, default=25.0)
+    parser.add_argument("--margin", type=float, default=0.5)
+    parser.add_argument("--start", type=float, default=18.0)
+    parser.add_argument("--ambient", type=float, default=18.0)
+    parser.add_argument("--night-drop", type=float, default=3.0, help="ambient drop (°C) at the halfway point")
+    parser.add_argument("--tau", type=float, default=1800.0, help="room heat-loss time constant (s)")
+    parser.add_argument("--gain", type=float, default=0.006, help="air heating rate at full heater (°C/s)")
+    parser.add_argument("--heater-lag", type=float, default=120.0, help="heater element time constant (s)")
+    parser.add_argument("--sensor-lag", type=float, default=30.0, help="sensor time constant (s)")
+    parser.add_argument("--noise", type=float, default=0.05)
+    parser.add_argument("--sample-period", type=int, default=5, help="seconds between sensor readings")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--kp", type=float, default=0.5)
+    parser.add_argument("--ki", type=float, default=0.0005)
+    parser.add_argument("--kd", type=float, default=0.0)
+    parser.add_argument("--cycle", type=float, default=120.0, help="PID relay cycle (s)")
+    parser.add_argument("--min-on", type=float, default=30.0)
+    parser.add_argument("--min-off", type=float, default=30.0)
+    args = parser.parse_args()
+
+    pid = {"kp": args.kp, "ki": args.ki, "kd": args.kd,
+           "cycle_seconds": args.cycle, "min_on": args.min_on, "min_off": args.min_off}
+    runs = [
+        ("hysteresis (before)", simulate(args, "hysteresis")),
+        (f"pid (cycle {args.cycle:g}s)", simulate(args, "pid", pid)),
+    ]
+
+    hours = args.hours
+    rows = [
+        [label, r["toggles"], f"{r['toggles'] / hours:.1f}", f"{r['overshoot']:.2f}",
+         f"{r['rms']:.3f}", f"{r['band']:.1f}%", r["scheduled"]]
+        for label, r in runs
+    ]
+    print(f"{hours:g} h, target {args.target} ± {args.margin}, ambient {args.ambient} → "
+          f"{args.ambient - args.night_drop} at {hours / 2:g} h")
+    print(tabulate(rows, headers=["Mode", "Heater toggles", "Toggles/h", "Overshoot outside band (°C)",
+                                  "RMS error (°C)", "Time in band", "Scheduled runs"], tablefmt="grid"))
+
+    (_, hysteresis), (_, pid_run) = runs
+    failures = []
+    if pid_run["toggles"] >= hysteresis["toggles"]:
+        failures.append(f"pid toggles {pid_run['toggles']} not below hysteresis {hysteresis['toggles']}")
+    if pid_run["overshoot"] >= hysteresis["overshoot"]:
+        failures.append(f"pid overshoot {pid_run['overshoot']:.2f}°C not below hysteresis "
+                        f"{hysteresis['overshoot']:.2f}°C")
+    if not pid_run["relay_kept"]:
+        failures.append("relay state lost on settings change while the heater was on")
+    if failures:
+        print("\nFAIL: " + "\nFAIL: ".join(failures))
+        sys.exit(1)
+    print("\nOK: pid toggles less and overshoots less than hysteresis, relay state kept across settings change")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Offline replay of a sensor trace through TargetAutomation with different
+input filter pipelines, counting actuator toggles (each one is an MQTT
+publish) and in-range counter resets.
+
+Without --trace a recorded-like trace is synthesized: a slow drift around the
+target with Gaussian sensor noise and occasional single-sample spikes. A real
+trace can be given as CSV with one value (or "timestamp,value") per line.
+
+With a synthesized trace the script also checks the filters and exits
+non-zero on failure:
+- every pipeline with an outlier (Hampel) stage rejects every injected spike
+  after the first WARMUP_READINGS readings
+- the median-only pipeline never lets a spike through (output stays within
+  --spike-tolerance of the clean signal at spike readings)
+- no pipeline returns None for the clean signal (no noise, no spikes)
+
+Usage:
+    python benchmarks/target_filter_replay.py --hours 6 --noise 0.15 --spike-rate 0.01
+    python benchmarks/target_filter_replay.py --trace recorded_temperature.csv
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+
+from _fakes import install_fake_resources
+from tabulate import tabulate
+
+install_fake_resources()
+
+import models.automation.target as target_module  # noqa: E402
+from models.Machine import BaseMachine  # noqa: E402
+from models.automation import TargetAutomation  # noqa: E402
+from models.automation.filters import FilterPipeline  # noqa: E402
+from resources.mqtt import DispatchedMessage  # noqa: E402
+
+PIPELINES = [
+    ("raw (before)", None),
+    ("outlier", [{"type": "outlier", "window": 7, "threshold": 4.0}]),
+    ("median(5)", [{"type": "median", "window": 5}]),
+    ("outlier → ema(0.2)", [{"type": "outlier"}, {"type": "ema", "alpha": 0.2}]),
+    ("outlier → median(5) → ema(0.3)", [{"type": "outlier"}, {"type": "median", "window": 5}, {"type": "ema", "alpha": 0.3}]),
+    ("kalman", [{"type": "kalman", "process_noise": 0.001, "measurement_noise": 0.04}]),
+]
+
+
+class Actuator:
+    """Control device stand-in that counts state changes."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.status = False
+        self.toggles = 0
+
+    def update_status(self, status: bool) -> None:
+        if status != self.status:
+            self.toggles += 1
+        self.status = status
+
+
+class VirtualClock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+def synthesize(seconds: int, target: float, noise: float, spike_rate: float, seed: int):
+    rng = random.Random(seed)
+    clean, trace, spikes = [], [], []
+    for i in range(seconds):
+        value = target + 0.6 * math.sin(i / 1800 * 2 * math.pi) + 0.2 * math.sin(i / 240 * 2 * math.pi)
+        measured = value + rng.gauss(0, noise)
+        if rng.random() < spike_rate:
+            measured += rng.choice((-1, 1)) * rng.uniform(2.0, 5.0)
+            spikes.append(i)
+        clean.append(value)
+        trace.append(round(measured, 2))
+    return clean, trace, spikes
+
+
+def load_trace(path: str):
+    values = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                try:
+                    values.append(float(line.split(',')[-1]))
+                except ValueError:
+                    continue
+    return None, values, None
+
+
+# 필터 창이 찰 때까지의 판정 제외 구간 (outlier window 7 + 여유)
+WARMUP_READINGS = 10
+
+
+def check_filters(clean, trace, spikes, spike_tolerance: float):
+    """스파이크 제거와 깨끗한 입력 통과 여부 검사 (실패 메시지 목록 반환)"""
+    failures = []
+    spikes = [index for index in spikes if index >= WARMUP_READINGS]
+    for label, config in PIPELINES[1:]:
+        types = [stage["type"] for stage in config]
+
+        pipeline = FilterPipeline.from_config(config)
+        outputs = [pipeline.update(value) for value in trace]
+        if "outlier" in types:
+            passed = [index for index in spikes if outputs[index] is not None]
+            if passed:
+                failures.append(f"{label}: {len(passed)}/{len(spikes)} spikes not rejected (first at {passed[0]})")
+        elif types == ["median"]:
+            leaked = [index for index in spikes
+                      if outputs[index] is not None and abs(outputs[index] - clean[index]) > spike_tolerance]
+            if leaked:
+                failures.append(f"{label}: {len(leaked)}/{len(spikes)} spikes reached the output")
+
+        pipeline = FilterPipeline.from_config(config)
+        none_at = next((index for index, value in enumerate(clean) if pipeline.update(value) is None), None)
+        if none_at is not None:
+            failures.append(f"{label}: returned None for clean input at reading {none_at}")
+    return failures
+
+
+def replay(trace, target: float, margin: float, filters):
+    clock = VirtualClock()
+    target_module.time = clock
+    automation = TargetAutomation(1, "target", True, target, margin, filters=filters)
+    automation.coalescer.min_interval = 0.0
+    automation.set_machine(BaseMachine(machine_id=1, name="temperature", pin=4, status=0))
+    heater, cooler = Actuator("heater"), Actuator("cooler")
+    automation.increase_device, automation.decrease_device = heater, cooler
+
+    resets = [0]
+    position = [0]
+    controlled = []
+    original_control = automation.control
+
+    def counting_control():
+        before = automation.in_range_count
+        result = original_control()
+        if before and automation.in_range_count == 0 and not before >= automation.required_count:
+            resets[0] += 1
+        controlled.append((position[0], automation.value))
+        return result
+
+    automation.control = counting_control
+    for index, value in enumerate(trace):
+        position[0] = index
+        clock.now += 1.0
+        payload = json.dumps({"data": {"value": value}}).encode()
+        automation._handle_environment_message(DispatchedMessage("environment/temperature", payload, 0.0))
+
+    target_module.time = __import__("time")
+    return heater.toggles + cooler.toggles, resets[0], automation.filters.rejected, controlled
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trace", help="CSV file with one reading per line (last column is the value)")
+    parser.add_argument("--hours", type=float, default=6)
+    parser.add_argument("--target", type=float, default=25.0)
+    parser.add_argument("--margin", type=float, default=0.5)
+    parser.add_argument("--noise", type=float, default=0.15)
+    parser.add_argument("--spike-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--spike-tolerance", type=float, default=1.0,
+                        help="max |median output - clean| at a spike reading")
+    args = parser.parse_args()
+
+    if args.trace:
+        clean, trace, spikes = load_trace(args.trace)
+    else:
+        clean, trace, spikes = synthesize(int(args.hours * 3600), args.target, args.noise, args.spike_rate, args.seed)
+
+    rows = []
+    baseline = None
+    for label, filters in PIPELINES:
+        toggles, resets, rejected, controlled = replay(trace, args.target, args.margin, filters)
+        baseline = toggles if baseline is None else baseline
+        row = [label, toggles, f"{(1 - toggles / baseline) * 100:.0f}%" if baseline else "-", resets, rejected]
+        if clean is not None:
+            errors = [abs(value - clean[index]) for index, value in controlled]
+            row.append(f"{sum(errors) / len(errors):.3f}")
+        rows.append(row)
+
+    headers = ["Filter pipeline", "Actuator toggles", "Reduction", "In-range resets", "Rejected"]
+    if clean is not None:
+        headers.append("Mean |error|")
+    print(f"{len(trace)} readings, target {args.target} ± {args.margin}")
+    print(tabulate(rows, headers=headers, tablefmt="grid"))
+
+    if spikes is None:
+        return
+    failures = check_filters(clean, trace, spikes, args.spike_tolerance)
+    if failures:
+        print("\nFAIL: " + "\nFAIL: ".join(failures))
+        sys.exit(1)
+    print(f"\nOK: {len(spikes)} injected spikes rejected, no None on clean input")
+
+
+if __name__ == "__main__":
+    main()
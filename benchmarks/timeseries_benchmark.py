@@ -0,0 +1,104 @@
+"""
+Time-series ring buffer (array('d') columns) vs a deque of (timestamp, value)
+tuples with the statistics module: append cost, rolling-window statistics
+cost, and memory per sample.
+
+Usage:
+    python benchmarks/timeseries_benchmark.py --capacity 4096 --samples 200000
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp(prefix="timeseries-bench-"))
+
+from _fakes import load_source
+from tabulate import tabulate
+
+timeseries_module = load_source("bench_utils_timeseries", "utils/timeseries.py")
+RingSeries, compute_stats = timeseries_module.RingSeries, timeseries_module.compute_stats
+
+
+class DequeSeries:
+    """비교 기준: 튜플 deque + statistics 모듈"""
+
+    def __init__(self, capacity: int) -> None:
+        self.samples = deque(maxlen=capacity)
+
+    def append(self, timestamp: float, value: float) -> None:
+        self.samples.append((timestamp, value))
+
+    def stats(self, seconds: float, now: float):
+        window = [(t, v) for t, v in self.samples if t >= now - seconds]
+        times = [t for t, _ in window]
+        values = [v for _, v in window]
+        slope = statistics.linear_regression([t - times[0] for t in times], values).slope * 60.0
+        return statistics.fmean(values), statistics.median(values), min(values), max(values), slope
+
+
+def fill(series, samples: int, start: float) -> float:
+    started = time.perf_counter()
+    for i in range(samples):
+        series.append(start + i, 20.0 + (i % 50) * 0.1)
+    return (time.perf_counter() - started) / samples * 1e9
+
+
+def per_call_us(fn, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def allocated_bytes(factory, capacity: int) -> int:
+    tracemalloc.start()
+    series = factory(capacity)
+    for i in range(capacity):
+        series.append(1.7e9 + i, 20.0 + i * 0.001)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--capacity", type=int, default=4096)
+    parser.add_argument("--samples", type=int, default=200000)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    start = 1.7e9
+    ring, baseline = RingSeries(args.capacity), DequeSeries(args.capacity)
+    append_rows = [
+        ["deque of tuples (baseline)", f"{fill(baseline, args.samples, start):.0f}"],
+        ["RingSeries array('d')", f"{fill(ring, args.samples, start):.0f}"],
+    ]
+    now = start + args.samples - 1
+
+    stats_rows = []
+    for seconds in (60, 300, args.capacity):
+        expected = baseline.stats(seconds, now)
+        got = compute_stats(*ring.window(seconds, now))
+        assert abs(got.mean - expected[0]) < 1e-9 and got.median == expected[1], (got, expected)
+        assert abs(got.slope - expected[4]) < 1e-6, (got.slope, expected[4])
+        before = per_call_us(lambda: baseline.stats(seconds, now), args.calls)
+        after = per_call_us(lambda: compute_stats(*ring.window(seconds, now)), args.calls)
+        stats_rows.append([f"{seconds}s ({got.count} samples)", f"{before:.1f}", f"{after:.1f}", f"{before / after:.1f}x"])
+
+    memory_rows = [
+        ["deque of tuples (baseline)", f"{allocated_bytes(DequeSeries, args.capacity) / args.capacity:.1f}"],
+        ["RingSeries array('d')", f"{allocated_bytes(RingSeries, args.capacity) / args.capacity:.1f}"],
+    ]
+
+    print(tabulate(append_rows, headers=["Append", "ns / sample"], tablefmt="grid"))
+    print(tabulate(stats_rows, headers=["Window (1 Hz)", "Baseline (us)", "Ring (us)", "Speedup"], tablefmt="grid"))
+    print(tabulate(memory_rows, headers=["Memory", "bytes / sample"], tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
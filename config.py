@@ -1,7 +1,7 @@
 """Configuration management using environment variables and .env files."""
 
 import os
-from typing import Optional
+from typing import Optional, Tuple
 from dotenv import load_dotenv
 
 
@@ -53,6 +53,12 @@ class Settings:
             "http://localhost:3000/api/machine/current/read"
         )
 
+        # HTTP Client Configuration
+        self.http_timeout: int = self._get_positive_int("HTTP_TIMEOUT", 10)  # 요청 타임아웃 (초)
+        self.http_retry_total: int = self._get_int("HTTP_RETRY_TOTAL", 3)  # 재시도 횟수
+        self.http_retry_backoff: float = self._get_float("HTTP_RETRY_BACKOFF", 0.5)  # 재시도 지수 백오프 계수 (초)
+        self.http_pool_size: int = self._get_positive_int("HTTP_POOL_SIZE", 8)  # 커넥션 풀 크기
+
         # Database Configuration
         self.db_host: str = os.getenv("DB_HOST", "localhost")
         self.db_port: int = self._get_port("DB_PORT", 5432)
@@ -64,7 +70,18 @@ class Settings:
         self.mqtt_host: str = os.getenv("MQTT_HOST", "localhost")
         self.mqtt_port: int = self._get_port("MQTT_PORT", 1883)
         self.mqtt_client_id: Optional[str] = os.getenv("MQTT_CLIENT_ID")
-        self.mqtt_keepalive: int = self._get_positive_int("MQTT_KEEPALIVE", 60)
+        self.mqtt_keepalive: int = self._get_positive_int("MQTT_KEEPALIVE", 60)  # 응답 없는 연결은 약 1.5배 시간 안에 끊김으로 감지
+        self.mqtt_reconnect_min_delay: float = self._get_float("MQTT_RECONNECT_MIN_DELAY", 0.5)  # 재연결 백오프 첫 간격 (초)
+        self.mqtt_reconnect_max_delay: float = self._get_float("MQTT_RECONNECT_MAX_DELAY", 5.0)  # 재연결 백오프 최대 간격 (초)
+        self.mqtt_reconnect_jitter: float = self._get_float("MQTT_RECONNECT_JITTER", 0.5)  # 백오프 간격 중 무작위로 줄이는 비율 (0~1)
+        self.mqtt_dispatch_workers: int = self._get_positive_int("MQTT_DISPATCH_WORKERS", 2)  # 메시지 핸들러 워커 수
+        self.mqtt_dispatch_queue_size: int = self._get_positive_int("MQTT_DISPATCH_QUEUE_SIZE", 1000)  # 대기 메시지 최대 개수
+        self.mqtt_publish_queue_size: int = self._get_positive_int("MQTT_PUBLISH_QUEUE_SIZE", 1000)  # 발행 대기 메시지 최대 개수
+        self.mqtt_max_in_flight: int = self._get_positive_int("MQTT_MAX_IN_FLIGHT", 20)  # 응답 대기 중인 QoS 1/2 메시지 최대 개수
+        self.mqtt_coalesce_window: float = self._get_float("MQTT_COALESCE_WINDOW", 0.05)  # 같은 스위치 토픽 명령 병합 구간 (초, 0이면 대기 중인 것만 병합)
+        self.mqtt_outbox_size: int = self._get_positive_int("MQTT_OUTBOX_SIZE", 500)  # 연결 끊김 중 보관할 최대 토픽 수 (토픽별 최신 값만)
+        self.mqtt_outbox_max_age: float = self._get_float("MQTT_OUTBOX_MAX_AGE", 600.0)  # 재연결 시 이보다 오래된 메시지는 버림 (초, 0이면 제한 없음)
+        self.mqtt_compact_topics: Tuple[str, ...] = self._get_list("MQTT_COMPACT_TOPICS", ())  # 압축 형식으로 발행할 토픽 계열 (예: environment,switch)
 
         # Redis Configuration
         self.redis_host: str = os.getenv("REDIS_HOST", "localhost")
@@ -75,6 +92,12 @@ class Settings:
         self.log_dir: str = os.getenv("LOG_DIR", ".logs")
         self.log_max_bytes: int = self._get_int("LOG_MAX_BYTES", 10 * 1024 * 1024)
         self.log_backup_count: int = self._get_int("LOG_BACKUP_COUNT", 5)
+        self.log_queue_size: int = self._get_positive_int("LOG_QUEUE_SIZE", 10000)  # 기록 대기 로그 최대 개수 (초과 시 버리고 요약)
+        self.log_batch_size: int = self._get_positive_int("LOG_BATCH_SIZE", 256)  # 한 번에 기록/flush할 로그 수
+        self.log_sample_debug: float = self._get_float("LOG_SAMPLE_DEBUG", 1.0)  # DEBUG 로그 샘플링 비율 (0~1)
+        self.log_sample_info: float = self._get_float("LOG_SAMPLE_INFO", 1.0)  # INFO 로그 샘플링 비율 (0~1)
+        self.log_level: str = self._get_choice("LOG_LEVEL", "debug", ("debug", "info", "warning", "error", "critical"))  # 이보다 낮은 레벨은 메시지 생성 전에 버림
+        self.log_format: str = self._get_choice("LOG_FORMAT", "text", ("text", "json"))  # text: key=value 텍스트, json: JSON lines
 
         # Thread Configuration
         self.thread_check_interval: int = self._get_positive_int("THREAD_CHECK_INTERVAL", 60)
@@ -82,11 +105,28 @@ class Settings:
         # Automation Configuration
         self.current_buffer_size: int = self._get_int("CURRENT_BUFFER_SIZE", 5)
         self.target_required_count: int = self._get_int("TARGET_REQUIRED_COUNT", 3)
+        self.target_min_control_interval: float = self._get_float("TARGET_MIN_CONTROL_INTERVAL", 1.0)  # 센서값으로 인한 control() 최소 간격 (초, 0이면 매번 실행)
+        self.target_deadband: float = self._get_float("TARGET_DEADBAND", 0.0)  # 마지막 제어값과의 차이가 이보다 작으면 건너뜀 (범위 내 연속 카운트 중 제외, 0이면 비활성화)
 
         # Thread Interval Configuration
         self.automation_interval: int = self._get_positive_int("AUTOMATION_INTERVAL", 60)  # 자동화 실행 주기 (초)
         self.sensor_read_interval: int = self._get_positive_int("SENSOR_READ_INTERVAL", 300)  # 센서값 읽기 주기 (초)
         self.current_monitor_interval: int = self._get_positive_int("CURRENT_MONITOR_INTERVAL", 10)  # 전류 모니터 주기 (초)
+        self.store_refresh_interval: int = self._get_int("STORE_REFRESH_INTERVAL", 300)  # Store 갱신 주기 (초, 0이면 비활성화)
+        self.atlas_poll_interval: float = self._get_float("ATLAS_POLL_INTERVAL", 0.1)  # Atlas 센서 준비 상태 확인 간격 (초)
+        self.atlas_read_timeout: float = self._get_float("ATLAS_READ_TIMEOUT", 3.0)  # Atlas 센서 응답 대기 한도 (초)
+        self.current_monitor_mode: str = self._get_choice("CURRENT_MONITOR_MODE", "poll", ("poll", "event"))  # 전류 모니터 방식
+        self.current_mismatch_confirm_seconds: float = self._get_float("CURRENT_MISMATCH_CONFIRM_SECONDS", 5.0)  # 이벤트 모드: 불일치가 이 시간 동안 지속되면 스위치 동기화 (초)
+
+        # Automation Scheduler Configuration
+        self.automation_workers: int = self._get_positive_int("AUTOMATION_WORKERS", 4)  # 자동화 실행 워커 수
+        self.automation_resync_interval: int = self._get_positive_int("AUTOMATION_RESYNC_INTERVAL", 600)  # 마감 시각이 없을 때 재확인 주기 (초)
+        self.schedule_timezone: Optional[str] = os.getenv("SCHEDULE_TIMEZONE") or None  # Range 스케줄 기본 시간대 (예: Asia/Seoul, 없으면 시스템 로컬)
+
+        # Time-series Configuration (in-process ring buffers, 16 bytes per sample)
+        self.timeseries_capacity: int = self._get_positive_int("TIMESERIES_CAPACITY", 1024)  # 시계열당 보관 샘플 수
+        self.timeseries_max_series: int = self._get_positive_int("TIMESERIES_MAX_SERIES", 64)  # 최대 시계열 개수 (메모리 한도)
+        self.timeseries_trend_window: int = self._get_positive_int("TIMESERIES_TREND_WINDOW", 300)  # 상태 리포트 추세 구간 (초)
 
         # Sensor Measurement Ranges (Safety Limits)
         self.ph_min: float = self._get_float("PH_MIN", 5.5)
@@ -136,6 +176,20 @@ class Settings:
             raise ValueError(f"Environment variable {key} must be positive, got {value}")
         return value
 
+    def _get_choice(self, key: str, default: str, choices: tuple) -> str:
+        """Get environment variable restricted to a set of choices."""
+        value = os.getenv(key, default).strip().lower()
+        if value not in choices:
+            raise ValueError(f"Environment variable {key} must be one of {', '.join(choices)}, got {value}")
+        return value
+
+    def _get_list(self, key: str, default: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Get comma-separated list environment variable."""
+        value = os.getenv(key)
+        if value is None:
+            return default
+        return tuple(item.strip() for item in value.split(",") if item.strip())
+
     def _get_float(self, key: str, default: float) -> float:
         """Get float environment variable."""
         value = os.getenv(key)
@@ -20,6 +20,10 @@ class AtlasI2C:
     DEFAULT_ADDRESS = 98
     LONG_TIMEOUT_COMMANDS = ("R", "CAL")
     SLEEP_COMMANDS = ("SLEEP", )
+    # translate table that clears the MSB of every byte (bytes version of handle_raspi_glitch)
+    GLITCH_TABLE = bytes(range(128)) * 2
+    # status code reported when the board returned nothing
+    NO_DATA = 255
 
     def __init__(self, address=None, moduletype = "", name = "", bus=None):
         '''
@@ -126,9 +130,26 @@ class AtlasI2C:
         else:
             return self._module + " " + str(self.address) + " " + self._name
         
+    def read_bytes(self, num_of_bytes=31):
+        '''
+        reads a specified number of bytes from I2C and returns (status code, payload)
+        without building per-character strings: the MSB glitch is cleared with one
+        bytes.translate and the payload is a memoryview up to the first NUL,
+        which float() accepts directly
+        '''
+        raw_data = self.file_read.read(num_of_bytes)
+        if not raw_data:
+            return self.NO_DATA, memoryview(b"")
+        masked = raw_data.translate(self.GLITCH_TABLE)
+        end = masked.find(0, 1)
+        if end < 0:
+            end = len(masked)
+        return raw_data[0], memoryview(masked)[1:end]
+
     def read(self, num_of_bytes=31):
         '''
         reads a specified number of bytes from I2C, then parses and displays the result
+        (legacy text format kept for existing callers; use read_bytes for status codes)
         '''
         
         raw_data = self.file_read.read(num_of_bytes)
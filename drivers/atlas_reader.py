@@ -0,0 +1,303 @@
+"""Atlas EZO I2C 센서 일괄 읽기 스케줄러"""
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+from logger.custom_logger import custom_logger
+
+# EZO 응답 첫 바이트 (상태 코드)
+STATUS_SUCCESS = 1
+STATUS_SYNTAX_ERROR = 2
+STATUS_PENDING = 254  # 아직 처리 중 - 다시 읽으면 됨
+STATUS_NO_DATA = 255
+STATUS_TIMEOUT = -1  # 제한 시간 안에 응답하지 않음 (드라이버 코드 아님)
+STATUS_PARSE_ERROR = -2  # 성공 응답이지만 숫자로 해석할 수 없음 (드라이버 코드 아님)
+
+EMPTY_PAYLOAD = memoryview(b'')
+
+# 첫 상태 확인까지의 지연 (EZO RTD/EC 읽기 최소 처리 시간)
+FIRST_POLL_DELAY = 0.6
+
+
+@dataclass
+class AtlasReading:
+    """센서 한 개의 측정 결과"""
+    device: str
+    moduletype: str
+    address: int
+    status: int
+    value: Optional[float]
+    timestamp: float
+
+    @property
+    def ok(self) -> bool:
+        """정상 측정값 여부"""
+        return self.status == STATUS_SUCCESS and self.value is not None
+
+
+ReadingCallback = Callable[[AtlasReading], None]
+
+
+def read_response(device) -> Tuple[int, memoryview]:
+    """
+    장치 응답을 (상태 코드, 응답 바이트)로 읽기 (문자열 변환 없음)
+
+    Args:
+        device: AtlasI2C instance
+
+    Returns:
+        Tuple[int, memoryview]: Status code and payload bytes (empty on error)
+    """
+    status, payload = device.read_bytes()
+    if status != STATUS_SUCCESS:
+        return status, EMPTY_PAYLOAD
+    return (STATUS_SUCCESS, payload) if payload else (STATUS_NO_DATA, EMPTY_PAYLOAD)
+
+
+def query_all(
+    devices: Sequence,
+    command: str,
+    poll_delay: float,
+    poll_interval: float,
+    timeout: float,
+    stop_event: Optional[threading.Event] = None
+) -> Dict[int, Tuple[int, str]]:
+    """
+    모든 장치에 같은 명령을 보낸 뒤 준비된 장치부터 응답 수집
+
+    Used for discovery ("I", "name,?") where the old code paid one fixed
+    timeout per command per device.
+
+    Args:
+        devices: AtlasI2C instances
+        command: Command sent to every device
+        poll_delay: Seconds before the first readiness check
+        poll_interval: Seconds between readiness checks
+        timeout: Seconds after which unanswered devices get STATUS_TIMEOUT
+        stop_event: Aborts the wait when set
+
+    Returns:
+        Dict[int, Tuple[int, str]]: Address -> (status, payload)
+    """
+    started = time.monotonic()
+    responses: Dict[int, Tuple[int, str]] = {}
+    pending = {}
+    for device in devices:
+        try:
+            device.write(command)
+            pending[device.address] = device
+        except OSError:
+            # 응답하지 않는 주소
+            responses[device.address] = (STATUS_NO_DATA, '')
+
+    delay = poll_delay
+    while pending:
+        if stop_event is not None:
+            if stop_event.wait(delay):
+                break
+        else:
+            time.sleep(delay)
+        for address, device in list(pending.items()):
+            try:
+                status, payload = read_response(device)
+            except OSError:
+                status, payload = STATUS_NO_DATA, EMPTY_PAYLOAD
+            if status != STATUS_PENDING:
+                # 탐색 응답("?I,pH,2.16")은 문자열로 사용
+                responses[address] = (status, str(payload, 'latin-1'))
+                del pending[address]
+        if time.monotonic() - started >= timeout:
+            break
+        delay = poll_interval
+
+    for address in pending:
+        responses[address] = (STATUS_TIMEOUT, '')
+    return responses
+
+
+class AtlasReadScheduler:
+    """
+    Read every Atlas EZO device in one batched cycle.
+
+    A cycle writes the read command to all devices at once, then polls them:
+    EZO boards answer 254 while a measurement is still in progress, so each
+    device is collected as soon as it is ready instead of after a fixed
+    LONG_TIMEOUT sleep. start_cycle()/poll() never sleep and return the next
+    time the caller should call poll(), so the cycle can be driven from any
+    loop; read_cycle() drives one cycle using a stop event for the waits.
+
+    Every reading is timestamped, kept in a bounded history, and pushed to
+    subscribers as it arrives.
+    """
+
+    def __init__(
+        self,
+        devices: Sequence,
+        command: str = "R",
+        poll_delay: float = FIRST_POLL_DELAY,
+        poll_interval: float = 0.1,
+        timeout: float = 3.0,
+        history_size: int = 256
+    ) -> None:
+        """
+        Initialize AtlasReadScheduler.
+
+        Args:
+            devices: AtlasI2C instances (moduletype/name already set)
+            command: Read command sent each cycle
+            poll_delay: Seconds from the write to the first readiness check
+            poll_interval: Seconds between readiness checks
+            timeout: Seconds after which a device that is still busy is reported as timed out
+            history_size: Number of recent readings kept in `history`
+        """
+        self.devices = list(devices)
+        self.command = command
+        self.poll_delay = poll_delay
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+
+        self.history: Deque[AtlasReading] = deque(maxlen=history_size)
+        self.latest: Dict[int, AtlasReading] = {}
+        self._subscribers: List[ReadingCallback] = []
+
+        self._pending: Dict[int, object] = {}
+        self._cycle_readings: List[AtlasReading] = []
+        self._cycle_started_at = 0.0
+        self._next_poll_at: Optional[float] = None
+
+        self.cycles = 0
+        self.polls = 0
+        self.timeouts = 0
+        self.last_cycle_time = 0.0
+
+    def subscribe(self, callback: ReadingCallback) -> None:
+        """측정값 수신 콜백 등록 (측정값이 준비되는 즉시 호출)"""
+        self._subscribers.append(callback)
+
+    @property
+    def in_progress(self) -> bool:
+        """진행 중인 읽기 사이클이 있는지 여부"""
+        return bool(self._pending)
+
+    def start_cycle(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        모든 장치에 읽기 명령 전송
+
+        Args:
+            now: Current epoch seconds (time.time() if None)
+
+        Returns:
+            Optional[float]: When to call poll() next, or None if no device accepted the command
+        """
+        now = time.time() if now is None else now
+        self._pending = {}
+        self._cycle_readings = []
+        self._cycle_started_at = now
+        for device in self.devices:
+            try:
+                device.write(self.command)
+                self._pending[device.address] = device
+            except OSError as e:
+                custom_logger.error(f"Atlas 센서 명령 전송 실패 ({device.moduletype} {device.address}): {e}")
+        self._next_poll_at = now + self.poll_delay if self._pending else None
+        return self._next_poll_at
+
+    def poll(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        준비된 장치의 응답 읽기 (대기하지 않음)
+
+        Args:
+            now: Current epoch seconds (time.time() if None)
+
+        Returns:
+            Optional[float]: When to call poll() next, or None when the cycle is complete
+        """
+        if not self._pending:
+            return None
+        now = time.time() if now is None else now
+        if now < self._next_poll_at:
+            return self._next_poll_at
+
+        self.polls += 1
+        for address, device in list(self._pending.items()):
+            try:
+                status, payload = read_response(device)
+            except OSError as e:
+                custom_logger.error(f"Atlas 센서 읽기 실패 ({device.moduletype} {address}): {e}")
+                status, payload = STATUS_NO_DATA, EMPTY_PAYLOAD
+            if status == STATUS_PENDING:
+                continue
+            del self._pending[address]
+            self._publish(device, status, payload, now)
+
+        if self._pending and now - self._cycle_started_at >= self.timeout:
+            for address, device in self._pending.items():
+                self.timeouts += 1
+                custom_logger.warning(f"Atlas 센서 응답 시간 초과: {device.moduletype} {address}")
+                self._publish(device, STATUS_TIMEOUT, EMPTY_PAYLOAD, now)
+            self._pending = {}
+
+        if not self._pending:
+            self.cycles += 1
+            self.last_cycle_time = now - self._cycle_started_at
+            self._next_poll_at = None
+            return None
+
+        self._next_poll_at = now + self.poll_interval
+        return self._next_poll_at
+
+    def read_cycle(self, stop_event: Optional[threading.Event] = None) -> List[AtlasReading]:
+        """
+        읽기 사이클 한 번을 끝까지 진행
+
+        Args:
+            stop_event: Waits use this event so shutdown interrupts the cycle
+
+        Returns:
+            List[AtlasReading]: Readings collected in this cycle
+        """
+        next_poll_at = self.start_cycle()
+        while next_poll_at is not None:
+            delay = next_poll_at - time.time()
+            if delay > 0:
+                if stop_event is not None:
+                    if stop_event.wait(delay):
+                        break
+                else:
+                    time.sleep(delay)
+            next_poll_at = self.poll()
+        return list(self._cycle_readings)
+
+    def _publish(self, device, status: int, payload: memoryview, now: float) -> None:
+        """측정값 생성 후 기록/전달"""
+        value = None
+        if status == STATUS_SUCCESS:
+            try:
+                # float()는 bytes/memoryview를 바로 파싱 (문자열 왕복 없음)
+                value = float(payload)
+            except ValueError:
+                status = STATUS_PARSE_ERROR
+        reading = AtlasReading(
+            device=device.name or device.moduletype,
+            moduletype=device.moduletype,
+            address=device.address,
+            status=status,
+            value=value,
+            timestamp=now
+        )
+        self._cycle_readings.append(reading)
+        self.history.append(reading)
+        self.latest[reading.address] = reading
+        for callback in self._subscribers:
+            try:
+                callback(reading)
+            except Exception as e:
+                custom_logger.error(f"Atlas 측정값 콜백 실패: {e}")
+
+    def report(self) -> str:
+        """읽기 통계 요약"""
+        return (
+            f"cycles={self.cycles} polls={self.polls} timeouts={self.timeouts} "
+            f"last_cycle={self.last_cycle_time:.2f}s"
+        )
@@ -1,14 +1,20 @@
 import os
 import logging
-from datetime import datetime
-from logging.handlers import RotatingFileHandler
+import threading
 from threading import current_thread
 import contextvars
+from config import settings
+from typing import Any, Dict, Tuple
+from logger.formatters import FIELDS_ATTR, JsonLineFormatter, KeyValueFormatter
+from logger.pipeline import AsyncLogPipeline, DailyRotatingFileHandler
 
 # Context variable for task id
 default_task_id = '-'
 current_task_id = contextvars.ContextVar('current_task_id', default=default_task_id)
 
+# logging.Logger.log()가 직접 받는 키워드 (나머지 키워드는 구조화 필드로 취급)
+_LOGGING_KWARGS = frozenset(('exc_info', 'stack_info', 'stacklevel', 'extra'))
+
 class TaskIdFilter(logging.Filter):
     def filter(self, record):
         record.task_id = current_task_id.get()
@@ -21,22 +27,38 @@ class ThreadLogger:
         if cls._instance is None:
             cls._instance = super(ThreadLogger, cls).__new__(cls)
             cls._instance.loggers = {}
-            cls._instance.base_log_dir = '.logs'
+            cls._instance.base_log_dir = settings.log_dir
             if not os.path.exists(cls._instance.base_log_dir):
                 os.makedirs(cls._instance.base_log_dir)
+
+            cls._instance.level = getattr(logging, settings.log_level.upper())
+
+            # 공통 포맷터 (task_id 포함) - 포맷은 기록 스레드에서 수행
+            if settings.log_format == 'json':
+                formatter = JsonLineFormatter()
+            else:
+                formatter = KeyValueFormatter(
+                    '%(asctime)s | [%(levelname)s] | task:%(task_id)s | %(threadName)s | %(name)s: %(message)s',
+                    datefmt='%Y-%m-%d %H-%M-%S'
+                )
+            pipeline = AsyncLogPipeline(
+                formatter,
+                queue_size=settings.log_queue_size,
+                batch_size=settings.log_batch_size,
+                sample_rates={
+                    logging.DEBUG: settings.log_sample_debug,
+                    logging.INFO: settings.log_sample_info
+                }
+            )
+            # task_id는 로그를 호출한 스레드의 컨텍스트에서 읽어야 하므로 큐 핸들러에 필터 부착
+            pipeline.handler.addFilter(TaskIdFilter())
+            pipeline.start()
+            cls._instance.pipeline = pipeline
         return cls._instance
 
     def __init__(self):
         pass
 
-    def _get_log_dir(self, machine_name: str = None) -> str:
-        today = datetime.now().strftime('%Y-%m-%d')
-        log_dir = os.path.join(self.base_log_dir, today)
-        if machine_name:
-            log_dir = os.path.join(log_dir, 'automation')
-        os.makedirs(log_dir, exist_ok=True)
-        return log_dir
-
     def get_normalized_thread_name(self, thread_name: str, machine_name: str = None) -> str:
         """스레드 이름을 정규화"""
         if machine_name:
@@ -65,40 +87,25 @@ class ThreadLogger:
         if normalized_name not in self.loggers:
             # 새 로거 생성
             logger = logging.getLogger(normalized_name)
-            logger.setLevel(logging.DEBUG)
+            logger.setLevel(self.level)
             
             # 이미 핸들러가 있다면 제거
             logger.handlers.clear()
-            
-            # 공통 포맷터 (task_id 포함)
-            formatter = logging.Formatter(
-                '%(asctime)s | [%(levelname)s] | task:%(task_id)s | %(threadName)s | %(name)s: %(message)s',
-                datefmt='%Y-%m-%d %H-%M-%S'
-            )
-            task_filter = TaskIdFilter()
-
-            # 콘솔 핸들러
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.DEBUG)
-            console_handler.setFormatter(formatter)
-            console_handler.addFilter(task_filter)
-            logger.addHandler(console_handler)
-            
-            # 파일 핸들러
-            log_dir = self._get_log_dir(machine_name)
-            file_name = f'{normalized_name.split("/")[-1]}.log'  # automation/name -> name.log
-            file_path = os.path.join(log_dir, file_name)
-            
-            file_handler = RotatingFileHandler(
-                file_path,
-                maxBytes=10*1024*1024,
-                backupCount=5,
+
+            # 파일 핸들러 (콘솔과 함께 기록 스레드가 사용, 자정마다 날짜 디렉터리 전환)
+            file_handler = DailyRotatingFileHandler(
+                self.base_log_dir,
+                file_name=f'{normalized_name.split("/")[-1]}.log',  # automation/name -> name.log
+                subdir='automation' if machine_name else '',
+                maxBytes=settings.log_max_bytes,
+                backupCount=settings.log_backup_count,
                 encoding='utf-8'
             )
             file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(formatter)
-            file_handler.addFilter(task_filter)
-            logger.addHandler(file_handler)
+            self.pipeline.register(normalized_name, file_handler)
+
+            # 호출 스레드는 큐에 넣기만 함 (I/O 없음)
+            logger.addHandler(self.pipeline.handler)
             
             self.loggers[normalized_name] = logger
             
@@ -108,24 +115,55 @@ class CustomLogger:
     def __init__(self):
         self.machine_name = None
         self._thread_logger = ThreadLogger()
+        # 스레드별로 해석된 로거 캐시 (machine_name이 바뀌면 다시 해석)
+        self._bound = threading.local()
 
     def set_machine(self, machine_name: str):
         """자동화 머신 이름 설정"""
         self.machine_name = machine_name
         return self
 
-    def debug(self, msg: str): 
-        self._thread_logger.get_logger(self.machine_name).debug(msg)
-    def info(self, msg: str): 
-        self._thread_logger.get_logger(self.machine_name).info(msg)
-    def warning(self, msg: str): 
-        self._thread_logger.get_logger(self.machine_name).warning(msg)
-    def error(self, msg: str): 
-        self._thread_logger.get_logger(self.machine_name).error(msg)
-    def critical(self, msg: str): 
-        self._thread_logger.get_logger(self.machine_name).critical(msg)
-    def exception(self, msg: str): 
-        self._thread_logger.get_logger(self.machine_name).exception(msg)
+    def _logger(self) -> logging.Logger:
+        """현재 스레드에 바인딩된 로거 (스레드 이름 정규화/조회는 최초 1회)"""
+        bound = self._bound
+        if getattr(bound, 'machine_name', None) != self.machine_name or not hasattr(bound, 'logger'):
+            bound.logger = self._thread_logger.get_logger(self.machine_name)
+            bound.machine_name = self.machine_name
+        return bound.logger
+
+    def is_enabled_for(self, level: int) -> bool:
+        """해당 레벨 로그가 기록되는지 여부 (비싼 값을 계산하기 전에 확인)"""
+        return self._logger().isEnabledFor(level)
+
+    def _log(self, level: int, msg: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        """
+        레벨 확인 후 로그 기록
+
+        `msg % args` is only evaluated for records that pass the level check
+        (and sampling). Keyword arguments other than the ones logging.Logger
+        accepts are attached to the record as structured fields.
+        """
+        logger = self._logger()
+        if not logger.isEnabledFor(level):
+            return
+        if kwargs.keys() - _LOGGING_KWARGS:
+            fields = {key: kwargs.pop(key) for key in list(kwargs) if key not in _LOGGING_KWARGS}
+            kwargs['extra'] = {**kwargs.get('extra', {}), FIELDS_ATTR: fields}
+        logger.log(level, msg, *args, **kwargs)
+
+    def debug(self, msg: str, *args: Any, **kwargs: Any):
+        self._log(logging.DEBUG, msg, args, kwargs)
+    def info(self, msg: str, *args: Any, **kwargs: Any):
+        self._log(logging.INFO, msg, args, kwargs)
+    def warning(self, msg: str, *args: Any, **kwargs: Any):
+        self._log(logging.WARNING, msg, args, kwargs)
+    def error(self, msg: str, *args: Any, **kwargs: Any):
+        self._log(logging.ERROR, msg, args, kwargs)
+    def critical(self, msg: str, *args: Any, **kwargs: Any):
+        self._log(logging.CRITICAL, msg, args, kwargs)
+    def exception(self, msg: str, *args: Any, **kwargs: Any):
+        kwargs.setdefault('exc_info', True)
+        self._log(logging.ERROR, msg, args, kwargs)
 
 # 전역 로거 인스턴스
 custom_logger = CustomLogger()
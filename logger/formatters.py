@@ -0,0 +1,56 @@
+"""구조화 로그 포맷터 (key=value 텍스트 / JSON lines)"""
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict
+
+# 로그 호출 시 키워드 인자로 넘긴 필드가 저장되는 LogRecord 속성
+FIELDS_ATTR = 'fields'
+
+
+def record_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    """레코드에 첨부된 구조화 필드 (없으면 빈 dict)"""
+    return getattr(record, FIELDS_ATTR, None) or {}
+
+
+class KeyValueFormatter(logging.Formatter):
+    """Text formatter that appends structured fields as `key=value` pairs."""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        message = super().formatMessage(record)
+        fields = record_fields(record)
+        if not fields:
+            return message
+        pairs = " ".join(f"{key}={value}" for key, value in fields.items())
+        return f"{message} | {pairs}"
+
+
+class JsonLineFormatter(logging.Formatter):
+    """
+    Render each record as one JSON object per line.
+
+    The message goes in `event` and structured fields are merged in at the
+    top level, so downstream tools can filter on them without parsing the
+    text. Values that are not JSON types are written with str().
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'task_id': getattr(record, 'task_id', '-'),
+            'event': record.getMessage(),
+        }
+        for key, value in record_fields(record).items():
+            # 기본 키를 덮어쓰지 않도록 충돌 시 접두사 부여
+            entry[f'field_{key}' if key in entry else key] = value
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        if record.stack_info:
+            entry['stack'] = record.stack_info
+        return json.dumps(entry, ensure_ascii=False, default=str)
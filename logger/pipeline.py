@@ -0,0 +1,270 @@
+"""비동기 로그 파이프라인 (QueueHandler → 배치 기록 스레드)"""
+import atexit
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, RotatingFileHandler
+from typing import Dict, List, Optional, TextIO
+
+# 버린 로그 요약을 기록할 로거 이름
+SUMMARY_LOGGER = 'main'
+
+
+class BatchedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that flushes once per batch instead of per record."""
+
+    def flush(self) -> None:
+        # emit()마다 호출되는 flush는 생략하고 flush_batch()에서 한 번에 처리
+        pass
+
+    def flush_batch(self) -> None:
+        """버퍼에 쌓인 기록을 디스크로 내보냄"""
+        super().flush()
+
+    def close(self) -> None:
+        self.flush_batch()
+        super().close()
+
+
+class DailyRotatingFileHandler(BatchedRotatingFileHandler):
+    """
+    Size-rotating file handler that moves to a new dated directory at midnight.
+
+    Files live at <base_dir>/<YYYY-MM-DD>/<subdir>/<file_name>. The date
+    switch is a single timestamp comparison per record, the directory is
+    created once per day, and the size check uses a running byte count
+    instead of the stat/seek/tell (and second format) that
+    RotatingFileHandler.shouldRollover does for every record.
+    """
+
+    def __init__(self, base_dir: str, file_name: str, subdir: str = '', maxBytes: int = 0,
+                 backupCount: int = 0, encoding: Optional[str] = 'utf-8') -> None:
+        """
+        Initialize DailyRotatingFileHandler.
+
+        Args:
+            base_dir: Root log directory
+            file_name: Log file name inside the dated directory
+            subdir: Optional directory below the date (e.g. "automation")
+            maxBytes: Rotate when the file reaches this size (0 disables)
+            backupCount: Number of rotated files to keep
+            encoding: File encoding
+        """
+        self.base_dir = base_dir
+        self.subdir = subdir
+        self.file_name = file_name
+        self._size = 0
+        path = self._path_for(datetime.now())
+        super().__init__(path, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding, delay=True)
+
+    def _path_for(self, moment: datetime) -> str:
+        """날짜 디렉터리를 만들고 파일 경로 반환 (하루 한 번 호출)"""
+        log_dir = os.path.join(self.base_dir, moment.strftime('%Y-%m-%d'), self.subdir)
+        os.makedirs(log_dir, exist_ok=True)
+        next_day = (moment + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.rollover_at = next_day.timestamp()
+        return os.path.abspath(os.path.join(log_dir, self.file_name))
+
+    def _open(self):
+        stream = super()._open()
+        stream.seek(0, 2)
+        self._size = stream.tell()  # 열 때 한 번만 현재 크기 확인
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.created >= self.rollover_at:
+            # 자정이 지났으면 새 날짜 디렉터리의 파일로 전환
+            if self.stream:
+                self.flush_batch()
+                self.stream.close()
+                self.stream = None
+            self.baseFilename = self._path_for(datetime.fromtimestamp(record.created))
+        super().emit(record)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        return 0 < self.maxBytes <= self._size
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._size = 0
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        self._size += len(message.encode(self.encoding or 'utf-8')) + 1
+        return message
+
+
+class BatchedStreamHandler(logging.StreamHandler):
+    """StreamHandler that flushes once per batch instead of per record."""
+
+    def flush(self) -> None:
+        pass
+
+    def flush_batch(self) -> None:
+        """버퍼에 쌓인 출력을 내보냄"""
+        super().flush()
+
+
+class SamplingQueueHandler(QueueHandler):
+    """
+    QueueHandler that never blocks the caller.
+
+    DEBUG/INFO records are sampled at the configured rates; records that do
+    not fit in the bounded queue are counted per level and reported later by
+    the writer thread instead of waiting for space.
+    """
+
+    def __init__(self, log_queue: queue.Queue, sample_rates: Dict[int, float]) -> None:
+        super().__init__(log_queue)
+        self.sample_rates = sample_rates
+        self.dropped: Dict[str, int] = {}
+        self.sampled_out = 0
+        self._dropped_lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        rate = self.sample_rates.get(record.levelno, 1.0)
+        if rate < 1.0 and random.random() >= rate:
+            self.sampled_out += 1
+            return
+        try:
+            self.queue.put_nowait(self.prepare(record))
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped[record.levelname] = self.dropped.get(record.levelname, 0) + 1
+        except Exception:
+            self.handleError(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """호출 스레드에서는 메시지 결합과 예외 문자열화만 수행 (포맷은 기록 스레드에서)"""
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def take_dropped(self) -> Dict[str, int]:
+        """누적된 버린 로그 수를 반환하고 초기화"""
+        with self._dropped_lock:
+            dropped, self.dropped = self.dropped, {}
+        return dropped
+
+
+class AsyncLogPipeline:
+    """
+    Move log formatting and file/console I/O off the calling threads.
+
+    Every logger gets the same SamplingQueueHandler. A single writer thread
+    drains the queue in batches, formats each record once, routes it to the
+    console and to the file handler registered for the record's logger name,
+    and flushes the streams once per batch.
+    """
+
+    def __init__(
+        self,
+        formatter: logging.Formatter,
+        queue_size: int = 10000,
+        batch_size: int = 256,
+        sample_rates: Optional[Dict[int, float]] = None,
+        stream: Optional[TextIO] = None
+    ) -> None:
+        """
+        Initialize AsyncLogPipeline.
+
+        Args:
+            formatter: Formatter applied on the writer thread
+            queue_size: Maximum queued records before new ones are dropped
+            batch_size: Maximum records written per flush
+            sample_rates: Level -> fraction of records kept (missing levels keep all)
+            stream: Console stream (defaults to sys.stderr)
+        """
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.batch_size = batch_size
+        self.handler = SamplingQueueHandler(self.queue, sample_rates or {})
+        self.console = BatchedStreamHandler(stream or sys.stderr)
+        self.console.setFormatter(formatter)
+        self.formatter = formatter
+        self.file_handlers: Dict[str, logging.Handler] = {}
+        self.written = 0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def register(self, logger_name: str, file_handler: logging.Handler) -> None:
+        """로거 이름별 파일 핸들러 등록"""
+        file_handler.setFormatter(self.formatter)
+        self.file_handlers[logger_name] = file_handler
+
+    def start(self) -> None:
+        """기록 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+            self._thread.start()
+            atexit.register(self.stop)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """남은 로그를 모두 기록한 뒤 기록 스레드 종료"""
+        thread = self._thread
+        if not thread or not thread.is_alive():
+            return
+        self.queue.put(None)
+        thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        """큐에서 로그를 묶음 단위로 꺼내 기록"""
+        running = True
+        while running:
+            batch: List[Optional[logging.LogRecord]] = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for record in batch:
+                if record is None:
+                    running = False
+                    continue
+                self._write(record)
+
+            self._write_drop_summary()
+            self._flush()
+
+    def _write(self, record: logging.LogRecord) -> None:
+        """한 레코드를 콘솔과 해당 로거의 파일에 기록"""
+        try:
+            self.console.handle(record)
+            file_handler = self.file_handlers.get(record.name)
+            if file_handler:
+                file_handler.handle(record)
+            self.written += 1
+        except Exception:
+            self.console.handleError(record)
+
+    def _write_drop_summary(self) -> None:
+        """큐가 가득 차 버려진 로그가 있으면 요약 한 줄 기록"""
+        dropped = self.handler.take_dropped()
+        if not dropped:
+            return
+        counts = ", ".join(f"{level}={count}" for level, count in sorted(dropped.items()))
+        record = logging.LogRecord(
+            SUMMARY_LOGGER, logging.WARNING, __file__, 0,
+            f"로그 큐가 가득 차 기록하지 못한 로그: {counts}", None, None
+        )
+        record.task_id = '-'
+        self._write(record)
+
+    def _flush(self) -> None:
+        """배치 기록 후 스트림을 한 번씩 flush"""
+        self.console.flush_batch()
+        for file_handler in list(self.file_handlers.values()):
+            flush_batch = getattr(file_handler, 'flush_batch', file_handler.flush)
+            flush_batch()
@@ -1,4 +1,5 @@
 from typing import Optional
+from utils.metrics import startup_metrics
 from logger.custom_logger import custom_logger
 from managers.automation_manager import AutomationManager
 from managers.nutrient_manager import NutrientManager
@@ -6,18 +7,22 @@ from managers.current_monitor_manager import CurrentMonitorManager
 from managers.thread_manager import ThreadManager
 from managers.resource_manager import ResourceManager
 from store import Store
+from config import settings
 
 
 def main() -> None:
+    startup_metrics.mark("imports")
     try:
         # 리소스 매니저 초기화
         resource_manager = ResourceManager()
         if not resource_manager.initialize():
             custom_logger.error("리소스 매니저 초기화 실패")
             return
-            
+        startup_metrics.mark("resources")
+
         # Store 초기화
         store = Store()
+        startup_metrics.mark("store")
         
         # ThreadManager 초기화
         thread_manager = ThreadManager()
@@ -35,12 +40,21 @@ def main() -> None:
         else:
             custom_logger.warning("센서 모니터링 초기화 실패")
 
-        # CurrentMonitorManager 초기화 및 스레드 시작
+        # CurrentMonitorManager 초기화 (폴링: 주기적 Redis 조회, 이벤트: MQTT 메시지마다 해당 기기만 검사)
         current_monitor_manager = CurrentMonitorManager(store)
-        current_monitor_thread = thread_manager.create_current_monitor_thread(current_monitor_manager)
-        thread_manager.current_monitor_threads.append(current_monitor_thread)
-        current_monitor_thread.start()
-        custom_logger.info("전류 모니터 스레드 시작 완료")
+        if settings.current_monitor_mode == "event":
+            current_monitor_manager.start_event_mode()
+        else:
+            current_monitor_thread = thread_manager.create_current_monitor_thread(current_monitor_manager)
+            thread_manager.current_monitor_threads.append(current_monitor_thread)
+            current_monitor_thread.start()
+            custom_logger.info("전류 모니터 스레드 시작 완료")
+
+        # Store 주기적 갱신 (조건부 GET으로 변경분만 적용)
+        if settings.store_refresh_interval > 0:
+            store_refresh_thread = thread_manager.create_store_refresh_thread(store)
+            thread_manager.store_refresh_threads.append(store_refresh_thread)
+            store_refresh_thread.start()
 
         # 자동화 실행
         automation_manager.run()
@@ -55,6 +69,7 @@ def main() -> None:
         if 'nutrient_manager' in locals():
             nutrient_manager.stop()
         if 'current_monitor_manager' in locals():
+            current_monitor_manager.stop()
             custom_logger.info("전류 모니터 종료")
         if 'resource_manager' in locals():
             resource_manager.cleanup()
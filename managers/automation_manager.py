@@ -1,10 +1,12 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 from logger.custom_logger import custom_logger
 from store import Store
-from models.automation import create_automation
+from models.automation import BaseAutomation, create_automation
 from managers.thread_manager import ThreadManager
 from constants import TREAD_DURATION_LIMIT
 from tabulate import tabulate
+from utils.diff import RecordDiff
+from utils.photoperiod import photoperiod
 
 class AutomationManager:
     def __init__(self, store: Store, thread_manager: ThreadManager):
@@ -16,6 +18,7 @@ class AutomationManager:
         try:
             self._init_store()
             self._start_automation_threads()
+            self.store.add_listener(self._on_store_changed)
             return True
         except Exception as e:
             custom_logger.error(f"초기화 실패: {str(e)}")
@@ -37,39 +40,20 @@ class AutomationManager:
 
         automation_table = []
 
-        for automation_data in self.store.automations:
-            try:
-                automation = create_automation(automation_data)
-                machine = next(
-                    (m for m in self.store.machines if m.machine_id == automation.device_id),
-                    None
-                )
-
-                if not machine:
-                    custom_logger.error(f"Device ID {automation.device_id}에 해당하는 machine을 찾을 수 없습니다.")
-                    continue
-
-                automation.set_machine(machine)
-
-                # Target 자동화인 경우 제어 장치 로드
-                if hasattr(automation, '_load_control_devices'):
-                    automation._load_control_devices(self.store)
-
-                thread = self.thread_manager.create_automation_thread(automation)
-                thread.start()
-                self.thread_manager.automation_threads.append(thread)
+        # LED 광주기를 먼저 구성해 Target/Interval 자동화가 첫 실행부터 사용하도록 함
+        photoperiod.load(self.store)
 
+        for automation_data in self.store.automations:
+            automation = self._register_automation(automation_data)
+            if automation:
                 # 테이블 데이터 추가
                 automation_table.append([
-                    machine.name,
+                    automation.name,
                     automation.category,
                     "Active" if automation.active else "Inactive",
                     str(automation.settings)
                 ])
 
-            except Exception as e:
-                custom_logger.error(f"자동화 스레드 생성 중 오류 발생: {str(e)}")
-
         if automation_table:
             custom_logger.info("\n" + tabulate(
                 automation_table,
@@ -77,16 +61,91 @@ class AutomationManager:
                 tablefmt="grid"
             ))
 
-        custom_logger.info(f"\n✓ 생성된 자동화 스레드 수: {len(self.thread_manager.automation_threads)}")
+        # LED 전환 시각마다 구독 자동화에 알림
+        self.thread_manager.scheduler.add(photoperiod)
+        self.thread_manager.start_automation_scheduler()
+        custom_logger.info(f"\n✓ 스케줄러에 등록된 자동화 수: {len(self.thread_manager.automation_instances)}")
+
 
+    def _register_automation(self, automation_data: dict) -> Optional[BaseAutomation]:
+        """자동화 인스턴스를 생성해 machine과 연결하고 스케줄러에 등록"""
+        try:
+            automation = create_automation(automation_data)
+            machine = self.store.get_machine(automation.device_id)
+
+            if not machine:
+                custom_logger.error(f"Device ID {automation.device_id}에 해당하는 machine을 찾을 수 없습니다.")
+                return None
+
+            automation.set_machine(machine)
+
+            # Target 자동화인 경우 제어 장치 로드
+            if hasattr(automation, '_load_control_devices'):
+                automation._load_control_devices(self.store)
+
+            self.thread_manager.schedule_automation(automation)
+            return automation
+
+        except Exception as e:
+            custom_logger.error(f"자동화 스레드 생성 중 오류 발생: {str(e)}")
+            return None
+
+    def _find_automation(self, device_id: int) -> Optional[BaseAutomation]:
+        """device_id로 실행 중인 자동화 찾기"""
+        return next(
+            (a for a in self.thread_manager.automation_instances.values() if a.device_id == device_id),
+            None
+        )
+
+    def _on_store_changed(self, store: Store, changes: Dict[str, RecordDiff]) -> None:
+        """Store 갱신으로 바뀐 설정을 실행 중인 자동화에 적용 (재시작 없음)"""
+        automation_diff = changes.get('automations')
+        if automation_diff:
+            for record in automation_diff.removed:
+                automation = self._find_automation(record['device_id']['id'])
+                if automation:
+                    self.thread_manager.unschedule_automation(automation)
+                    custom_logger.info(f"자동화 제거: {automation.name}")
+                    if automation.name and automation.name.lower() == photoperiod.device_name:
+                        photoperiod.configure(None, False)
+
+            for _, record in automation_diff.changed:
+                automation = self._find_automation(record['device_id']['id'])
+                if automation:
+                    automation.apply_settings(
+                        {k: v for k, v in record.items() if k not in ('device_id', 'id')}
+                    )
+                    # Target 자동화는 바뀐 장치 ID로 increase/decrease 장치를 다시 조회
+                    if hasattr(automation, '_load_control_devices'):
+                        automation._load_control_devices(store)
+                else:
+                    self._register_automation(record)
+
+            for record in automation_diff.added:
+                automation = self._register_automation(record)
+                if automation:
+                    custom_logger.info(f"자동화 추가: {automation.name} ({automation.category})")
+
+        machine_diff = changes.get('machines')
+        if machine_diff:
+            for _, record in machine_diff.changed:
+                automation = self._find_automation(record['id'])
+                if not automation:
+                    continue
+                automation.pin = int(record['pin'])
+                if automation.name != record['name']:
+                    custom_logger.warning(
+                        f"기기 이름 변경 감지 ({automation.name} → {record['name']}): "
+                        f"MQTT 토픽 변경은 재시작 후 적용됩니다."
+                    )
 
     def run(self):
         """메인 루프 실행"""
-        if not self.thread_manager.automation_threads:
-            custom_logger.warning("실행 중인 자동화 스레드가 없습니다.")
+        if not self.thread_manager.automation_instances:
+            custom_logger.warning("실행 중인 자동화가 없습니다.")
             return
 
-        custom_logger.info(f"\n✓ 자동화 스레드 {len(self.thread_manager.automation_threads)}개 시작 완료\n")
+        custom_logger.info(f"\n✓ 자동화 {len(self.thread_manager.automation_instances)}개 시작 완료\n")
 
         try:
             while not self.thread_manager.stop_event.is_set():
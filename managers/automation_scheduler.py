@@ -0,0 +1,245 @@
+"""Deadline-driven scheduler that runs automations on a fixed worker pool."""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+from logger.custom_logger import custom_logger
+from utils.metrics import startup_metrics
+from config import settings
+
+if TYPE_CHECKING:
+    from models.automation.base import BaseAutomation
+
+# 마감 시각이 과거로 계산되어도 바쁜 루프가 되지 않도록 하는 최소 지연 (초)
+MIN_RESCHEDULE_DELAY = 0.01
+
+
+@dataclass
+class AutomationStats:
+    """자동화별 실행 통계"""
+    runs: int = 0
+    errors: int = 0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+    max_lateness: float = 0.0
+    last_run_at: Optional[float] = None
+    next_due_at: Optional[float] = None
+
+    @property
+    def avg_duration(self) -> float:
+        """평균 control() 실행 시간 (초)"""
+        return self.total_duration / self.runs if self.runs else 0.0
+
+
+class AutomationScheduler:
+    """
+    Run every registered automation at its next due time.
+
+    Due times live in a min-heap keyed by epoch seconds. A single timer thread
+    sleeps until the earliest deadline and hands due automations to a small
+    worker pool, so the number of threads no longer grows with the number of
+    automations.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        resync_interval: Optional[float] = None,
+        stop_event: Optional[threading.Event] = None
+    ) -> None:
+        """
+        Initialize AutomationScheduler.
+
+        Args:
+            workers: Worker pool size (defaults to settings.automation_workers)
+            resync_interval: Maximum seconds between runs of the same automation
+            stop_event: Shared stop event (a private one is created if None)
+        """
+        self.workers = workers or settings.automation_workers
+        self.resync_interval = float(resync_interval or settings.automation_resync_interval)
+        self.stop_event = stop_event or threading.Event()
+
+        self._automations: Dict[str, 'BaseAutomation'] = {}
+        self._stats: Dict[str, AutomationStats] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._entry_seq: Dict[str, int] = {}  # 자동화별 유효한 힙 항목 번호
+        self._running: Set[str] = set()
+        self._requested: Dict[str, float] = {}  # 실행 중 요청된 마감 시각
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._timer_thread: Optional[threading.Thread] = None
+        self.wakeups = 0
+
+    def add(self, automation: 'BaseAutomation', due_at: Optional[float] = None) -> None:
+        """
+        자동화 등록 (기본적으로 즉시 실행 예약)
+
+        Args:
+            automation: Automation instance with a name set
+            due_at: First due time in epoch seconds (now if None)
+        """
+        with self._cond:
+            self._automations[automation.name] = automation
+            self._stats.setdefault(automation.name, AutomationStats())
+            automation.reschedule_callback = self.reschedule
+            self._push(automation.name, due_at if due_at is not None else time.time())
+
+    def remove(self, name: str) -> None:
+        """자동화 등록 해제"""
+        with self._cond:
+            automation = self._automations.pop(name, None)
+            if automation is not None:
+                automation.reschedule_callback = None
+            self._entry_seq.pop(name, None)
+            self._cond.notify()
+
+    def reschedule(self, name: str, due_at: Optional[float] = None) -> None:
+        """
+        자동화의 다음 실행 시각 변경
+
+        Args:
+            name: Automation name
+            due_at: Requested due time in epoch seconds; never postpones an earlier pending
+                run (recomputed from the automation if None)
+        """
+        with self._cond:
+            automation = self._automations.get(name)
+            if automation is None:
+                return
+            if name in self._running:
+                # 실행이 끝난 뒤 다음 마감 시각을 다시 계산한다
+                if due_at is not None:
+                    self._requested[name] = min(due_at, self._requested.get(name, due_at))
+                return
+            if due_at is None:
+                due_at = self._compute_due(automation, time.time())
+            elif name in self._entry_seq:
+                # 예약된 실행(예: 릴레이 전환 시각)이 더 이르면 그 시각을 유지
+                due_at = min(due_at, self._stats[name].next_due_at)
+            self._push(name, due_at)
+
+    def get_stats(self, name: str) -> Optional[AutomationStats]:
+        """자동화 실행 통계 조회"""
+        return self._stats.get(name)
+
+    @property
+    def automations(self) -> Dict[str, 'BaseAutomation']:
+        """등록된 자동화 (이름 → 인스턴스)"""
+        return dict(self._automations)
+
+    def start(self) -> None:
+        """타이머 스레드와 워커 풀 시작"""
+        if self._timer_thread and self._timer_thread.is_alive():
+            return
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix="AutomationWorker"
+        )
+        self._timer_thread = threading.Thread(
+            target=self._run_timer,
+            name="AutomationScheduler",
+            daemon=True
+        )
+        self._timer_thread.start()
+        custom_logger.info(
+            f"자동화 스케줄러 시작 (자동화 {len(self._automations)}개, 워커 {self.workers}개)"
+        )
+
+    def is_alive(self) -> bool:
+        """타이머 스레드 동작 여부"""
+        return bool(self._timer_thread and self._timer_thread.is_alive())
+
+    def stop(self, wait: bool = True) -> None:
+        """스케줄러 종료"""
+        self.stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._timer_thread and self._timer_thread.is_alive():
+            self._timer_thread.join()
+        if self._executor:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def _push(self, name: str, due_at: float) -> None:
+        """힙에 새 항목 추가 (호출자가 _cond를 보유해야 함)"""
+        seq = next(self._counter)
+        self._entry_seq[name] = seq
+        heapq.heappush(self._heap, (due_at, seq, name))
+        self._stats[name].next_due_at = due_at
+        self._cond.notify()
+
+    def _run_timer(self) -> None:
+        """가장 이른 마감 시각까지 대기 후 실행할 자동화를 워커에 전달"""
+        while not self.stop_event.is_set():
+            with self._cond:
+                if not self._heap:
+                    self._cond.wait(self.resync_interval)
+                    self.wakeups += 1
+                    continue
+
+                due_at, seq, name = self._heap[0]
+                delay = due_at - time.time()
+                if delay > 0:
+                    # 시스템 시계 변경에 대비해 최대 resync_interval까지만 대기
+                    self._cond.wait(min(delay, self.resync_interval))
+                    self.wakeups += 1
+                    continue
+
+                heapq.heappop(self._heap)
+                if self._entry_seq.get(name) != seq:
+                    continue  # 재스케줄로 무효화된 항목
+                del self._entry_seq[name]
+                self._running.add(name)
+
+            try:
+                self._executor.submit(self._execute, name, due_at)
+            except RuntimeError:
+                # 종료 중 워커 풀이 닫힌 경우
+                break
+
+    def _execute(self, name: str, due_at: float) -> None:
+        """워커 스레드에서 control() 실행 후 다음 마감 시각 예약"""
+        automation = self._automations.get(name)
+        stats = self._stats[name]
+        started = time.time()
+        try:
+            if automation is not None:
+                automation.control()
+                startup_metrics.mark_first_control()
+        except Exception as e:
+            stats.errors += 1
+            custom_logger.error(f"자동화 실행 오류 발생 ({name}): {str(e)}")
+        finally:
+            finished = time.time()
+            duration = finished - started
+            stats.runs += 1
+            stats.last_run_at = started
+            stats.total_duration += duration
+            stats.max_duration = max(stats.max_duration, duration)
+            stats.max_lateness = max(stats.max_lateness, started - due_at)
+
+            with self._cond:
+                self._running.discard(name)
+                requested = self._requested.pop(name, None)
+                if name in self._automations and not self.stop_event.is_set():
+                    next_due = self._compute_due(self._automations[name], finished)
+                    if requested is not None:
+                        next_due = min(next_due, max(requested, finished))
+                    self._push(name, next_due)
+
+    def _compute_due(self, automation: 'BaseAutomation', now: float) -> float:
+        """자동화가 알려준 다음 실행 시각을 epoch 초로 변환"""
+        due_at = now + self.resync_interval
+        try:
+            next_time = automation.next_run_time(datetime.fromtimestamp(now))
+            if next_time is not None:
+                due_at = min(due_at, next_time.timestamp())
+        except Exception as e:
+            custom_logger.error(f"다음 실행 시각 계산 실패 ({automation.name}): {str(e)}")
+        return max(due_at, now + MIN_RESCHEDULE_DELAY)
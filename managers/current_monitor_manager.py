@@ -1,9 +1,13 @@
 """Current Monitor Manager for detecting mismatches between current sensor and switch status."""
 
-from typing import Dict
+import threading
+import time
+from typing import Any, Dict, Optional
 from logger.custom_logger import custom_logger
+from config import settings
 from store import Store
 from resources import mqtt
+from resources.mqtt import DispatchedMessage
 from resources.redis import redis_client
 
 
@@ -21,6 +25,14 @@ class CurrentMonitorManager:
         self.last_warnings: Dict[str, bool] = {}  # Track last warning state to avoid spam
         self.mismatch_counts: Dict[str, int] = {}  # Track consecutive mismatch counts
         self.max_mismatch_count = 3  # 3번 연속 불일치 시 동기화
+        # 이벤트 모드에서 사용하는 기기별 최신 상태 {"current": bool, "switch": bool}
+        self.device_states: Dict[str, Dict[str, Optional[bool]]] = {}
+        self.event_mode = False
+        # 이벤트 모드: 불일치를 처음 본 시각과 기기별 1회성 확인 타이머
+        self.confirm_seconds = settings.current_mismatch_confirm_seconds
+        self.mismatch_since: Dict[str, float] = {}
+        self._confirm_timers: Dict[str, threading.Timer] = {}
+        self._state_lock = threading.Lock()
         custom_logger.info("CurrentMonitorManager 초기화 완료")
 
     def check_current_mismatch(self) -> None:
@@ -30,84 +42,88 @@ class CurrentMonitorManager:
         Logs warnings and publishes MQTT switch messages to sync status after 3 consecutive mismatches.
         """
         try:
-            # Redis에서 개별 current와 switch 값을 가져옴
             # 형식: switch/<device_name> = "true" 또는 "false"
             #      current/<device_name> = "true" 또는 "false"
+            machines = list(self.store.machines)
 
-            # Store의 machines로부터 디바이스 목록 가져오기
-            for machine in self.store.machines:
-                device_name = machine.name
-
-                # Redis에서 current 값 가져오기 (redis_client.get()는 직접 문자열 반환)
-                current_key = f"current/{device_name}"
-                current_str = redis_client.get(current_key)
+            # 모든 기기의 current/switch 키를 한 번의 MGET 왕복으로 조회
+            keys = []
+            for machine in machines:
+                keys.append(f"current/{machine.name}")
+                keys.append(f"switch/{machine.name}")
+            values = redis_client.get_many(keys)
 
+            for index, machine in enumerate(machines):
+                current_str = values[2 * index]
                 if current_str is None:
                     # current 센서가 없는 디바이스는 건너뜀
                     continue
 
-                # 문자열을 boolean으로 변환
-                current_value = current_str.lower() == 'true'
-
-                # Redis에서 switch 상태 가져오기
-                switch_key = f"switch/{device_name}"
-                switch_str = redis_client.get(switch_key)
+                switch_str = values[2 * index + 1]
 
-                # switch 값이 없으면 기본값 False 사용
+                # 문자열을 boolean으로 변환 (switch 값이 없으면 기본값 False 사용)
+                current_value = current_str.lower() == 'true'
                 switch_value = switch_str.lower() == 'true' if switch_str else False
 
-                # current 값과 switch 상태 비교
-                if current_value != switch_value:
-                    # 불일치 카운트 증가
-                    if device_name not in self.mismatch_counts:
-                        self.mismatch_counts[device_name] = 1
-                    else:
-                        self.mismatch_counts[device_name] += 1
-
-                    mismatch_count = self.mismatch_counts[device_name]
-
-                    # 첫 불일치 감지 시 로그
-                    if mismatch_count == 1:
-                        custom_logger.warning(
-                            f"⚠️  전류 센서와 스위치 상태 불일치 감지 (1/{self.max_mismatch_count})\n"
-                            f"   기기: {device_name}\n"
-                            f"   전류 센서: {'ON (전류 감지됨)' if current_value else 'OFF (전류 없음)'}\n"
-                            f"   스위치 상태: {'ON' if switch_value else 'OFF'}"
-                        )
-                    # 2번째 불일치
-                    elif mismatch_count == 2:
-                        custom_logger.warning(
-                            f"⚠️  전류 센서와 스위치 상태 불일치 계속됨 (2/{self.max_mismatch_count})\n"
-                            f"   기기: {device_name}"
-                        )
-                    # 3번째 불일치 시 동기화
-                    elif mismatch_count >= self.max_mismatch_count:
-                        custom_logger.warning(
-                            f"🔄 전류 센서와 스위치 상태 불일치 {self.max_mismatch_count}번 연속 감지!\n"
-                            f"   기기: {device_name}\n"
-                            f"   전류 센서: {'ON (전류 감지됨)' if current_value else 'OFF (전류 없음)'}\n"
-                            f"   스위치 상태: {'ON' if switch_value else 'OFF'}\n"
-                            f"   → 스위치 상태를 전류 센서 값에 맞게 동기화합니다."
-                        )
-                        # switch 상태를 current 값에 맞게 동기화
-                        self._sync_switch_status(machine, current_value)
-                        # 카운트 초기화
-                        self.mismatch_counts[device_name] = 0
-                        self.last_warnings[device_name] = current_value
-                else:
-                    # 상태가 일치하면 카운트 초기화
-                    if device_name in self.mismatch_counts:
-                        # 불일치 카운트가 있었다면 일치 로그 출력
-                        if self.mismatch_counts[device_name] > 0:
-                            custom_logger.info(
-                                f"✓ 전류 센서와 스위치 상태 일치 확인: {device_name}"
-                            )
-                        del self.mismatch_counts[device_name]
-                    if device_name in self.last_warnings:
-                        del self.last_warnings[device_name]
+                self._evaluate_device(machine, current_value, switch_value)
 
         except Exception as e:
-            custom_logger.error(f"전류 센서 모니터링 중 오류 발생: {str(e)}")
+            custom_logger.error("전류 센서 모니터링 중 오류 발생: %s", e)
+
+    def _evaluate_device(self, machine, current_value: bool, switch_value: bool) -> None:
+        """
+        Run the mismatch state machine for a single device.
+
+        Args:
+            machine: BaseMachine object
+            current_value: Current sensor state (True=current detected)
+            switch_value: Switch state (True=ON)
+        """
+        device_name = machine.name
+
+        # current 값과 switch 상태 비교
+        if current_value != switch_value:
+            # 불일치 카운트 증가
+            if device_name not in self.mismatch_counts:
+                self.mismatch_counts[device_name] = 1
+            else:
+                self.mismatch_counts[device_name] += 1
+
+            mismatch_count = self.mismatch_counts[device_name]
+
+            # 첫 불일치 감지 시 로그
+            if mismatch_count == 1:
+                custom_logger.warning(
+                    "⚠️  전류 센서와 스위치 상태 불일치 감지 (1/%d)", self.max_mismatch_count,
+                    device=device_name, current=current_value, switch=switch_value
+                )
+            # 2번째 불일치
+            elif mismatch_count == 2:
+                custom_logger.warning(
+                    "⚠️  전류 센서와 스위치 상태 불일치 계속됨 (2/%d)", self.max_mismatch_count,
+                    device=device_name
+                )
+            # 3번째 불일치 시 동기화
+            elif mismatch_count >= self.max_mismatch_count:
+                custom_logger.warning(
+                    "🔄 전류 센서와 스위치 상태 불일치 %d번 연속 감지! 스위치 상태를 전류 센서 값에 맞게 동기화합니다.",
+                    self.max_mismatch_count,
+                    device=device_name, current=current_value, switch=switch_value
+                )
+                # switch 상태를 current 값에 맞게 동기화
+                self._sync_switch_status(machine, current_value)
+                # 카운트 초기화
+                self.mismatch_counts[device_name] = 0
+                self.last_warnings[device_name] = current_value
+        else:
+            # 상태가 일치하면 카운트 초기화
+            if device_name in self.mismatch_counts:
+                # 불일치 카운트가 있었다면 일치 로그 출력
+                if self.mismatch_counts[device_name] > 0:
+                    custom_logger.info("✓ 전류 센서와 스위치 상태 일치 확인: %s", device_name)
+                del self.mismatch_counts[device_name]
+            if device_name in self.last_warnings:
+                del self.last_warnings[device_name]
 
     def _sync_switch_status(self, machine, target_status: bool) -> None:
         """
@@ -116,6 +132,9 @@ class CurrentMonitorManager:
         Args:
             machine: BaseMachine object
             target_status: Target status from current sensor (True=ON, False=OFF)
+
+        Returns:
+            bool: True if the switch message was published
         """
         try:
             # machine.mqtt_topic은 이미 "switch/{name}" 형식
@@ -132,21 +151,186 @@ class CurrentMonitorManager:
 
             if mqtt.publish_message(topic, payload):
                 custom_logger.info(
-                    f"✓ 스위치 동기화 MQTT 발행 성공: {machine.name} → "
-                    f"{'ON' if target_status else 'OFF'}"
+                    "✓ 스위치 동기화 MQTT 발행 성공: %s", machine.name, status=target_status
                 )
                 # 로컬 machine 상태도 업데이트 (1 for ON, 0 for OFF)
                 machine.set_status(1 if target_status else 0)
-            else:
-                custom_logger.error(
-                    f"✗ 스위치 동기화 MQTT 발행 실패: {machine.name}"
-                )
+                return True
+            custom_logger.error("✗ 스위치 동기화 MQTT 발행 실패: %s", machine.name)
+            return False
+
+        except Exception as e:
+            custom_logger.error("스위치 동기화 중 오류 발생 (%s): %s", machine.name, e)
+            return False
+
+    def start_event_mode(self) -> None:
+        """
+        Switch to event-driven mismatch detection.
+
+        Seeds the state table with one batched Redis read, then keeps it up to
+        date from current/# and switch/# MQTT messages. Only the device named
+        in a message is checked. A new mismatch is logged at once and a one-off
+        check is scheduled CURRENT_MISMATCH_CONFIRM_SECONDS after it was first
+        seen; the switch is synced only if the mismatch is still there then.
+        A matching message or a new switch command cancels the pending check.
+        No Redis polling or periodic scan is done in this mode.
+        """
+        machines = list(self.store.machines)
+        keys = []
+        for machine in machines:
+            keys.append(f"current/{machine.name}")
+            keys.append(f"switch/{machine.name}")
+        values = redis_client.get_many(keys)
+
+        with self._state_lock:
+            for index, machine in enumerate(machines):
+                self.device_states[machine.name] = {
+                    "current": self._parse_state(values[2 * index]),
+                    "switch": self._parse_state(values[2 * index + 1])
+                }
+
+        mqtt.dispatcher.add("current/#", self._on_current_message)
+        mqtt.dispatcher.add("switch/#", self._on_switch_message)
+        self.event_mode = True
+        custom_logger.info("전류 모니터 이벤트 모드 시작 (기기 %d개)", len(machines))
+
+        # 시작 시점에 이미 불일치인 기기도 확인 예약
+        for device_name in list(self.device_states):
+            self._check_device(device_name)
+
+    def stop(self) -> None:
+        """예약된 불일치 확인 취소"""
+        with self._state_lock:
+            for device_name in list(self._confirm_timers):
+                self._cancel_confirmation(device_name)
+
+    def _on_current_message(self, message: DispatchedMessage) -> None:
+        """current/<name> 수신 시 상태 테이블 갱신 후 해당 기기 검사"""
+        try:
+            current_value = self._parse_state(message.value)
+            if current_value is None:
+                return
+            self._on_state_message(message.name, "current", current_value)
+
+        except Exception as e:
+            custom_logger.error("전류 메시지 처리 실패 (%s): %s", message.topic, e)
+
+    def _on_switch_message(self, message: DispatchedMessage) -> None:
+        """switch/<name> 수신 시 상태 테이블 갱신 후 해당 기기 검사"""
+        try:
+            switch_value = self._parse_state(message.value)
+            if switch_value is None:
+                return
+            self._on_state_message(message.name, "switch", switch_value)
 
         except Exception as e:
-            custom_logger.error(
-                f"스위치 동기화 중 오류 발생 ({machine.name}): {str(e)}"
+            custom_logger.error("스위치 메시지 처리 실패 (%s): %s", message.topic, e)
+
+    def _on_state_message(self, device_name: str, field: str, value: bool) -> None:
+        """상태 테이블의 한 필드를 갱신하고 해당 기기만 검사"""
+        with self._state_lock:
+            state = self.device_states.setdefault(device_name, {"current": None, "switch": None})
+            if field == "switch" and state["switch"] != value:
+                # 새 스위치 명령이므로 확인 구간을 처음부터 다시 시작
+                self._cancel_confirmation(device_name)
+            state[field] = value
+        self._check_device(device_name)
+
+    def _check_device(self, device_name: str) -> None:
+        """
+        Start or clear the mismatch confirmation for one device.
+
+        A new mismatch records when it was first seen and schedules
+        _confirm_mismatch() at first_seen + confirm_seconds; a match cancels
+        the pending confirmation.
+        """
+        with self._state_lock:
+            state = self.device_states.get(device_name)
+            if state is None or state["current"] is None:
+                # current 센서가 없는 디바이스는 건너뜀
+                return
+            current_value, switch_value = state["current"], bool(state["switch"])
+
+            if current_value == switch_value:
+                resolved = self._cancel_confirmation(device_name)
+                self.last_warnings.pop(device_name, None)
+                if resolved:
+                    custom_logger.info("✓ 전류 센서와 스위치 상태 일치 확인: %s", device_name)
+                return
+
+            if device_name in self.mismatch_since or self._find_machine(device_name) is None:
+                return  # 이미 확인 예약됨 / 등록되지 않은 기기
+            first_seen = time.monotonic()
+            self.mismatch_since[device_name] = first_seen
+            timer = threading.Timer(self.confirm_seconds, self._confirm_mismatch, args=(device_name, first_seen))
+            timer.daemon = True
+            timer.name = f"CurrentConfirm-{device_name}"
+            self._confirm_timers[device_name] = timer
+            timer.start()
+
+        custom_logger.warning(
+            "⚠️  전류 센서와 스위치 상태 불일치 감지 (%.1f초 후 재확인)", self.confirm_seconds,
+            device=device_name, current=current_value, switch=switch_value
+        )
+
+    def _cancel_confirmation(self, device_name: str) -> bool:
+        """예약된 불일치 확인 취소 (self._state_lock 보유 상태에서 호출, 예약이 있었으면 True)"""
+        timer = self._confirm_timers.pop(device_name, None)
+        if timer is not None:
+            timer.cancel()
+        return self.mismatch_since.pop(device_name, None) is not None
+
+    def _confirm_mismatch(self, device_name: str, first_seen: float) -> None:
+        """확인 구간이 지난 뒤에도 불일치가 남아 있으면 스위치 상태를 전류 센서 값에 맞게 동기화"""
+        try:
+            with self._state_lock:
+                if self.mismatch_since.get(device_name) != first_seen:
+                    return  # 그 사이 해소되었거나 새 스위치 명령으로 다시 시작됨
+                del self.mismatch_since[device_name]
+                self._confirm_timers.pop(device_name, None)
+                state = self.device_states.get(device_name) or {}
+                current_value, switch_value = state.get("current"), bool(state.get("switch"))
+            if current_value is None or current_value == switch_value:
+                return
+            machine = self._find_machine(device_name)
+            if machine is None:
+                return
+
+            custom_logger.warning(
+                "🔄 전류 센서와 스위치 상태 불일치가 %.1f초 동안 지속! 스위치 상태를 전류 센서 값에 맞게 동기화합니다.",
+                time.monotonic() - first_seen,
+                device=device_name, current=current_value, switch=switch_value
             )
+            if self._sync_switch_status(machine, current_value):
+                self.last_warnings[device_name] = current_value
+            else:
+                # 발행 실패 시 다음 확인 예약
+                self._check_device(device_name)
+
+        except Exception as e:
+            custom_logger.error("전류 센서 불일치 확인 중 오류 발생 (%s): %s", device_name, e)
+
+    def _find_machine(self, device_name: str):
+        """이름으로 machine 찾기"""
+        return self.store.get_machine_by_name(device_name)
+
+    @staticmethod
+    def _parse_state(value: Any) -> Optional[bool]:
+        """Redis/MQTT 상태 값을 boolean으로 변환 (알 수 없으면 None)"""
+        if value is None:
+            return None
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, (int, float)):
+            return value != 0
+        text = str(value).strip().lower()
+        if text in ('true', '1', 'on'):
+            return True
+        if text in ('false', '0', 'off'):
+            return False
+        return None
 
     def run(self) -> None:
-        """Run current monitoring check."""
-        self.check_current_mismatch()
+        """Run current monitoring check (폴링 모드 전용, 이벤트 모드는 MQTT 메시지로 검사)."""
+        if not self.event_mode:
+            self.check_current_mismatch()
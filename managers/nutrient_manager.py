@@ -16,6 +16,7 @@ from config import settings
 
 try:
     from drivers.AtlasI2C import AtlasI2C
+    from drivers.atlas_reader import AtlasReadScheduler, query_all, STATUS_SUCCESS
     ATLAS_AVAILABLE = True
 except ImportError:
     custom_logger.warning("AtlasI2C module not available. Sensor readings will be simulated.")
@@ -48,6 +49,7 @@ class NutrientManager:
         self.thread_manager = thread_manager
         self.nutrient_thread: Optional[object] = None
         self.atlas_devices: List = []
+        self.atlas_reader: Optional['AtlasReadScheduler'] = None
         self.last_readings: Dict[str, float] = {}
         custom_logger.info("NutrientManager initialized")
 
@@ -63,6 +65,11 @@ class NutrientManager:
             if ATLAS_AVAILABLE:
                 self._discover_atlas_devices()
                 if self.atlas_devices:
+                    self.atlas_reader = AtlasReadScheduler(
+                        self.atlas_devices,
+                        poll_interval=settings.atlas_poll_interval,
+                        timeout=settings.atlas_read_timeout
+                    )
                     custom_logger.info(f"Found {len(self.atlas_devices)} Atlas sensor(s)")
                 else:
                     custom_logger.info("No Atlas sensors found")
@@ -83,18 +90,34 @@ class NutrientManager:
 
         device = AtlasI2C()
         device_address_list = device.list_i2c_devices()
+        device.close()
+
+        # 주소별로 명령마다 고정 대기하던 방식 대신 모든 장치에 한 번에 보내고 준비된 것부터 수집
+        probes = [AtlasI2C(address=address) for address in device_address_list]
+        poll_options = dict(
+            poll_delay=AtlasI2C.SHORT_TIMEOUT,
+            poll_interval=settings.atlas_poll_interval,
+            timeout=settings.atlas_read_timeout,
+            stop_event=self.thread_manager.stop_event
+        )
+        try:
+            info = query_all(probes, "I", **poll_options)
+            identified = [probe for probe in probes if info[probe.address][0] == STATUS_SUCCESS]
+            names = query_all(identified, "name,?", **poll_options)
 
-        for address in device_address_list:
-            device.set_i2c_address(address)
-            response = device.query("I")
-            try:
-                moduletype = response.split(",")[1]
-                name = device.query("name,?").split(",")[1]
-                atlas_device = AtlasI2C(address=address, moduletype=moduletype, name=name)
+            for probe in identified:
+                try:
+                    moduletype = info[probe.address][1].split(",")[1]
+                    name_status, name_payload = names[probe.address]
+                    name = name_payload.split(",")[1] if name_status == STATUS_SUCCESS else ""
+                except IndexError:
+                    continue
+                atlas_device = AtlasI2C(address=probe.address, moduletype=moduletype, name=name)
                 self.atlas_devices.append(atlas_device)
-                custom_logger.info(f"Discovered Atlas sensor: {moduletype} at address {address}")
-            except IndexError:
-                continue
+                custom_logger.info(f"Discovered Atlas sensor: {moduletype} at address {probe.address}")
+        finally:
+            for probe in probes:
+                probe.close()
 
     def _start_nutrient_threads(self) -> None:
         """Start nutrient monitoring threads."""
@@ -113,27 +136,14 @@ class NutrientManager:
         results = {}
 
         # Read Atlas I2C sensors (pH, EC, water_temperature)
-        if ATLAS_AVAILABLE and self.atlas_devices:
+        if ATLAS_AVAILABLE and self.atlas_reader:
             try:
-                # Send read command to all devices
-                for dev in self.atlas_devices:
-                    dev.write("R")
-
-                # Wait for sensors to respond
-                time.sleep(AtlasI2C.LONG_TIMEOUT)
-
-                # Read responses
-                for dev in self.atlas_devices:
-                    response_str = dev.read()
-
-                    try:
-                        # Parse response (format: "Success <device_info>: <value>")
-                        value_str = response_str.split(':')[-1].strip().split('\x00')[0]
-                        value = float(value_str)
-                        sensor_name = self._get_sensor_name(dev.moduletype)
-                        results[sensor_name] = value
-                    except (ValueError, IndexError) as err:
-                        custom_logger.error(f"Error reading {dev.moduletype}: {err}")
+                # 모든 장치에 읽기 명령을 보내고 준비된 장치부터 수집 (고정 LONG_TIMEOUT 대기 없음)
+                for reading in self.atlas_reader.read_cycle(self.thread_manager.stop_event):
+                    if reading.ok:
+                        results[self._get_sensor_name(reading.moduletype)] = reading.value
+                    else:
+                        custom_logger.error(f"Error reading {reading.moduletype}: status {reading.status}")
 
             except Exception as e:
                 custom_logger.error(f"Error reading Atlas sensors: {e}")
@@ -285,26 +295,23 @@ class NutrientManager:
             "water_temperature": "environment/water_temperature",
         }
 
-        timestamp = time.time()
-
+        messages = []
         for sensor_name, value in readings.items():
-            try:
-                # 매핑된 토픽이 있는 경우에만 전송
-                if sensor_name in sensor_topic_mapping:
-                    topic = sensor_topic_mapping[sensor_name]
-                    payload = {
-                        "pattern": topic,
-                        "data": {
-                            "name": sensor_name.lower(),
-                            "value": value
-                        }
+            # 매핑된 토픽이 있는 경우에만 전송
+            if sensor_name in sensor_topic_mapping:
+                topic = sensor_topic_mapping[sensor_name]
+                payload = {
+                    "pattern": topic,
+                    "data": {
+                        "name": sensor_name.lower(),
+                        "value": value
                     }
+                }
+                messages.append((topic, payload))
 
-                    mqtt.publish_message(topic, payload)
-                    # custom_logger.debug(f"{sensor_name} 데이터 전송 완료: {value} -> {topic}")
-
-            except Exception as e:
-                custom_logger.error(f"{sensor_name} 데이터 전송 실패: {e}")
+        # 한 번에 발행 큐에 추가
+        if messages and mqtt.publish_many(messages) < len(messages):
+            custom_logger.error(f"센서 데이터 일부 전송 실패: {', '.join(topic for topic, _ in messages)}")
 
     def adjust_water_tank(
         self,
@@ -615,14 +622,10 @@ class NutrientManager:
         Returns:
             Machine object or None
         """
-        if not self.store or not self.store.machines:
+        if not self.store:
             return None
 
-        for machine in self.store.machines:
-            if machine.name.lower() == name.lower():
-                return machine
-
-        return None
+        return self.store.get_machine_by_name(name, ignore_case=True)
 
     def _get_sensor_by_name(self, name: str):
         """
@@ -724,6 +727,7 @@ class NutrientManager:
                     custom_logger.error(f"Error closing device: {e}")
 
             self.atlas_devices.clear()
+            self.atlas_reader = None
             custom_logger.info("NutrientManager cleanup completed")
         except Exception as e:
             custom_logger.error(f"Error during cleanup: {e}")
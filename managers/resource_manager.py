@@ -1,9 +1,9 @@
 """Resource manager for external connections (MQTT, Redis)."""
 
-import time
 from typing import Optional
 from logger.custom_logger import custom_logger
-from resources import redis, mqtt
+from resources import redis, mqtt, http
+from utils.timeseries import timeseries
 
 
 class ResourceManager:
@@ -26,11 +26,20 @@ class ResourceManager:
         try:
             custom_logger.info("리소스 초기화 중...")
 
-            # Start MQTT loop
-            mqtt.client.loop_start()
+            # 핸들러 워커 풀을 먼저 시작해 paho 네트워크 스레드는 큐에만 넣도록 함
+            mqtt.dispatcher.start()
+
+            # 발행 스레드 시작 (이후 publish_message는 큐에 넣기만 함)
+            mqtt.publisher.start()
+
+            # 센서/전류 메시지를 시계열 링 버퍼에 기록
+            timeseries.attach(mqtt.dispatcher)
+
+            # 백그라운드 연결 시작 (재연결은 MQTTConnectionManager가 지터 백오프로 처리)
+            mqtt.start()
 
             # Wait for MQTT connection
-            if self._wait_for_mqtt_connection(timeout):
+            if mqtt.wait_until_connected(timeout):
                 self.mqtt_connected = True
                 custom_logger.info("MQTT 브로커 연결 완료")
             else:
@@ -50,23 +59,6 @@ class ResourceManager:
             custom_logger.error(f"리소스 초기화 실패: {str(e)}", exc_info=True)
             return False
 
-    def _wait_for_mqtt_connection(self, timeout: int) -> bool:
-        """
-        Wait for MQTT connection to establish.
-
-        Args:
-            timeout: Maximum wait time in seconds
-
-        Returns:
-            bool: True if connected within timeout
-        """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if mqtt.client.is_connected():
-                return True
-            time.sleep(0.1)
-        return False
-
     def _verify_redis_connection(self) -> bool:
         """
         Verify Redis connection is working.
@@ -90,5 +82,6 @@ class ResourceManager:
             if self.mqtt_connected:
                 mqtt.disconnect()
                 custom_logger.info("MQTT 연결 해제 완료")
+            http.close()
         except Exception as e:
             custom_logger.error(f"리소스 정리 중 오류: {str(e)}", exc_info=True) 
\ No newline at end of file
@@ -3,38 +3,40 @@ import time
 from typing import List, Dict
 from logger.custom_logger import custom_logger
 from models.automation.base import BaseAutomation
+from managers.automation_scheduler import AutomationScheduler
 from threading import Event
 from tabulate import tabulate
 from datetime import datetime
 from config import settings
+from resources import mqtt
+from utils.timeseries import timeseries
 
 class ThreadManager:
     def __init__(self):
-        self.automation_threads: List[threading.Thread] = []
         self.nutrient_threads: List[threading.Thread] = []
         self.current_monitor_threads: List[threading.Thread] = []
+        self.store_refresh_threads: List[threading.Thread] = []
         self.stop_event = Event()
         self.automation_instances: Dict[str, BaseAutomation] = {}
+        self.scheduler = AutomationScheduler(stop_event=self.stop_event)
         self.last_status_report = time.time()
 
-    def create_automation_thread(self, automation: BaseAutomation) -> threading.Thread:
-        """자동화 스레드 생성"""
+    def schedule_automation(self, automation: BaseAutomation) -> None:
+        """자동화를 스케줄러에 등록 (스레드를 따로 만들지 않음)"""
         # 자동화 인스턴스 저장
         self.automation_instances[automation.name] = automation
+        self.scheduler.add(automation)
 
-        def run_automation():
-            try:
-                while not self.stop_event.is_set():
-                    automation.control()
-                    self.stop_event.wait(settings.automation_interval)
-            except Exception as e:
-                custom_logger.error(f"자동화 스레드 오류 발생: {str(e)}")
+    def unschedule_automation(self, automation: BaseAutomation) -> None:
+        """자동화를 스케줄러에서 제거하고 비활성화"""
+        automation.active = False
+        automation.remove_mqtt_subscription()
+        self.scheduler.remove(automation.name)
+        self.automation_instances.pop(automation.name, None)
 
-        return threading.Thread(
-            target=run_automation,
-            name=f"Automation-{automation.name}",
-            daemon=True
-        )
+    def start_automation_scheduler(self) -> None:
+        """자동화 스케줄러 시작"""
+        self.scheduler.start()
 
     def create_nutrient_thread(self, nutrient_manager) -> threading.Thread:
         """영양소 스레드 생성"""
@@ -68,16 +70,27 @@ class ThreadManager:
             daemon=True
         )
 
-    def monitor_threads(self):
-        """스레드 상태 모니터링 및 상태 리포트"""
-        # 죽은 스레드 확인
-        active_threads = [t for t in self.automation_threads if t.is_alive()]
-        terminated = len(self.automation_threads) - len(active_threads)
+    def create_store_refresh_thread(self, store) -> threading.Thread:
+        """Store 갱신 스레드 생성"""
+        def run_store_refresh():
+            while not self.stop_event.wait(settings.store_refresh_interval):
+                try:
+                    store.refresh()
+                except Exception as e:
+                    custom_logger.error(f"Store 갱신 오류 발생: {str(e)}")
 
-        if terminated > 0:
-            custom_logger.warning(f"{terminated}개의 자동화 스레드가 종료됨")
+        return threading.Thread(
+            target=run_store_refresh,
+            name="StoreRefresh",
+            daemon=True
+        )
 
-        self.automation_threads = active_threads
+    def monitor_threads(self):
+        """스레드 상태 모니터링 및 상태 리포트"""
+        # 스케줄러 스레드 확인
+        if self.automation_instances and not self.scheduler.is_alive() and not self.stop_event.is_set():
+            custom_logger.warning("자동화 스케줄러가 종료되어 다시 시작합니다")
+            self.scheduler.start()
 
         # 1분마다 상태 리포트 출력
         current_time = time.time()
@@ -103,12 +116,18 @@ class ThreadManager:
             # 남은 시간 계산
             next_change_time = self._get_next_change_time(automation)
 
+            stats = self.scheduler.get_stats(name)
+            runs = stats.runs if stats else 0
+            avg_ms = f"{stats.avg_duration * 1000:.1f}" if stats else "-"
+
             status_data.append([
                 name,
                 automation.category,
                 active_status,
                 status,
-                next_change_time
+                next_change_time,
+                runs,
+                avg_ms
             ])
 
         print(f"\n╔{'═' * 58}╗")
@@ -116,61 +135,72 @@ class ThreadManager:
         print(f"╚{'═' * 58}╝\n")
         print(tabulate(
             status_data,
-            headers=["Device", "Category", "Active", "Status", "Next Change"],
+            headers=["Device", "Category", "Active", "Status", "Next Change", "Runs", "Avg(ms)"],
             tablefmt="grid"
         ))
         print()
+        self._print_trend_report()
+        custom_logger.info(f"MQTT 디스패치: {mqtt.dispatcher.report()}")
+        custom_logger.info(f"MQTT 발행: {mqtt.publisher.report()}")
+        custom_logger.info(f"MQTT 연결: {mqtt.connection.report()}")
+
+    def _print_trend_report(self):
+        """시계열 링 버퍼 기준 센서 추세 출력 (백엔드 조회 없음)"""
+        window = settings.timeseries_trend_window
+        now = time.time()
+        trend_data = []
+        for name in timeseries.names():
+            stats = timeseries.stats(name, window, now)
+            if stats is None:
+                continue
+            trend_data.append([
+                name,
+                f"{stats.last:.2f}",
+                f"{stats.mean:.2f}",
+                f"{stats.min:.2f} ~ {stats.max:.2f}",
+                f"{stats.slope:+.3f}",
+                stats.count
+            ])
+        if not trend_data:
+            return
+
+        print(tabulate(
+            trend_data,
+            headers=["Series", "Last", f"Mean({window}s)", "Min ~ Max", "Slope/min", "Samples"],
+            tablefmt="grid"
+        ))
+        print()
+        custom_logger.debug(
+            "시계열 메모리: %d / %d bytes (거부 %d건)",
+            timeseries.memory_bytes, timeseries.memory_budget, timeseries.rejected
+        )
 
     def _get_next_change_time(self, automation) -> str:
         """다음 상태 변경까지 남은 시간 계산"""
         try:
-            # interval 타입 - 타이머 확인
-            if automation.category == "interval" and hasattr(automation, 'state') and automation.state:
-                if hasattr(automation.state, 'timers'):
-                    now = datetime.now()
-
-                    # 현재 상태에 따라 다음 타이머 확인
-                    # ON 상태면 OFF 타이머, OFF 상태면 ON 타이머
-                    is_on = bool(automation.status)
-                    scheduled_time = automation.state.timers.get_scheduled_time(is_on=not is_on)
-
-                    if scheduled_time and scheduled_time > now:
-                        remaining_seconds = (scheduled_time - now).total_seconds()
-                        if remaining_seconds >= 60:
-                            return f"{int(remaining_seconds / 60)}분"
-                        else:
-                            return f"{int(remaining_seconds)}초"
-
-            # range 타입 - 시작/종료 타이머 확인
-            elif automation.category == "range" and hasattr(automation, 'timers'):
-                now = datetime.now()
-
-                # 시작/종료 타이머 확인
-                for is_on in [True, False]:
-                    scheduled_time = automation.timers.get_scheduled_time(is_on=is_on)
-                    if scheduled_time and scheduled_time > now:
-                        remaining_seconds = (scheduled_time - now).total_seconds()
-                        if remaining_seconds >= 60:
-                            return f"{int(remaining_seconds / 60)}분"
-                        else:
-                            return f"{int(remaining_seconds)}초"
-
             # target 타입 - 센서값 기반이므로 예측 불가
-            elif automation.category == "target":
+            if automation.category == "target":
                 return "센서 기반"
 
+            # interval/range 타입 - 자동화가 계산한 다음 전환 시각 확인
+            now = datetime.now()
+            scheduled_time = automation.next_run_time(now)
+            if scheduled_time and scheduled_time > now:
+                remaining_seconds = (scheduled_time - now).total_seconds()
+                if remaining_seconds >= 60:
+                    return f"{int(remaining_seconds / 60)}분"
+                else:
+                    return f"{int(remaining_seconds)}초"
+
             return "-"
 
         except Exception as e:
             return "-"
 
     def stop_automation_threads(self):
-        """자동화 스레드만 종료"""
+        """자동화 스케줄러만 종료"""
         self.stop_event.set()
-        for thread in self.automation_threads:
-            if thread.is_alive():
-                thread.join()
-        self.automation_threads.clear()
+        self.scheduler.stop()
 
     def stop_nutrient_threads(self):
         """영양소 스레드만 종료"""
@@ -188,9 +218,18 @@ class ThreadManager:
                 thread.join()
         self.current_monitor_threads.clear()
 
+    def stop_store_refresh_threads(self):
+        """Store 갱신 스레드만 종료"""
+        self.stop_event.set()
+        for thread in self.store_refresh_threads:
+            if thread.is_alive():
+                thread.join()
+        self.store_refresh_threads.clear()
+
     def stop_all(self):
         """모든 스레드 종료"""
         self.stop_event.set()
         self.stop_automation_threads()
         self.stop_nutrient_threads()
-        self.stop_current_monitor_threads() 
+        self.stop_current_monitor_threads()
+        self.stop_store_refresh_threads() 
@@ -1,10 +1,17 @@
-from typing import Optional, List
+from typing import Optional
 from datetime import datetime
 from settings.mqtt_topics import MQTTTopics
 
 
 class BaseMachine:
-    """Base machine representation for automation system."""
+    """Base machine representation for automation system.
+
+    Uses __slots__ so each device carries no per-instance __dict__; the Store
+    keeps one instance per device and automations share it instead of
+    building a new object on every control() call.
+    """
+
+    __slots__ = ("machine_id", "name", "mqtt_topic", "pin", "status", "switch_created_at")
 
     def __init__(
         self,
@@ -23,7 +30,7 @@ class BaseMachine:
 
     def __str__(self) -> str:
         """객체를 문자열로 표현할 때 사용"""
-        return f"BaseMachine({', '.join(f'{k}={v}' for k, v in self.__dict__.items())})"
+        return f"BaseMachine({', '.join(f'{k}={getattr(self, k)}' for k in self.__slots__)})"
 
     def __repr__(self) -> str:
         """디버깅/개발용 출력"""
@@ -36,31 +43,3 @@ class BaseMachine:
     def check_machine_on(self) -> bool:
         """Check if machine is on (status == 1)."""
         return self.status == 1
-
-    @staticmethod
-    def merge_device_data(switch_data: List[dict], device_data: List[dict]) -> List[dict]:
-        """
-        스위치 데이터의 status와 created_at을 device_data에 추가
-
-        Args:
-            switch_data: List of switch status dictionaries
-            device_data: List of device configuration dictionaries
-
-        Returns:
-            Merged device data with status and switch_created_at fields
-        """
-        # 스위치 데이터를 device_id를 키로 하는 딕셔너리로 변환
-        switch_dict = {
-            switch['device_id']: {
-                'status': switch['status'],
-                'created_at': switch['created_at']
-            } for switch in switch_data
-        }
-
-        # 디바이스 데이터에 status와 switch_created_at 추가
-        for device in device_data:
-            device_switch = switch_dict.get(device['id'], {'status': 0, 'created_at': None})
-            device['status'] = device_switch['status']
-            device['switch_created_at'] = device_switch['created_at']
-
-        return device_data
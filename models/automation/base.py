@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
+from datetime import datetime
+from typing import Optional, Dict, Callable
 from logger.custom_logger import CustomLogger
 from models.Machine import BaseMachine
 from resources import mqtt
+from resources.mqtt import DispatchedMessage
 from models.automation.models import (
-    MQTTMessage,
     SwitchMessage,
     MQTTPayloadData,
     TopicType,
@@ -24,6 +25,10 @@ class BaseAutomation(ABC):
         self.switch_created_at: Optional[str] = None
         self.mqtt_subscribed = False
         self.sensor_name: Optional[str] = None
+        # set_machine()으로 연결된 Store의 BaseMachine (get_machine()이 재사용)
+        self.machine: Optional[BaseMachine] = None
+        # 스케줄러가 등록 시 설정하는 재스케줄 콜백 (이름, 마감 시각)
+        self.reschedule_callback: Optional[Callable[..., None]] = None
         # 임시 로거 생성 (초기화 단계용)
         self.logger = CustomLogger()
                 
@@ -45,6 +50,7 @@ class BaseAutomation(ABC):
 
     def set_machine(self, machine: BaseMachine) -> None:
         """기기 정보 설정 및 GPIO 초기화"""
+        self.machine = machine
         self.name = machine.name
         self.pin = int(machine.pin)
         self.status = machine.status
@@ -62,51 +68,38 @@ class BaseAutomation(ABC):
         self._init_from_settings(self._settings)
         
     def _setup_mqtt_subscription(self) -> None:
-        """MQTT 토픽 구독 설정"""
+        """MQTT 토픽 구독 설정 (핸들러가 있는 토픽만 디스패처에 등록)"""
         try:
             if self.name and not self.mqtt_subscribed:
-                # 자동화 토픽 구독
                 self.automation_topic = f"automation/{self.name}"
-                mqtt.client.message_callback_add(self.automation_topic, self._on_mqtt_message)
-                
-                # 센서값 토픽 구독
                 self.sensor_topic = f"environment/{self.name}"
-                mqtt.client.message_callback_add(self.sensor_topic, self._on_mqtt_message)
-
-                # 스위치 토픽 구독
                 self.switch_topic = f"switch/{self.name}"
-                mqtt.client.message_callback_add(self.switch_topic, self._on_mqtt_message)
-                
-                self.mqtt_subscribed = True
-                # self.logger.info(
-                #     f"MQTT 콜백 등록 성공: {self.automation_topic}, "
-                #     f"{self.sensor_topic}, {self.switch_topic}"
-                # )
-        except Exception as e:
-            self.logger.error(f"MQTT 콜백 등록 실패: {str(e)}")
-
-    def _on_mqtt_message(self, client, userdata, message) -> None:
-        """MQTT 메시지 수신 처리 (기본)"""
-        try:
-            # MQTT 메시지를 객체로 변환
-            mqtt_message = MQTTMessage.from_message(message)
-            topic_type = TopicType.from_topic(mqtt_message.topic)
-            
-            if not topic_type:
-                self.logger.warning(f"알 수 없는 토픽: {mqtt_message.topic}")
-                return
-                
-            # 해당하는 핸들러 실행
-            handler = self.message_handlers.get(topic_type)
-            if handler:
-                # self.logger.debug(
-                #     f"메시지 핸들러 실행: {handler.description} "
-                #     f"(토픽: {topic_type.value})"
-                # )
-                handler.handler(mqtt_message)
+                topics = {
+                    TopicType.AUTOMATION: self.automation_topic,
+                    TopicType.ENVIRONMENT: self.sensor_topic,
+                    TopicType.SWITCH: self.switch_topic
+                }
+
+                self._subscriptions = [
+                    (topics[topic_type], handler.handler)
+                    for topic_type, handler in self.message_handlers.items()
+                    if topic_type in topics
+                ]
+                for topic, handler in self._subscriptions:
+                    mqtt.dispatcher.add(topic, handler)
 
+                self.mqtt_subscribed = True
         except Exception as e:
-            self.logger.error(f"MQTT 메시지 처리 실패: {str(e)}")
+            self.logger.error("MQTT 콜백 등록 실패: %s", e)
+
+    def remove_mqtt_subscription(self) -> None:
+        """디스패처에 등록한 MQTT 핸들러 해제"""
+        if not self.mqtt_subscribed:
+            return
+        for topic, handler in self._subscriptions:
+            mqtt.dispatcher.remove(topic, handler)
+        self._subscriptions = []
+        self.mqtt_subscribed = False
 
     def filter_settings_dict(self, data: dict) -> dict:
         """
@@ -114,56 +107,48 @@ class BaseAutomation(ABC):
         """
         return {k: v for k, v in data.items() if k not in ('id', 'active', 'updated_at')}
     
-    def _handle_automation_message(self, mqtt_message: MQTTMessage) -> None:
-        """자동화 설정 메시지 처리"""
+    def _handle_automation_message(self, message: DispatchedMessage) -> None:
+        """자동화 설정 메시지 처리 (automation/<name>으로만 라우팅됨)"""
         try:
-            payload_data = MQTTPayloadData(
-                pattern=mqtt_message.topic,
-                data=SwitchMessage(
-                    name=mqtt_message.topic_parts[1],
-                    value=mqtt_message.payload['data']['value']
-                )
-            )
+            self.apply_settings(message.value)
 
-            if payload_data.data.name == self.name:
-                # 자동화 설정 업데이트
-                self.active = payload_data.data.value.get('active', False)
-                new_settings = self.filter_settings_dict(payload_data.data.value)
+        except Exception as e:
+            self.logger.error("자동화 설정 메시지 처리 실패: %s", e)
 
-                if new_settings:
-                    # update_settings 메서드가 있으면 사용 (타이머 재시작 포함)
-                    if hasattr(self, 'update_settings'):
-                        self.update_settings(new_settings)
-                    else:
-                        self._init_from_settings(new_settings)
-                        self.control()
+    def apply_settings(self, data: dict) -> None:
+        """
+        자동화 설정 업데이트 (MQTT 메시지 또는 Store 갱신)
 
-                self.logger.info(
-                    f"Device {self.name}: 자동화 설정 업데이트 "
-                    f"(활성화: {self.active}, 설정: {new_settings})"
-                )
+        Args:
+            data: Automation settings including the 'active' flag
+        """
+        self.active = data.get('active', False)
+        new_settings = self.filter_settings_dict(data)
+
+        if new_settings:
+            # update_settings 메서드가 있으면 사용 (타이머 재시작 포함)
+            if hasattr(self, 'update_settings'):
+                self.update_settings(new_settings)
+            else:
+                self._init_from_settings(new_settings)
+                self.control()
+
+        self.logger.info(
+            "Device %s: 자동화 설정 업데이트", self.name, active=self.active, settings=new_settings
+        )
 
-        except Exception as e:
-            self.logger.error(f"자동화 설정 메시지 처리 실패: {str(e)}")
+        # 설정 변경으로 다음 실행 시각이 달라졌을 수 있음
+        self._request_reschedule()
 
-    def _handle_switch_message(self, mqtt_message: MQTTMessage) -> None:
-        """스위치 상태 메시지 처리 및 GPIO 제어"""
+    def _handle_switch_message(self, message: DispatchedMessage) -> None:
+        """스위치 상태 메시지 처리 (switch/<name>으로만 라우팅됨)"""
         try:
-            payload_data = MQTTPayloadData(
-                pattern=mqtt_message.topic,
-                data=SwitchMessage(
-                    name=mqtt_message.topic_parts[1],
-                    value=mqtt_message.payload['data']['value']
-                )
-            )
-
-            if payload_data.data.name == self.name:
-                new_status = bool(payload_data.data.value)
-                if new_status != self.status:
-                    self.status = new_status
+            new_status = bool(message.value)
+            if new_status != self.status:
+                self.status = new_status
 
         except Exception as e:
-            self.logger.error(f"스위치 상태 메시지 처리 실패: {str(e)}")
+            self.logger.error("스위치 상태 메시지 처리 실패: %s", e)
 
     def send_mqtt_message(self, new_status: bool) -> None:
         """MQTT 메시지 전송"""
@@ -184,7 +169,7 @@ class BaseAutomation(ABC):
             mqtt.publish_message(self.mqtt_topic, mqtt_payload.to_dict())
             # self.logger.info(f"MQTT 메시지 전송 성공: {self.name} = {new_status}")
         except Exception as e:
-            self.logger.error(f"MQTT 메시지 전송 실패: {str(e)}")
+            self.logger.error("MQTT 메시지 전송 실패: %s", e)
             raise
 
     def update_device_status(self, new_status: bool) -> None:
@@ -192,13 +177,25 @@ class BaseAutomation(ABC):
         try:
             self.send_mqtt_message(new_status)
             self.status = new_status
-            self.logger.info(f"상태 업데이트 성공: {self.name} / {self.device_id} = {new_status}")
+            self.logger.info("상태 업데이트 성공: %s / %s = %s", self.name, self.device_id, new_status)
         except Exception as e:
-            self.logger.error(f"상태 업데이트 실패: {str(e)}")
+            self.logger.error("상태 업데이트 실패: %s", e)
             raise
 
     def get_machine(self) -> BaseMachine:
-        """현재 상태의 BaseMachine 객체 생성"""
+        """
+        현재 상태가 반영된 BaseMachine 반환
+
+        set_machine()으로 연결된 Store 객체에 자동화의 상태를 기록해 돌려주므로
+        control() 호출마다 새 객체를 만들지 않는다.
+        """
+        machine = self.machine
+        if machine is not None:
+            machine.pin = self.pin
+            machine.status = self.status
+            machine.switch_created_at = self.switch_created_at
+            return machine
+
         return BaseMachine(
             machine_id=self.device_id,
             name=self.name,
@@ -207,6 +204,28 @@ class BaseAutomation(ABC):
             switch_created_at=self.switch_created_at
         )
 
+    def next_run_time(self, now: datetime) -> Optional[datetime]:
+        """
+        다음 control() 실행 시각 반환
+
+        Args:
+            now: Current local time
+
+        Returns:
+            Next due time, or None if the automation has no time-based deadline
+        """
+        return None
+
+    def _request_reschedule(self, due_at: Optional[float] = None) -> None:
+        """
+        스케줄러에 다음 실행 시각 재계산 요청
+
+        Args:
+            due_at: Explicit due time in epoch seconds (recomputed via next_run_time if None)
+        """
+        if self.reschedule_callback and self.name:
+            self.reschedule_callback(self.name, due_at)
+
     @abstractmethod
     def _init_from_settings(self, settings: dict) -> None:
         """각 자동화 타입별 설정 초기화"""
@@ -217,6 +236,6 @@ class BaseAutomation(ABC):
         """자동화 제어 실행"""
         # 나중에 자동화 활성화하게 될 경우 mqtt로 변경값 받아와서 self.active 값 변경
         if not self.active:
-            self.logger.debug(f"자동화 비활성화: {self.name}")
+            self.logger.debug("자동화 비활성화: %s", self.name)
 
         return self.get_machine() 
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""센서값 수신 빈도와 제어 실행 빈도를 분리하는 병합기"""
+from typing import Optional, Tuple
+
+
+class ReadingCoalescer:
+    """
+    Decide whether a new sensor reading should trigger control().
+
+    The automation always keeps the newest value; this class only limits how
+    often control() runs on it. A reading inside the deadband of the value
+    last controlled on is skipped, unless the caller is counting consecutive
+    readings (e.g. in-range confirmation), where every reading counts. A reading that arrives within
+    `min_interval` of the last control is deferred: the caller schedules one
+    trailing run at the returned due time, and further readings before then
+    are folded into that same run.
+    """
+
+    RUN = "run"
+    DEFER = "defer"
+    SKIP = "skip"
+
+    def __init__(self, min_interval: float = 0.0, deadband: float = 0.0) -> None:
+        """
+        Initialize ReadingCoalescer.
+
+        Args:
+            min_interval: Minimum seconds between control() runs (0 disables)
+            deadband: Skip readings with |value - last controlled value| < deadband (0 disables)
+        """
+        self.min_interval = min_interval
+        self.deadband = deadband
+        self.last_applied_value: Optional[float] = None
+        self.last_applied_at: Optional[float] = None
+        self.pending = False  # 예약된 지연 실행이 있는지 여부
+
+        self.received = 0
+        self.applied = 0
+        self.deferred = 0
+        self.skipped = 0
+
+    def offer(self, value: float, now: float, counting: bool = False) -> Tuple[str, Optional[float]]:
+        """
+        새 센서값에 대한 처리 방식 결정
+
+        Args:
+            value: New reading
+            now: Current time in epoch seconds
+            counting: The controller is counting consecutive readings, so the deadband is not applied
+
+        Returns:
+            Tuple[str, Optional[float]]: (RUN | DEFER | SKIP, due time to schedule or None)
+        """
+        self.received += 1
+        if (
+            self.deadband > 0
+            and not counting
+            and self.last_applied_value is not None
+            and abs(value - self.last_applied_value) < self.deadband
+        ):
+            self.skipped += 1
+            return self.SKIP, None
+
+        if self.last_applied_at is not None and now - self.last_applied_at < self.min_interval:
+            self.deferred += 1
+            if self.pending:
+                # 이미 예약된 실행이 최신 값을 사용하므로 추가 예약 불필요
+                return self.DEFER, None
+            self.pending = True
+            return self.DEFER, self.last_applied_at + self.min_interval
+
+        return self.RUN, None
+
+    def mark_applied(self, value: float, now: float) -> None:
+        """control()이 해당 값으로 실행되었음을 기록"""
+        self.last_applied_value = value
+        self.last_applied_at = now
+        self.pending = False
+        self.applied += 1
+
+    def summary(self) -> str:
+        """로그용 요약 문자열"""
+        return (
+            f"received={self.received} applied={self.applied} "
+            f"deferred={self.deferred} skipped={self.skipped}"
+        )
@@ -0,0 +1,212 @@
+"""Target 자동화용 PID 제어기와 시간 비례 릴레이 출력"""
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+class PIDController:
+    """
+    PID controller with output clamping and anti-windup.
+
+    The output is limited to [-1, 1]: positive values drive the increase
+    device (heater), negative values the decrease device (cooler). The
+    derivative acts on the measurement rather than the error so target
+    changes (e.g. the LED-dependent effective target) do not cause a kick,
+    and the integral only accumulates while the output is not saturated in
+    the same direction.
+    """
+
+    def __init__(self, kp: float, ki: float = 0.0, kd: float = 0.0) -> None:
+        """
+        Initialize PIDController.
+
+        Args:
+            kp: Proportional gain (output per unit of error)
+            ki: Integral gain (output per unit of error-second)
+            kd: Derivative gain (output per unit/second of measurement change)
+        """
+        self.kp = kp
+        self.ki = ki
+        self.kd = kd
+        self.integral = 0.0
+        self.output = 0.0
+        self._last_value: Optional[float] = None
+        self._last_time: Optional[float] = None
+
+    def reset(self) -> None:
+        """적분/미분 상태 초기화"""
+        self.integral = 0.0
+        self.output = 0.0
+        self._last_value = None
+        self._last_time = None
+
+    def update(self, target: float, value: float, now: float) -> float:
+        """
+        새 측정값으로 출력 계산
+
+        Args:
+            target: Setpoint
+            value: Measured value
+            now: Current epoch seconds
+
+        Returns:
+            float: Output in [-1, 1]
+        """
+        error = target - value
+        dt = 0.0 if self._last_time is None else max(now - self._last_time, 0.0)
+
+        derivative = 0.0
+        if dt > 0 and self._last_value is not None:
+            derivative = -(value - self._last_value) / dt
+
+        integral = self.integral + error * dt
+        output = self.kp * error + self.ki * integral + self.kd * derivative
+        clamped = max(-1.0, min(1.0, output))
+        # 포화 방향으로는 적분하지 않음 (anti-windup)
+        if clamped == output or (output > 1.0) != (error > 0):
+            self.integral = integral
+
+        self._last_value = value
+        self._last_time = now
+        self.output = clamped
+        return clamped
+
+
+class TimeProportionalRelay:
+    """
+    Turn a duty cycle into on/off switching for a relay.
+
+    Each control cycle of `cycle_seconds` latches the duty requested at its
+    start and keeps the relay on for duty * cycle_seconds. On-times shorter
+    than `min_on` are dropped and off-times shorter than `min_off` are
+    filled in, and the relay never changes state sooner than min_on/min_off
+    after its last change, which bounds the switching rate.
+    """
+
+    def __init__(self, cycle_seconds: float = 60.0, min_on: float = 10.0, min_off: float = 10.0) -> None:
+        """
+        Initialize TimeProportionalRelay.
+
+        Args:
+            cycle_seconds: Length of one on/off cycle
+            min_on: Minimum on-time per switch-on
+            min_off: Minimum off-time per switch-off
+        """
+        if cycle_seconds <= 0:
+            raise ValueError(f"cycle_seconds must be positive, got {cycle_seconds}")
+        self.cycle_seconds = cycle_seconds
+        self.min_on = min_on
+        self.min_off = min_off
+        self.on = False
+        self.switches = 0
+        self._cycle_start: Optional[float] = None
+        self._on_time = 0.0
+        self._last_change: Optional[float] = None
+
+    def reset(self) -> None:
+        """주기 상태 초기화 (릴레이 상태는 유지)"""
+        self._cycle_start = None
+        self._on_time = 0.0
+
+    def restore(self, on: bool, last_change: Optional[float] = None) -> None:
+        """
+        실제 릴레이 상태 반영 (전환 횟수에는 포함하지 않음)
+
+        Used when the relay object is rebuilt (settings change) or the device
+        state becomes known, so the relay does not start "off" while the
+        device is on and min_on/min_off keep counting from the last real change.
+
+        Args:
+            on: Current device state
+            last_change: Epoch seconds of the last state change, if known
+        """
+        self.on = bool(on)
+        self._last_change = last_change
+
+    @property
+    def last_change(self) -> Optional[float]:
+        """마지막 상태 전환 시각 (epoch seconds)"""
+        return self._last_change
+
+    def update(self, duty: float, now: float) -> bool:
+        """
+        현재 시각의 릴레이 상태 계산
+
+        Args:
+            duty: Requested duty cycle in [0, 1]
+            now: Current epoch seconds
+
+        Returns:
+            bool: Whether the relay should be on
+        """
+        if self._cycle_start is None or now >= self._cycle_start + self.cycle_seconds:
+            self._start_cycle(duty, now)
+
+        desired = now < self._cycle_start + self._on_time
+        if desired != self.on:
+            hold = self.min_on if self.on else self.min_off
+            if self._last_change is None or now - self._last_change >= hold:
+                self.on = desired
+                self._last_change = now
+                self.switches += 1
+        return self.on
+
+    def _start_cycle(self, duty: float, now: float) -> None:
+        """새 주기 시작 및 on 시간 결정"""
+        if self._cycle_start is None or now >= self._cycle_start + 2 * self.cycle_seconds:
+            self._cycle_start = now
+        else:
+            # 주기 경계를 유지해 on/off 시점이 밀리지 않도록 함
+            self._cycle_start += self.cycle_seconds
+
+        on_time = max(0.0, min(1.0, duty)) * self.cycle_seconds
+        if on_time < self.min_on:
+            on_time = 0.0
+        elif self.cycle_seconds - on_time < self.min_off:
+            on_time = self.cycle_seconds
+        self._on_time = on_time
+
+    def next_edge(self, now: float) -> Optional[float]:
+        """
+        릴레이 상태가 바뀔 수 있는 다음 시각
+
+        Args:
+            now: Current epoch seconds
+
+        Returns:
+            Optional[float]: Epoch seconds, or None before the first update
+        """
+        if self._cycle_start is None:
+            return None
+        cycle_end = self._cycle_start + self.cycle_seconds
+        edge = self._cycle_start + self._on_time if self.on and self._on_time < self.cycle_seconds else cycle_end
+        if edge <= now:
+            edge = cycle_end
+        if self._last_change is not None:
+            hold = self.min_on if self.on else self.min_off
+            edge = max(edge, self._last_change + hold)
+        return edge
+
+
+@dataclass
+class PIDSettings:
+    """PID 모드 설정 (자동화 settings의 'pid' 항목)"""
+    kp: float = 0.5
+    ki: float = 0.0005
+    kd: float = 0.0
+    cycle_seconds: float = 300.0
+    min_on: float = 30.0
+    min_off: float = 30.0
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> 'PIDSettings':
+        """
+        설정 딕셔너리에서 생성 (없는 키는 기본값)
+
+        Raises:
+            ValueError: Unknown keys or non-numeric values
+        """
+        options = dict(config or {})
+        unknown = set(options) - set(cls.__dataclass_fields__)
+        if unknown:
+            raise ValueError(f"알 수 없는 PID 설정: {', '.join(sorted(unknown))}")
+        return cls(**{key: float(value) for key, value in options.items()})
@@ -0,0 +1,265 @@
+"""Target 자동화 입력 센서값 필터 (중앙값/EMA/칼만/이상치 제거)"""
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Type
+
+# 평균 절대 편차를 정규분포 표준편차로 환산하는 계수 (sqrt(pi/2))
+MEAN_ABS_DEV_SCALE = 1.2533
+
+
+class SignalFilter(ABC):
+    """
+    One incremental filter stage.
+
+    update() takes a raw value and returns the filtered value, or None when
+    the stage rejects the reading (the pipeline then stops and the automation
+    keeps its previous value).
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def update(self, value: float) -> Optional[float]:
+        """센서값 1개 적용 (기각하면 None)"""
+
+    def reset(self) -> None:
+        """필터 상태 초기화"""
+
+    def describe(self) -> str:
+        """로그용 설명"""
+        return self.name
+
+
+class MedianFilter(SignalFilter):
+    """Median of the last `window` readings (sorted window kept incrementally)."""
+
+    name = "median"
+
+    def __init__(self, window: int = 5) -> None:
+        if window < 1:
+            raise ValueError(f"median window must be >= 1, got {window}")
+        self.window = int(window)
+        self._values: Deque[float] = deque()
+        self._sorted: List[float] = []
+
+    def update(self, value: float) -> Optional[float]:
+        self._values.append(value)
+        insort(self._sorted, value)
+        if len(self._values) > self.window:
+            oldest = self._values.popleft()
+            del self._sorted[bisect_left(self._sorted, oldest)]
+        count = len(self._sorted)
+        middle = count // 2
+        if count % 2:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
+
+    def reset(self) -> None:
+        self._values.clear()
+        self._sorted.clear()
+
+    def describe(self) -> str:
+        return f"median({self.window})"
+
+
+class EMAFilter(SignalFilter):
+    """Exponential moving average: y += alpha * (x - y)."""
+
+    name = "ema"
+
+    def __init__(self, alpha: float = 0.3) -> None:
+        if not 0 < alpha <= 1:
+            raise ValueError(f"ema alpha must be in (0, 1], got {alpha}")
+        self.alpha = float(alpha)
+        self._estimate: Optional[float] = None
+
+    def update(self, value: float) -> Optional[float]:
+        if self._estimate is None:
+            self._estimate = value
+        else:
+            self._estimate += self.alpha * (value - self._estimate)
+        return self._estimate
+
+    def reset(self) -> None:
+        self._estimate = None
+
+    def describe(self) -> str:
+        return f"ema({self.alpha:g})"
+
+
+class KalmanFilter(SignalFilter):
+    """
+    Scalar Kalman filter for a slowly drifting level.
+
+    `process_noise` is how much the true value may move between readings and
+    `measurement_noise` is the sensor variance; a small ratio smooths more.
+    """
+
+    name = "kalman"
+
+    def __init__(self, process_noise: float = 0.01, measurement_noise: float = 0.25) -> None:
+        if process_noise <= 0 or measurement_noise <= 0:
+            raise ValueError("kalman noise parameters must be positive")
+        self.process_noise = float(process_noise)
+        self.measurement_noise = float(measurement_noise)
+        self._estimate: Optional[float] = None
+        self._variance = 1.0
+
+    def update(self, value: float) -> Optional[float]:
+        if self._estimate is None:
+            self._estimate = value
+            self._variance = self.measurement_noise
+            return value
+        variance = self._variance + self.process_noise
+        gain = variance / (variance + self.measurement_noise)
+        self._estimate += gain * (value - self._estimate)
+        self._variance = (1 - gain) * variance
+        return self._estimate
+
+    def reset(self) -> None:
+        self._estimate = None
+        self._variance = 1.0
+
+    def describe(self) -> str:
+        return f"kalman(q={self.process_noise:g}, r={self.measurement_noise:g})"
+
+
+class OutlierFilter(SignalFilter):
+    """
+    Hampel-style outlier rejection with a long-memory noise scale.
+
+    A reading is rejected when it is further than `threshold` noise units
+    from the median of the last `window` accepted readings. The noise unit is
+    an EWMA of the accepted readings' absolute deviation from that median
+    (x1.2533 to match a standard deviation); a per-window MAD is too noisy
+    for short windows and rejects ordinary readings. `min_deviation` keeps a
+    flat signal from rejecting tiny changes, and after `max_rejections`
+    consecutive rejections the reading is accepted so a real step change is
+    followed rather than blocked forever.
+    """
+
+    name = "outlier"
+
+    def __init__(self, window: int = 7, threshold: float = 4.0, min_deviation: float = 0.1,
+                 max_rejections: int = 3, scale_alpha: float = 0.05) -> None:
+        if window < 3:
+            raise ValueError(f"outlier window must be >= 3, got {window}")
+        self.window = int(window)
+        self.threshold = float(threshold)
+        self.min_deviation = float(min_deviation)
+        self.max_rejections = int(max_rejections)
+        self.scale_alpha = float(scale_alpha)
+        self._accepted: Deque[float] = deque(maxlen=self.window)
+        self._deviation: Optional[float] = None
+        self._consecutive = 0
+        self.rejected = 0
+
+    def update(self, value: float) -> Optional[float]:
+        median = None
+        if len(self._accepted) >= 3:
+            ordered = sorted(self._accepted)
+            median = ordered[len(ordered) // 2]
+            if self._deviation is not None and self._consecutive < self.max_rejections:
+                scale = max(MEAN_ABS_DEV_SCALE * self._deviation, self.min_deviation)
+                if abs(value - median) > self.threshold * scale:
+                    self._consecutive += 1
+                    self.rejected += 1
+                    return None
+
+        self._consecutive = 0
+        if median is not None:
+            deviation = abs(value - median)
+            if self._deviation is None:
+                self._deviation = deviation
+            else:
+                self._deviation += self.scale_alpha * (deviation - self._deviation)
+        self._accepted.append(value)
+        return value
+
+    def reset(self) -> None:
+        self._accepted.clear()
+        self._deviation = None
+        self._consecutive = 0
+
+    def describe(self) -> str:
+        return f"outlier({self.window}, {self.threshold:g}σ)"
+
+
+FILTER_TYPES: Dict[str, Type[SignalFilter]] = {
+    MedianFilter.name: MedianFilter,
+    EMAFilter.name: EMAFilter,
+    KalmanFilter.name: KalmanFilter,
+    OutlierFilter.name: OutlierFilter,
+}
+
+
+class FilterPipeline:
+    """Ordered chain of SignalFilter stages applied to every reading."""
+
+    def __init__(self, stages: Sequence[SignalFilter] = ()) -> None:
+        self.stages = list(stages)
+        self.received = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_config(cls, config: Optional[Sequence[Dict[str, Any]]]) -> 'FilterPipeline':
+        """
+        설정 목록으로 파이프라인 생성
+
+        Args:
+            config: e.g. [{"type": "outlier", "window": 7}, {"type": "median", "window": 5},
+                    {"type": "ema", "alpha": 0.3}]; None or [] means no filtering
+
+        Returns:
+            FilterPipeline: Pipeline with one stage per entry
+
+        Raises:
+            ValueError: Unknown filter type or invalid parameters
+        """
+        stages = []
+        for entry in config or ():
+            options = dict(entry)
+            filter_type = str(options.pop('type', '')).lower()
+            filter_class = FILTER_TYPES.get(filter_type)
+            if filter_class is None:
+                raise ValueError(f"알 수 없는 필터 종류: {filter_type or entry}")
+            try:
+                stages.append(filter_class(**options))
+            except TypeError as e:
+                raise ValueError(f"{filter_type} 필터 설정 오류: {e}") from e
+        return cls(stages)
+
+    def __bool__(self) -> bool:
+        return bool(self.stages)
+
+    def update(self, value: float) -> Optional[float]:
+        """
+        센서값을 모든 단계에 통과시킴
+
+        Args:
+            value: Raw reading
+
+        Returns:
+            Optional[float]: Filtered value, or None if a stage rejected the reading
+        """
+        self.received += 1
+        if not math.isfinite(value):
+            self.rejected += 1
+            return None
+        for stage in self.stages:
+            value = stage.update(value)
+            if value is None:
+                self.rejected += 1
+                return None
+        return value
+
+    def reset(self) -> None:
+        """모든 단계 상태 초기화"""
+        for stage in self.stages:
+            stage.reset()
+
+    def describe(self) -> str:
+        """로그용 설명"""
+        return " → ".join(stage.describe() for stage in self.stages) or "none"
@@ -1,35 +1,46 @@
-from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict
+import time
+from datetime import datetime, timezone
+from typing import Optional, Tuple
 from models.automation.base import BaseAutomation
 from models.Machine import BaseMachine
 from resources import redis
-from utils.led_time_utils import load_led_time_range, is_led_on
+from utils.photoperiod import photoperiod
+
+# 스케줄러 타이머가 마감 시각보다 약간 일찍 깨어나도 전환으로 처리하는 허용 오차 (초)
+FIRE_TOLERANCE = 0.01
+
 
 class IntervalState:
     def __init__(self):
-        self.last_toggle_time: Optional[datetime] = None
+        self.last_toggle_at: Optional[float] = None  # 마지막 전환 시각 (epoch 초)
+
+    @property
+    def last_toggle_time(self) -> Optional[datetime]:
+        """마지막 전환 시각 (로컬 시간, 표시용)"""
+        return datetime.fromtimestamp(self.last_toggle_at) if self.last_toggle_at is not None else None
 
-    def _parse_datetime(self, date_str: str) -> datetime:
-        """UTC 시간 파싱"""
+    def _parse_timestamp(self, date_str: str) -> Optional[float]:
+        """ISO 시간 문자열을 epoch 초로 변환 (시간대가 없으면 UTC)"""
         if not date_str:
             return None
         dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        return dt.astimezone(timezone.utc).replace(tzinfo=None)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
 
-    def update_toggle_time(self, current_time: datetime) -> None:
+    def update_toggle_time(self, timestamp: float) -> None:
         """토글 시간 업데이트"""
-        self.last_toggle_time = current_time
+        self.last_toggle_at = timestamp
 
     def reset(self) -> None:
         """상태 초기화"""
-        self.last_toggle_time = None
+        self.last_toggle_at = None
 
 class IntervalAutomation(BaseAutomation):
     def __init__(self, device_id: str, category: str, active: bool, duration: str, interval: str, updated_at: str = None):
         self.settings = { 'duration': duration, 'interval': interval }
         super().__init__(device_id, category, active, updated_at, self.settings)
         self.state = IntervalState()
-        self.led_time_range = None
         # TimeConfig 변환을 위한 임시 변수
         self._temp_duration_settings = duration
         self._temp_interval_settings = interval
@@ -43,29 +54,82 @@ class IntervalAutomation(BaseAutomation):
             duration_settings = settings.get('duration', self._temp_duration_settings)
             interval_settings = settings.get('interval', self._temp_interval_settings)
 
-            self.duration = TimeConfig(
-                duration_settings if isinstance(duration_settings, dict) else {'seconds': int(duration_settings)}
-            ).to_seconds()
-
-            self.base_interval = TimeConfig(
-                interval_settings if isinstance(interval_settings, dict) else {'seconds': int(interval_settings)}
-            ).to_seconds()
+            # 숫자(초), '10s'/'5m' 문자열, {'seconds': 10} 딕셔너리 모두 허용
+            self.duration = TimeConfig(duration_settings).to_seconds()
+            self.base_interval = TimeConfig(interval_settings).to_seconds()
 
         except Exception as e:
             self.logger.error(f"설정 초기화 실패: {str(e)}")
             raise ValueError(f"설정 초기화 실패: {str(e)}")
 
     def _load_control_devices(self, store) -> None:
-        """Store에서 LED 시간 범위 설정 로드 (waterspray 전용)"""
+        """LED 광주기 구독 (waterspray 전용)"""
         if self.name == 'waterspray':
-            self.led_time_range = load_led_time_range(store, self.name)
+            photoperiod.subscribe(self._on_photoperiod_change)
+
+    def _on_photoperiod_change(self, led_on: bool) -> None:
+        """LED 전환/설정 변경 시 다음 ON 시각 재계산"""
+        self._request_reschedule()
 
-    def _calculate_effective_interval(self) -> float:
+    @property
+    def _uses_led(self) -> bool:
+        """LED 상태에 따라 interval이 바뀌는지 여부 (waterspray + LED 설정 있음)"""
+        return self.name == 'waterspray' and photoperiod.configured
+
+    def _calculate_effective_interval(self, timestamp: Optional[float] = None) -> float:
         """LED 상태에 따라 유효 interval 계산 (waterspray 전용)"""
-        if self.name != 'waterspray' or not self.led_time_range:
+        if not self._uses_led:
             return self.base_interval
 
-        return self.base_interval * 2 if not is_led_on(self.led_time_range) else self.base_interval
+        led_on = photoperiod.is_on() if timestamp is None else photoperiod.is_on_at(timestamp)
+        return self.base_interval if led_on else self.base_interval * 2
+
+    def _next_on_at(self, off_at: float) -> float:
+        """
+        OFF 시각 기준 다음 ON 시각 (닫힌 형태)
+
+        The device turns on at the first instant t with t - off_at >= the
+        effective interval at t. For the waterspray that is off_at + interval
+        if the LED is on then, otherwise the first LED-on edge after that,
+        capped at off_at + 2 * interval.
+        """
+        earliest = off_at + self.base_interval
+        if not self._uses_led:
+            return earliest
+
+        latest = off_at + self.base_interval * 2
+        if photoperiod.is_on_at(earliest):
+            return earliest
+        led_on_at = photoperiod.next_edge(earliest)
+        return min(led_on_at, latest) if led_on_at is not None else latest
+
+    def _next_transition_at(self) -> Optional[Tuple[float, bool]]:
+        """다음 전환 (epoch 초, 전환 후 상태) - 첫 실행 전에는 None"""
+        last_toggle_at = self.state.last_toggle_at
+        if last_toggle_at is None:
+            return None
+        if self.status:
+            return last_toggle_at + self.duration, False
+        return self._next_on_at(last_toggle_at), True
+
+    def next_transition(self, now: datetime) -> Optional[Tuple[datetime, bool]]:
+        """
+        다음 ON/OFF 전환 시각과 전환 후 상태
+
+        Args:
+            now: Current time (naive local or aware)
+
+        Returns:
+            Optional[Tuple[datetime, bool]]: (instant in now's form, status after the
+                transition), or None if inactive or not yet initialized
+        """
+        if not self.active:
+            return None
+        transition = self._next_transition_at()
+        if transition is None:
+            return None
+        at, status = transition
+        return datetime.fromtimestamp(at, now.tzinfo), status
 
     def update_settings(self, settings: dict) -> None:
         """설정 업데이트"""
@@ -73,38 +137,51 @@ class IntervalAutomation(BaseAutomation):
         self.state.reset()
         self.control()
 
+    def next_run_time(self, now: datetime) -> Optional[datetime]:
+        """duration 또는 interval이 만료되는 정확한 시각 반환"""
+        if not self.active:
+            return None
+        if self.state.last_toggle_at is None:
+            return now
+        transition = self.next_transition(now)
+        return transition[0] if transition else None
+
     def control(self) -> Optional[BaseMachine]:
-        """주기적 제어 실행"""
+        """주기적 제어 실행 (스케줄러가 next_run_time 시각에 호출)"""
         if not self.active:
             return None
 
         try:
-            now = datetime.now()
+            now = time.time()
 
-            if self.state.last_toggle_time is None:
+            if self.state.last_toggle_at is None:
                 return self._handle_first_run(now)
 
-            elapsed_seconds = (now - self.state.last_toggle_time).total_seconds()
-            current_status = bool(self.status)
+            due_at, next_status = self._next_transition_at()
+            if now + FIRE_TOLERANCE < due_at:
+                return self.get_machine()
+
+            elapsed_seconds = now - self.state.last_toggle_at
+            # 예정 시각 기준으로 다음 주기를 계산해 실행 지연이 누적되지 않도록 함
+            # (한 구간 이상 늦은 경우 - 재시작 등 - 에는 현재 시각 기준)
+            phase_length = self.duration if next_status else self.base_interval
+            toggled_at = due_at if now - due_at < phase_length else now
 
             # 현재 ON 상태일 때
-            if current_status:
-                if elapsed_seconds >= self.duration:
-                    self.logger.info(f"Device {self.name}: duration({self.duration}초) 경과로 OFF")
-                    self.update_device_status(False)
-                    self.state.update_toggle_time(now)
+            if not next_status:
+                self.logger.info(f"Device {self.name}: duration({self.duration}초) 경과로 OFF")
+                self.update_device_status(False)
+                self.state.update_toggle_time(toggled_at)
             # 현재 OFF 상태일 때
             else:
-                effective_interval = self._calculate_effective_interval()
-                if elapsed_seconds >= effective_interval:
-                    led_status = is_led_on(self.led_time_range) if self.led_time_range else None
-                    log_msg = f"Device {self.name}: interval({effective_interval}초) 경과로 ON"
-                    if self.name == 'waterspray' and led_status is not None:
-                        log_msg += f" (LED: {'ON' if led_status else 'OFF'})"
-                    self.logger.info(log_msg)
-                    
-                    self.update_device_status(True)
-                    self.state.update_toggle_time(now)
+                effective_interval = self._calculate_effective_interval(due_at)
+                log_msg = f"Device {self.name}: interval({effective_interval}초) 경과로 ON ({elapsed_seconds:.1f}초)"
+                if self._uses_led:
+                    log_msg += f" (LED: {'ON' if photoperiod.is_on_at(due_at) else 'OFF'})"
+                self.logger.info(log_msg)
+
+                self.update_device_status(True)
+                self.state.update_toggle_time(toggled_at)
 
             return self.get_machine()
 
@@ -112,14 +189,14 @@ class IntervalAutomation(BaseAutomation):
             self.logger.error(f"Device {self.name} 제어 중 오류 발생: {str(e)}")
             return None
 
-    def _handle_first_run(self, current_time: datetime) -> Optional[BaseMachine]:
+    def _handle_first_run(self, current_time: float) -> Optional[BaseMachine]:
         """첫 실행 처리 - Redis의 마지막 상태와 경과 시간 기준"""
         try:
             interval_states = redis.get('interval_automated_switches') or []
             device_state = next((s for s in interval_states if s['name'] == self.name), None)
 
             if device_state:
-                last_time = self.state._parse_datetime(device_state.get('created_at'))
+                last_time = self.state._parse_timestamp(device_state.get('created_at'))
                 last_status = bool(device_state.get('status'))
                 
                 self.state.update_toggle_time(last_time if last_time else current_time)
@@ -11,12 +11,22 @@ class TimeConfig:
     unit: str = field(default='s')
 
     def __init__(self, value):
-        if isinstance(value, str):
-            # 문자열 파싱: 예) '1m', '30s', '2h'
-            match = re.match(r"^(\d+)([smhd])$", value.strip())
+        if isinstance(value, dict):
+            # 딕셔너리: 예) {'seconds': 10}, {'minutes': 5}, {'value': 1, 'unit': 'm'}
+            if 'value' in value:
+                self.value = value.get('value') or 0
+                self.unit = value.get('unit', 's')
+            else:
+                unit_keys = {'seconds': 's', 'minutes': 'm', 'hours': 'h', 'days': 'd'}
+                key = next((k for k in unit_keys if k in value), 'seconds')
+                self.value = value.get(key) or 0
+                self.unit = unit_keys[key]
+        elif isinstance(value, str):
+            # 문자열 파싱: 예) '1m', '30s', '2h' (단위가 없으면 초)
+            match = re.match(r"^(\d+(?:\.\d+)?)([smhd]?)$", value.strip())
             if match:
-                self.value = int(match.group(1))
-                self.unit = match.group(2)
+                self.value = float(match.group(1)) if '.' in match.group(1) else int(match.group(1))
+                self.unit = match.group(2) or 's'
             else:
                 # 파싱 실패시 기본값
                 self.value = 0
@@ -25,7 +35,7 @@ class TimeConfig:
             self.value = value if value is not None else 0
             self.unit = 's'
 
-    def to_seconds(self) -> int:
+    def to_seconds(self) -> float:
         """시간 단위를 초 단위로 변환"""
         units = {
             's': 1,           # 초
@@ -117,11 +127,11 @@ class MQTTMessage:
     
     @classmethod
     def from_message(cls, message) -> 'MQTTMessage':
-        """MQTT 메시지 객체로 변환"""
-        import json
+        """MQTT 메시지 객체로 변환 (JSON 또는 압축 형식)"""
+        from utils.mqtt_codec import decode_payload
         return cls(
             topic=message.topic,
-            payload=json.loads(message.payload.decode())
+            payload=decode_payload(message.topic, message.payload)
         )
     
     @property
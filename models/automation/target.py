@@ -1,19 +1,42 @@
-from typing import Optional
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from config import settings as app_settings
 from models.automation.base import BaseAutomation
+from models.automation.coalescer import ReadingCoalescer
+from models.automation.controllers import PIDController, PIDSettings, TimeProportionalRelay
+from models.automation.filters import FilterPipeline
 from models.Machine import BaseMachine
-from models.automation.models import MQTTMessage, MQTTPayloadData, MessageHandler, SwitchMessage, TopicType
-from utils.led_time_utils import load_led_time_range, is_led_on, calculate_effective_target
+from models.automation.models import MessageHandler, TopicType
+from resources.mqtt import DispatchedMessage
+from utils.photoperiod import photoperiod
+
+# 제어 방식: 기존 on/off 히스테리시스 또는 PID + 시간 비례 릴레이
+MODE_HYSTERESIS = 'hysteresis'
+MODE_PID = 'pid'
+CONTROL_MODES = (MODE_HYSTERESIS, MODE_PID)
+
+
 class TargetAutomation(BaseAutomation):
     def __init__(self, device_id: str, category: str, active: bool, target: float, margin: float,
                  increase_device_id: Optional[int] = None, decrease_device_id: Optional[int] = None,
-                 updated_at: str = None):
+                 updated_at: str = None, filters: Optional[List[Dict[str, Any]]] = None,
+                 mode: str = MODE_HYSTERESIS, pid: Optional[Dict[str, Any]] = None):
         self.settings = {
             'target': target,
             'margin': margin,
             'increase_device_id': increase_device_id,
-            'decrease_device_id': decrease_device_id
+            'decrease_device_id': decrease_device_id,
+            'filters': filters,
+            'mode': mode,
+            'pid': pid
         }
         super().__init__(device_id, category, active, updated_at, self.settings)
+        self.coalescer = ReadingCoalescer(
+            min_interval=app_settings.target_min_control_interval,
+            deadband=app_settings.target_deadband
+        )
         
         self.message_handlers = {
             TopicType.AUTOMATION: MessageHandler(
@@ -38,35 +61,91 @@ class TargetAutomation(BaseAutomation):
         try:
             self.target = float(settings.get('target'))
             self.margin = float(settings.get('margin'))
+            previous_ids = (getattr(self, 'increase_device_id', None), getattr(self, 'decrease_device_id', None))
             self.increase_device_id = settings.get('increase_device_id')  # 값을 올리는 장치 (heater)
             self.decrease_device_id = settings.get('decrease_device_id')  # 값을 내리는 장치 (cooler)
             self.in_range_count = 0  # 초기화 시점에 0으로 설정
             self.required_count = 3  # 필요한 연속 카운트 수는 3
             self.value = None
-            self.increase_device = None  # Store에서 찾은 increase 장치
-            self.decrease_device = None  # Store에서 찾은 decrease 장치
-            self.led_time_range = None  # LED 시간 범위 설정
+            self.raw_value = None  # 필터 적용 전 마지막 센서값
+            self.filters = self._build_filters(settings.get('filters'))
+            self._build_controller(settings.get('mode'), settings.get('pid'))
+            # Store에서 찾은 장치는 장치 ID가 바뀐 경우에만 버림 (바뀌면 _load_control_devices로 다시 조회)
+            if self.increase_device_id != previous_ids[0] or not hasattr(self, 'increase_device'):
+                self.increase_device = None  # Store에서 찾은 increase 장치
+            if self.decrease_device_id != previous_ids[1] or not hasattr(self, 'decrease_device'):
+                self.decrease_device = None  # Store에서 찾은 decrease 장치
             # self.logger.info(f"Target 자동화 설정 초기화: target={self.target}, margin={self.margin}")
         except (TypeError, ValueError) as e:
             self.target = None
             self.margin = None
+            self.filters = FilterPipeline()
+            self._build_controller(None, None)
             self.logger.warning("Target 자동화 설정이 비어있습니다.")
 
+    def _build_filters(self, config) -> FilterPipeline:
+        """자동화별 입력 필터 구성 (설정 오류 시 필터 없이 동작)"""
+        try:
+            return FilterPipeline.from_config(config)
+        except (TypeError, ValueError) as e:
+            self.logger.warning("Sensor %s: 필터 설정을 무시합니다 (%s)", getattr(self, 'name', '-'), e)
+            return FilterPipeline()
+
+    def _build_controller(self, mode: Optional[str], config: Optional[Dict[str, Any]]) -> None:
+        """제어 방식 구성 (PID 설정 오류 시 히스테리시스로 동작)"""
+        # 설정 변경으로 다시 만드는 경우 이전 릴레이 상태를 이어받음
+        previous = (getattr(self, 'increase_relay', None), getattr(self, 'decrease_relay', None))
+        self.mode = str(mode or MODE_HYSTERESIS).lower()
+        self.pid = None
+        self.increase_relay = None
+        self.decrease_relay = None
+        if self.mode not in CONTROL_MODES:
+            self.logger.warning("Sensor %s: 알 수 없는 제어 방식 '%s' - hysteresis로 동작합니다.",
+                                getattr(self, 'name', '-'), self.mode)
+            self.mode = MODE_HYSTERESIS
+        if self.mode != MODE_PID:
+            return
+        try:
+            options = PIDSettings.from_config(config)
+            self.pid = PIDController(options.kp, options.ki, options.kd)
+            self.increase_relay = TimeProportionalRelay(options.cycle_seconds, options.min_on, options.min_off)
+            self.decrease_relay = TimeProportionalRelay(options.cycle_seconds, options.min_on, options.min_off)
+            for relay, old in zip((self.increase_relay, self.decrease_relay), previous):
+                if old is not None:
+                    relay.restore(old.on, old.last_change)
+            self._sync_relays()
+        except (TypeError, ValueError) as e:
+            self.logger.warning("Sensor %s: PID 설정을 무시하고 hysteresis로 동작합니다 (%s)",
+                                getattr(self, 'name', '-'), e)
+            self.mode = MODE_HYSTERESIS
+
+    def _sync_relays(self) -> None:
+        """PID 릴레이 상태를 장치의 실제 상태에 맞춤 (장치가 켜져 있으면 릴레이도 on에서 시작)"""
+        for device, relay in ((getattr(self, 'increase_device', None), getattr(self, 'increase_relay', None)),
+                              (getattr(self, 'decrease_device', None), getattr(self, 'decrease_relay', None))):
+            if device is not None and relay is not None and bool(device.status) != relay.on:
+                relay.restore(bool(device.status), relay.last_change)
+
     def _load_control_devices(self, store):
-        """Store에서 increase/decrease 장치 찾기 및 LED range automation 설정 로드"""
+        """Store에서 increase/decrease 장치 찾기 및 LED 광주기 구독"""
         if self.increase_device_id:
-            self.increase_device = next(
-                (m for m in store.machines if m.machine_id == self.increase_device_id),
-                None
-            )
+            self.increase_device = store.get_machine(self.increase_device_id)
         if self.decrease_device_id:
-            self.decrease_device = next(
-                (m for m in store.machines if m.machine_id == self.decrease_device_id),
-                None
-            )
+            self.decrease_device = store.get_machine(self.decrease_device_id)
+        self._sync_relays()
 
-        # LED의 range automation 설정 로드
-        self.led_time_range = load_led_time_range(store, self.name)
+        # LED 상태가 바뀌면 유효 목표값이 바뀌므로 바로 다시 제어
+        photoperiod.subscribe(self._on_photoperiod_change)
+
+    def _on_photoperiod_change(self, led_on: bool) -> None:
+        """LED 전환/설정 변경 시 새 유효 목표값으로 제어 예약"""
+        if self.active and self.value is not None:
+            if self.logger.is_enabled_for(logging.INFO):
+                self.logger.info(
+                    "Sensor %s: LED %s - 목표값 재계산", self.name, "ON" if led_on else "OFF",
+                    target=photoperiod.effective_target(self.target) if self.target is not None else None
+                )
+            self._request_reschedule(time.time())
 
 
     def control(self) -> Optional[BaseMachine]:
@@ -75,31 +154,38 @@ class TargetAutomation(BaseAutomation):
             return None
 
         if not all([self.target is not None, self.margin is not None]):
-            self.logger.error(f"Sensor {self.name}: 필수 설정이 누락되었습니다.")
+            self.logger.error("Sensor %s: 필수 설정이 누락되었습니다.", self.name)
             raise ValueError(f"Sensor {self.name}: 필수 설정이 누락되었습니다.")
 
         if self.value is None:
             # 센서값이 없으면 제어하지 않고 종료
-            self.logger.debug(f"Sensor {self.name}: 센서값이 없어 제어하지 않습니다.")
+            self.logger.debug("Sensor %s: 센서값이 없어 제어하지 않습니다.", self.name)
             return None
 
+        self.coalescer.mark_applied(self.value, time.time())
+
         try:
             # LED 상태에 따라 동적으로 target 계산
-            effective_target = calculate_effective_target(self.target, self.led_time_range)
+            effective_target = photoperiod.effective_target(self.target)
+
+            if self.mode == MODE_PID:
+                return self._control_pid(effective_target)
 
             lower_bound = effective_target - self.margin
             upper_bound = effective_target + self.margin
+            # 로그 필드(LED 상태)는 INFO가 기록될 때만 계산
+            log_info = self.logger.is_enabled_for(logging.INFO)
 
             # 현재 온도가 목표보다 낮음 -> 값을 올려야 함 (heater)
             if self.value < lower_bound:
                 # increase 장치 켜기 (heater)
                 if self.increase_device:
                     self._turn_on_device(self.increase_device)
-                    led_status = is_led_on(self.led_time_range)
-                    self.logger.info(
-                        f"Sensor {self.name}: {self.increase_device.name} ON "
-                        f"(현재값: {self.value}, 유효목표: {effective_target}, LED: {'ON' if led_status else 'OFF'})"
-                    )
+                    if log_info:
+                        self.logger.info(
+                            "Sensor %s: %s ON", self.name, self.increase_device.name,
+                            value=self.value, target=effective_target, led=photoperiod.is_on()
+                        )
 
                 # decrease 장치 끄기 (cooler)
                 if self.decrease_device:
@@ -112,11 +198,11 @@ class TargetAutomation(BaseAutomation):
                 # decrease 장치 켜기 (cooler)
                 if self.decrease_device:
                     self._turn_on_device(self.decrease_device)
-                    led_status = is_led_on(self.led_time_range)
-                    self.logger.info(
-                        f"Sensor {self.name}: {self.decrease_device.name} ON "
-                        f"(현재값: {self.value}, 유효목표: {effective_target}, LED: {'ON' if led_status else 'OFF'})"
-                    )
+                    if log_info:
+                        self.logger.info(
+                            "Sensor %s: %s ON", self.name, self.decrease_device.name,
+                            value=self.value, target=effective_target, led=photoperiod.is_on()
+                        )
 
                 # increase 장치 끄기 (heater)
                 if self.increase_device:
@@ -126,14 +212,15 @@ class TargetAutomation(BaseAutomation):
 
             else:
                 # 적정 범위 내
-                led_status = is_led_on(self.led_time_range)
+                led_status = photoperiod.is_on() if log_info else None
                 if self.in_range_count < self.required_count:
                     self.in_range_count += 1
-                    self.logger.info(
-                        f"Sensor {self.name}: 목표값 범위 내 "
-                        f"(연속 카운트: {self.in_range_count}/{self.required_count}, "
-                        f"현재값: {self.value}, 유효목표: {effective_target}, LED: {'ON' if led_status else 'OFF'})"
-                    )
+                    if log_info:
+                        self.logger.info(
+                            "Sensor %s: 목표값 범위 내 (연속 카운트: %d/%d)",
+                            self.name, self.in_range_count, self.required_count,
+                            value=self.value, target=effective_target, led=led_status
+                        )
 
                 # 연속 카운트 도달 -> 모든 장치 끄기
                 if self.in_range_count >= self.required_count:
@@ -143,17 +230,58 @@ class TargetAutomation(BaseAutomation):
                         self._turn_off_device(self.decrease_device)
 
                     self.logger.info(
-                        f"Sensor {self.name}: 목표값 {self.required_count}회 연속 도달로 모든 장치 OFF "
-                        f"(현재값: {self.value}, 유효목표: {effective_target}, LED: {'ON' if led_status else 'OFF'})"
+                        "Sensor %s: 목표값 %d회 연속 도달로 모든 장치 OFF", self.name, self.required_count,
+                        value=self.value, target=effective_target, led=led_status
                     )
                     self.in_range_count = 0
 
             return None
 
         except Exception as e:
-            self.logger.error(f"Sensor {self.name} 제어 중 오류 발생: {str(e)}")
+            self.logger.error("Sensor %s 제어 중 오류 발생: %s", self.name, e)
             raise
 
+    def _control_pid(self, effective_target: float) -> Optional[BaseMachine]:
+        """PID 출력을 duty로 변환해 heater/cooler를 주기 내 시간 비례로 제어"""
+        now = time.time()
+        output = self.pid.update(effective_target, self.value, now)
+
+        # 양수 출력은 increase 장치(heater), 음수 출력은 decrease 장치(cooler)의 duty
+        for device, relay, duty in (
+            (self.increase_device, self.increase_relay, max(output, 0.0)),
+            (self.decrease_device, self.decrease_relay, max(-output, 0.0)),
+        ):
+            if device is None:
+                continue
+            was_on = relay.on
+            if relay.update(duty, now):
+                self._turn_on_device(device)
+            else:
+                self._turn_off_device(device)
+            if relay.on != was_on and self.logger.is_enabled_for(logging.INFO):
+                self.logger.info(
+                    "Sensor %s: %s %s", self.name, device.name, "ON" if relay.on else "OFF",
+                    value=self.value, target=effective_target, output=round(output, 3),
+                    led=photoperiod.is_on()
+                )
+
+        # 핸들러에서 실행된 경우 다음 릴레이 전환 시각으로 스케줄러 갱신
+        self._request_reschedule()
+        return None
+
+    def next_run_time(self, now: datetime) -> Optional[datetime]:
+        """PID 모드에서는 다음 릴레이 전환 시각 (히스테리시스 모드는 센서값으로만 실행)"""
+        if not self.active or self.mode != MODE_PID:
+            return None
+        edges = [
+            relay.next_edge(now.timestamp())
+            for device, relay in ((self.increase_device, self.increase_relay),
+                                  (self.decrease_device, self.decrease_relay))
+            if device is not None
+        ]
+        edges = [edge for edge in edges if edge is not None]
+        return datetime.fromtimestamp(min(edges)) if edges else None
+
     def _turn_on_device(self, device):
         """장치 켜기"""
         if not device.status:
@@ -164,38 +292,39 @@ class TargetAutomation(BaseAutomation):
         if device.status:
             device.update_status(False) 
 
-    def _handle_environment_message(self, mqtt_message: MQTTMessage) -> None:
-        """환경 센서값 메시지 처리 (Target 자동화)"""
+    def _handle_environment_message(self, message: DispatchedMessage) -> None:
+        """환경 센서값 메시지 처리 (Target 자동화, environment/<name>으로만 라우팅됨)"""
         try:
-            payload_data = MQTTPayloadData(
-                pattern=mqtt_message.topic,
-                data=SwitchMessage(
-                    name=mqtt_message.topic_parts[1],
-                    value=mqtt_message.payload['data']['value']
-                )
-            )
+            self.raw_value = float(message.value)
+            filtered = self.filters.update(self.raw_value)
+            if filtered is None:
+                # 이상치로 판단된 값은 제어에 사용하지 않음 (이전 값 유지)
+                self.logger.debug("Device %s: 센서값 필터에서 제외", self.name, raw=self.raw_value)
+                return
+            self.value = filtered
 
-            if payload_data.data.name == self.name:
-                self.value = float(payload_data.data.value)
+            self.logger.debug("Device %s: 환경 센서값 수신", self.name, value=self.value, raw=self.raw_value)
 
-                self.logger.info(
-                    f"Device {self.name}: 환경 센서값 수신 "
-                    f"(값: {self.value})"
-                )
+            # 자동화가 활성화되어 있을 때만 제어 실행
+            if self.active:
+                # 최소 간격 안에 들어온 값은 한 번의 지연 실행으로 병합, 데드밴드 안의 값은 건너뜀
+                # (연속 범위 내 카운트 중에는 값마다 카운트해야 하므로 데드밴드 미적용)
+                decision, due_at = self.coalescer.offer(self.value, time.time(), counting=self.in_range_count > 0)
+                if decision != ReadingCoalescer.RUN:
+                    if due_at is not None:
+                        self._request_reschedule(due_at)
+                    return
 
-                # 자동화가 활성화되어 있을 때만 제어 실행
-                if self.active:
-                    try:
-                        controlled_machine = self.control()
-                        if controlled_machine:
-                            self.logger.info(
-                                f"자동화 실행 성공: {self.name} "
-                                f"(현재값: {self.value}, 상태: {self.status})"
-                            )
-                    except Exception as e:
-                        self.logger.error(f"자동화 실행 중 오류 발생: {str(e)}")
-                else:
-                    self.logger.debug(f"Device {self.name}: 자동화 비활성화 상태 - 제어 건너뛰기")
+                try:
+                    controlled_machine = self.control()
+                    if controlled_machine:
+                        self.logger.info(
+                            "자동화 실행 성공: %s", self.name, value=self.value, status=self.status
+                        )
+                except Exception as e:
+                    self.logger.error("자동화 실행 중 오류 발생: %s", e)
+            else:
+                self.logger.debug("Device %s: 자동화 비활성화 상태 - 제어 건너뛰기", self.name)
 
         except Exception as e:
-            self.logger.error(f"환경 센서값 메시지 처리 실패: {str(e)}") 
\ No newline at end of file
+            self.logger.error("환경 센서값 메시지 처리 실패: %s", e)
\ No newline at end of file
@@ -1,9 +1,13 @@
 """HTTP client for PlantPoint API."""
 
-from typing import List, Dict, Any
+import threading
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from logger.custom_logger import custom_logger
+from config import settings
 from models.Response import (
     AutomationResponse,
     AutomationSwitchResponse,
@@ -33,8 +37,36 @@ class HTTP:
     """HTTP client for API communication."""
 
     def __init__(self) -> None:
+        self.session = self._create_session()
+        # URL별 마지막 응답의 캐시 검증자 (ETag / Last-Modified)
+        self._validators: Dict[str, Dict[str, str]] = {}
+        self._token_lock = threading.Lock()
         self.token = self._get_token()
         self.headers = {'Authorization': f'Bearer {self.token}'}
+        self.session.headers.update(self.headers)
+
+    def _create_session(self) -> requests.Session:
+        """
+        keep-alive 커넥션 풀과 재시도 정책을 가진 세션 생성
+
+        Returns:
+            requests.Session: Pooled session shared by all requests
+        """
+        retry = Retry(
+            total=settings.http_retry_total,
+            backoff_factor=settings.http_retry_backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({'GET', 'POST'})
+        )
+        adapter = HTTPAdapter(
+            pool_connections=settings.http_pool_size,
+            pool_maxsize=settings.http_pool_size,
+            max_retries=retry
+        )
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
 
     def _get_token(self) -> str:
         """
@@ -47,10 +79,10 @@ class HTTP:
             Exception: If authentication fails
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 SIGNIN_URL,
                 json={'username': USERNAME, 'password': PASSWORD},
-                timeout=10
+                timeout=settings.http_timeout
             )
             response.raise_for_status()
             return response.json()['accessToken']
@@ -58,55 +90,96 @@ class HTTP:
             custom_logger.error(f"토큰 획득 실패: {str(e)}")
             raise
 
-    def _get_request(self, url: str) -> List[Dict[str, Any]]:
+    def _refresh_token(self, expired_token: str) -> None:
+        """
+        만료된 토큰 재발급 (병렬 요청이 동시에 401을 받아도 한 번만 재발급)
+
+        Args:
+            expired_token: Token the failed request was sent with
+        """
+        with self._token_lock:
+            if self.token != expired_token:
+                return  # 다른 요청이 이미 재발급함
+            custom_logger.info("인증 토큰 만료, 재발급합니다.")
+            self.token = self._get_token()
+            self.headers = {'Authorization': f'Bearer {self.token}'}
+            self.session.headers.update(self.headers)
+
+    def _get_request(self, url: str, conditional: bool = False) -> Optional[List[Dict[str, Any]]]:
         """
         GET 요청 처리
 
         Args:
             url: Request URL
+            conditional: Send If-None-Match/If-Modified-Since from the last response
 
         Returns:
-            Response JSON data
+            Response JSON data, or None if conditional and the server answered 304
 
         Raises:
-            Exception: If request fails
+            Exception: If request fails (a 401 is retried once with a new token)
         """
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            headers = {}
+            validators = self._validators.get(url, {})
+            if conditional:
+                if 'ETag' in validators:
+                    headers['If-None-Match'] = validators['ETag']
+                if 'Last-Modified' in validators:
+                    headers['If-Modified-Since'] = validators['Last-Modified']
+
+            token = self.token
+            response = self.session.get(url, headers=headers, timeout=settings.http_timeout)
+            if response.status_code == 401:
+                # 토큰 만료: 재발급 후 한 번만 다시 요청
+                self._refresh_token(token)
+                response = self.session.get(url, headers=headers, timeout=settings.http_timeout)
+            if conditional and response.status_code == 304:
+                return None
             response.raise_for_status()
+
+            self._validators[url] = {
+                name: response.headers[name]
+                for name in ('ETag', 'Last-Modified')
+                if name in response.headers
+            }
             return response.json()
         except Exception as e:
             custom_logger.error(f"GET 요청 실패 ({url}): {str(e)}")
             raise
 
-    def get_automations(self) -> List[Dict[str, Any]]:
+    def get_automations(self, conditional: bool = False) -> Optional[List[Dict[str, Any]]]:
         """Get automation configurations."""
-        return self._get_request(AUTOMATION_READ_URL)
+        return self._get_request(AUTOMATION_READ_URL, conditional)
 
-    def get_interval_device_states(self) -> List[Dict[str, Any]]:
+    def get_interval_device_states(self, conditional: bool = False) -> Optional[List[Dict[str, Any]]]:
         """Get interval-based device states."""
-        return self._get_request(INTERVAL_DEVICE_STATES_READ_URL)
+        return self._get_request(INTERVAL_DEVICE_STATES_READ_URL, conditional)
 
-    def get_environments(self) -> List[Dict[str, Any]]:
+    def get_environments(self, conditional: bool = False) -> Optional[List[Dict[str, Any]]]:
         """Get latest environment readings."""
-        return self._get_request(ENVIRONMENT_EACH_LATEST_READ_URL)
+        return self._get_request(ENVIRONMENT_EACH_LATEST_READ_URL, conditional)
 
-    def get_environment_type(self) -> List[Dict[str, Any]]:
+    def get_environment_type(self, conditional: bool = False) -> Optional[List[Dict[str, Any]]]:
         """Get environment type configurations."""
-        return self._get_request(ENVIRONMENT_TYPE_READ_URL)
+        return self._get_request(ENVIRONMENT_TYPE_READ_URL, conditional)
 
-    def get_switches(self) -> List[Dict[str, Any]]:
+    def get_switches(self, conditional: bool = False) -> Optional[List[Dict[str, Any]]]:
         """Get latest switch states."""
-        return self._get_request(SWITCH_EACH_LATEST_READ_URL)
+        return self._get_request(SWITCH_EACH_LATEST_READ_URL, conditional)
 
-    def get_machines(self) -> List[Dict[str, Any]]:
+    def get_machines(self, conditional: bool = False) -> Optional[List[Dict[str, Any]]]:
         """Get machine configurations."""
-        return self._get_request(MACHINE_READ_URL)
+        return self._get_request(MACHINE_READ_URL, conditional)
 
-    def get_sensors(self) -> List[Dict[str, Any]]:
+    def get_sensors(self, conditional: bool = False) -> Optional[List[Dict[str, Any]]]:
         """Get sensor configurations."""
-        return self._get_request(SENSOR_READ_URL)
+        return self._get_request(SENSOR_READ_URL, conditional)
 
-    def get_currents(self) -> List[Dict[str, Any]]:
+    def get_currents(self, conditional: bool = False) -> Optional[List[Dict[str, Any]]]:
         """Get current monitoring data."""
-        return self._get_request(CURRENT_READ_URL)
\ No newline at end of file
+        return self._get_request(CURRENT_READ_URL, conditional)
+
+    def close(self) -> None:
+        """세션 커넥션 풀 정리"""
+        self.session.close()
\ No newline at end of file
@@ -1,12 +1,19 @@
 """MQTT client for PlantPoint automation system."""
 
-import json
+import threading
+import time
 import uuid
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List, Tuple
 import paho.mqtt.client as mqtt
 from logger.custom_logger import custom_logger
+from config import settings
 from constants import MQTT_HOST, MQTT_PORT, MQTT_ID
 from settings.mqtt_topics import MQTTTopics
+from resources.mqtt_connection import MQTTConnectionManager
+from resources.mqtt_publisher import MQTTPublisher
+from utils.metrics import LatencyRecorder
+from utils.mqtt_codec import decode_payload
+from utils.work_queue import KeyedCoalescingQueue
 
 # MQTT Connection return codes
 MQTT_RC_CODES = {
@@ -19,11 +26,181 @@ MQTT_RC_CODES = {
 }
 
 
+class DispatchedMessage:
+    """
+    MQTT message parsed once for every handler it is routed to.
+
+    Attributes:
+        topic: Full topic, e.g. "environment/temperature"
+        kind: First topic level ("environment", "switch", ...)
+        name: Remainder of the topic (device or sensor name)
+        payload: Decoded JSON (compact payloads are expanded to the same
+            schema, see utils/mqtt_codec.py), or the raw text otherwise
+        value: payload["data"]["value"] for dict payloads, else the payload itself
+        received_at: time.perf_counter() when the message reached the dispatcher
+    """
+
+    __slots__ = ("topic", "kind", "name", "payload", "value", "received_at")
+
+    def __init__(self, topic: str, raw_payload: bytes, received_at: float) -> None:
+        self.topic = topic
+        self.kind, _, self.name = topic.partition('/')
+        self.received_at = received_at
+        try:
+            self.payload = decode_payload(topic, raw_payload)
+        except (ValueError, UnicodeDecodeError):
+            self.payload = raw_payload.decode(errors='ignore')
+
+        if isinstance(self.payload, dict):
+            data = self.payload.get('data')
+            self.value = data.get('value') if isinstance(data, dict) else None
+        else:
+            self.value = self.payload
+
+
+MessageCallback = Callable[[DispatchedMessage], None]
+
+
+class MessageDispatcher:
+    """
+    Single on_message entry point that routes MQTT messages to handlers.
+
+    Handlers are registered per exact topic ("switch/led") or per first-level
+    wildcard ("current/#"). Routing tables are rebuilt copy-on-write when
+    handlers change, so the paho network thread looks them up without taking
+    a lock, skips unrouted messages before parsing them, and parses routed
+    payloads exactly once.
+
+    After start(), the network thread only enqueues raw payloads; parsing and
+    handlers run on a worker pool keyed by device name, so a slow control()
+    cannot stall keepalives. Messages for the same device keep their order,
+    and a topic that is still waiting is replaced by its newest payload.
+    Before start() messages are handled inline on the calling thread.
+    """
+
+    def __init__(self, workers: Optional[int] = None, queue_size: Optional[int] = None) -> None:
+        """
+        Initialize MessageDispatcher.
+
+        Args:
+            workers: Handler worker threads (defaults to settings.mqtt_dispatch_workers)
+            queue_size: Maximum pending messages (defaults to settings.mqtt_dispatch_queue_size)
+        """
+        self._exact: Dict[str, Tuple[MessageCallback, ...]] = {}
+        self._wildcard: Dict[str, Tuple[MessageCallback, ...]] = {}
+        self._lock = threading.Lock()
+        self.latency = LatencyRecorder()
+        self.dispatched = 0
+        self.unrouted = 0
+        self.queue = KeyedCoalescingQueue(
+            handler=self._process,
+            workers=workers or settings.mqtt_dispatch_workers,
+            maxsize=queue_size or settings.mqtt_dispatch_queue_size,
+            name="MQTTDispatch"
+        )
+
+    def start(self) -> None:
+        """핸들러 워커 풀 시작 (이후 paho 스레드는 큐에 넣기만 함)"""
+        self.queue.start()
+
+    def stop(self) -> None:
+        """대기 중인 메시지를 처리한 뒤 워커 풀 종료"""
+        self.queue.stop()
+
+    def add(self, topic_filter: str, handler: MessageCallback) -> None:
+        """
+        핸들러 등록
+
+        Args:
+            topic_filter: Exact topic or "<type>/#"
+            handler: Called with the parsed DispatchedMessage
+
+        Raises:
+            ValueError: If the filter uses an unsupported wildcard
+        """
+        with self._lock:
+            table, key = self._table_for(topic_filter)
+            updated = dict(table)
+            updated[key] = updated.get(key, ()) + (handler,)
+            self._store_table(topic_filter, updated)
+
+    def remove(self, topic_filter: str, handler: MessageCallback) -> None:
+        """핸들러 등록 해제 (등록되지 않았으면 무시)"""
+        with self._lock:
+            table, key = self._table_for(topic_filter)
+            remaining = tuple(h for h in table.get(key, ()) if h != handler)
+            updated = dict(table)
+            if remaining:
+                updated[key] = remaining
+            else:
+                updated.pop(key, None)
+            self._store_table(topic_filter, updated)
+
+    def _table_for(self, topic_filter: str) -> Tuple[Dict[str, Tuple[MessageCallback, ...]], str]:
+        """토픽 필터에 해당하는 라우팅 테이블과 키 반환"""
+        if topic_filter.endswith('/#') and topic_filter.count('/') == 1 and '+' not in topic_filter:
+            return self._wildcard, topic_filter[:-2]
+        if '#' in topic_filter or '+' in topic_filter:
+            raise ValueError(f"지원하지 않는 토픽 필터: {topic_filter}")
+        return self._exact, topic_filter
+
+    def _store_table(self, topic_filter: str, table: Dict[str, Tuple[MessageCallback, ...]]) -> None:
+        """새로 만든 라우팅 테이블로 교체"""
+        if topic_filter.endswith('/#'):
+            self._wildcard = table
+        else:
+            self._exact = table
+
+    def _handlers_for(self, topic: str) -> Tuple[MessageCallback, ...]:
+        """토픽을 받는 핸들러 목록 (정확히 일치 + 와일드카드)"""
+        return self._exact.get(topic, ()) + self._wildcard.get(topic.partition('/')[0], ())
+
+    def on_message(self, client: mqtt.Client, userdata: Any, message: mqtt.MQTTMessage) -> None:
+        """paho on_message 콜백: 관심 있는 메시지만 워커 큐에 전달 (시작 전이면 즉시 처리)"""
+        received_at = time.perf_counter()
+        topic = message.topic
+        if not self._handlers_for(topic):
+            self.unrouted += 1
+            return
+
+        if self.queue.running:
+            self.queue.submit(topic.partition('/')[2], topic, (message.payload, received_at))
+        else:
+            self._process(None, topic, (message.payload, received_at))
+
+    def _process(self, key: Any, topic: str, item: Tuple[bytes, float]) -> None:
+        """메시지를 한 번 파싱해 등록된 핸들러에 전달"""
+        raw_payload, received_at = item
+        handlers = self._handlers_for(topic)
+        if not handlers:
+            return
+
+        parsed = DispatchedMessage(topic, raw_payload, received_at)
+        for handler in handlers:
+            try:
+                handler(parsed)
+            except Exception as e:
+                custom_logger.error(f"MQTT 메시지 처리 실패 ({topic}): {str(e)}")
+
+        self.dispatched += 1
+        self.latency.record(time.perf_counter() - received_at)
+
+    def report(self) -> str:
+        """디스패치 지연 시간 및 큐 상태 요약"""
+        return (
+            f"dispatched={self.dispatched} unrouted={self.unrouted} latency {self.latency.summary()} | "
+            f"queue {self.queue.report()}"
+        )
+
+
 class MQTTClient:
     """
     MQTT client for device communication and automation control.
 
     Handles connection, reconnection, topic subscription, and message publishing.
+    Connecting and reconnecting run on an MQTTConnectionManager thread
+    (resources/mqtt_connection.py) started by start(). Outgoing messages go
+    through an MQTTPublisher queue (resources/mqtt_publisher.py).
     """
 
     def __init__(
@@ -40,13 +217,13 @@ class MQTTClient:
             port: MQTT broker port
             client_id: Unique client identifier (auto-generated if None)
 
-        Raises:
-            ConnectionError: If initial connection fails
+        The broker is not contacted here; call start() to connect in the background.
         """
         self.host = host
         self.port = int(port or MQTT_PORT)
         self.client_id = client_id or MQTT_ID or f"automation_{uuid.uuid4().hex[:8]}"
         self.connected = False
+        self.dispatcher = MessageDispatcher()
 
         # Create MQTT client
         try:
@@ -55,33 +232,37 @@ class MQTTClient:
             custom_logger.error(f"MQTT 클라이언트 생성 실패: {e}")
             raise
 
+        # 연결 전 발행 메시지는 outbox에 보관했다가 연결되면 전송
+        self.publisher = MQTTPublisher(self.client, connected=False)
+        self.connection = MQTTConnectionManager(self.client, self.host, self.port)
+        self._subscribe_mid: Optional[int] = None
+
         # Set callbacks
         self.client.on_connect = self._on_connect
         self.client.on_disconnect = self._on_disconnect
+        self.client.on_subscribe = self._on_subscribe
+        self.client.on_message = self.dispatcher.on_message
+        self.client.on_publish = self.publisher.on_publish
 
-        # Connect to broker
-        try:
-            custom_logger.info(
-                f"MQTT 브로커 연결 시도: {self.host}:{self.port} "
-                f"(client_id: {self.client_id})"
-            )
-            self.client.connect(self.host, self.port, keepalive=60)
-            custom_logger.info("MQTT 클라이언트 초기화 완료 (연결 대기 중...)")
-        except OSError as e:
-            error_msg = (
-                f"MQTT 브로커 연결 실패: {self.host}:{self.port}\n"
-                f"에러: {e}\n"
-                f"해결 방법:\n"
-                f"1. MQTT 브로커가 실행 중인지 확인: docker ps | grep mqtt\n"
-                f"2. .env.development 파일에서 MQTT_HOST가 올바른지 확인\n"
-                f"3. 로컬 개발: MQTT_HOST=127.0.0.1 또는 localhost\n"
-                f"4. Docker 내부: MQTT_HOST=mqtt"
-            )
-            custom_logger.error(error_msg)
-            raise ConnectionError(error_msg) from e
-        except Exception as e:
-            custom_logger.error(f"MQTT 연결 중 예상치 못한 오류: {e}", exc_info=True)
-            raise
+    def start(self) -> None:
+        """백그라운드 연결 시작 (연결을 기다리지 않음)"""
+        custom_logger.info(
+            f"MQTT 브로커 연결 시도: {self.host}:{self.port} "
+            f"(client_id: {self.client_id})"
+        )
+        self.connection.start()
+
+    def wait_until_connected(self, timeout: Optional[float] = None) -> bool:
+        """
+        브로커에 연결될 때까지 대기
+
+        Args:
+            timeout: Maximum wait in seconds (None waits forever)
+
+        Returns:
+            bool: True if connected within timeout
+        """
+        return self.connection.wait_until_connected(timeout)
 
     def _on_connect(
         self,
@@ -101,6 +282,7 @@ class MQTTClient:
         """
         if rc == 0:
             self.connected = True
+            self.connection.on_connected()
             custom_logger.info(
                 f"MQTT 브로커 연결 성공: {self.host}:{self.port} "
                 f"(client_id: {self.client_id})"
@@ -108,10 +290,13 @@ class MQTTClient:
 
             # Subscribe to topics
             topics = [(topic, 0) for topic in MQTTTopics.SUBSCRIBED]
-            self.client.subscribe(topics)
+            _, self._subscribe_mid = self.client.subscribe(topics)
             custom_logger.info(
                 f"MQTT 토픽 구독: {', '.join([t[0] for t in topics])}"
             )
+
+            # 연결이 끊긴 동안 보관한 메시지 재전송
+            self.publisher.set_connected(True)
         else:
             self.connected = False
             error_msg = MQTT_RC_CODES.get(rc, f"Unknown error code: {rc}")
@@ -132,6 +317,8 @@ class MQTTClient:
             rc: Disconnection result code
         """
         self.connected = False
+        self.connection.on_disconnected()
+        self.publisher.set_connected(False)
         if rc != 0:
             custom_logger.warning(
                 f"MQTT 브로커 연결이 예기치 않게 종료됨 (code: {rc}). "
@@ -140,49 +327,72 @@ class MQTTClient:
         else:
             custom_logger.info("MQTT 브로커 연결 정상 종료")
 
+    def _on_subscribe(self, client: mqtt.Client, userdata: Any, mid: int, *args: Any) -> None:
+        """
+        MQTT subscription callback (SUBACK).
+
+        Args:
+            client: MQTT client instance
+            userdata: User data
+            mid: Message id of the acknowledged SUBSCRIBE
+        """
+        if mid == self._subscribe_mid:
+            self.connection.on_subscribed()
+
     def publish_message(
         self,
         topic: str,
         payload: Dict[str, Any],
         qos: int = 0,
-        retain: bool = False
+        retain: bool = False,
+        coalesce: Optional[bool] = None
     ) -> bool:
         """
-        MQTT 메시지 발행
+        MQTT 메시지 발행 (발행 큐에 추가, 연결이 끊겨 있으면 outbox에 보관)
 
         Args:
             topic: MQTT 토픽
             payload: 전송할 데이터
             qos: Quality of Service level (0, 1, or 2)
             retain: Whether to retain message
+            coalesce: Replace a still-queued command for the same topic
+                      (defaults to True for switch/ topics)
 
         Returns:
-            bool: 발행 성공 여부
+            bool: 발행 요청 성공 여부 (큐가 가득 찼으면 False)
         """
-        if not self.connected:
-            custom_logger.error("MQTT 브로커에 연결되지 않았습니다. 메시지 발행 실패.")
+        if coalesce is None:
+            coalesce = topic.startswith('switch/')
+        try:
+            return self.publisher.publish(topic, payload, qos=qos, retain=retain, coalesce=coalesce)
+        except Exception as e:
+            custom_logger.error(f"MQTT 메시지 발행 중 오류: {e}", exc_info=True)
             return False
 
-        try:
-            message = json.dumps(payload)
-            info = self.client.publish(topic, message, qos=qos, retain=retain)
+    def publish_many(self, messages: List[Tuple[str, Dict[str, Any]]], qos: int = 0) -> int:
+        """
+        여러 메시지를 한 번에 발행 큐에 추가 (센서 값 묶음)
 
-            if info.rc == mqtt.MQTT_ERR_SUCCESS:
-                # custom_logger.debug(f"MQTT 메시지 발행 성공: {topic}")
-                return True
-            else:
-                error_msg = mqtt.error_string(info.rc)
-                custom_logger.error(f"MQTT 메시지 발행 실패: {error_msg}")
-                return False
+        Args:
+            messages: (topic, payload) pairs
+            qos: Quality of Service level
+
+        Returns:
+            int: 큐에 추가된 메시지 수
+        """
+        try:
+            return self.publisher.publish_many(messages, qos=qos)
         except Exception as e:
             custom_logger.error(f"MQTT 메시지 발행 중 오류: {e}", exc_info=True)
-            return False
+            return 0
 
     def disconnect(self) -> None:
         """MQTT 브로커 연결 종료"""
         try:
-            self.client.loop_stop()
-            self.client.disconnect()
+            # 대기 중인 발행 메시지를 먼저 보낸 뒤 네트워크 루프 종료
+            self.publisher.stop()
+            self.connection.stop()
+            self.dispatcher.stop()
             self.connected = False
             custom_logger.info("MQTT 클라이언트 종료 완료")
         except Exception as e:
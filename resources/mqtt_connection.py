@@ -0,0 +1,207 @@
+"""MQTT 연결 관리: 백그라운드 연결, 지터가 있는 지수 백오프 재연결, 연결 끊김 지표"""
+
+import random
+import threading
+import time
+from typing import Optional
+import paho.mqtt.client as mqtt
+from logger.custom_logger import custom_logger
+from config import settings
+from utils.metrics import Histogram, LatencyRecorder
+
+# 연결 끊김 ~ 재구독 완료 시간 히스토그램 구간 (초)
+OUTAGE_BUCKETS = (1, 5, 15, 60, 300)
+# 이보다 짧게 유지된 연결이 끊기면 즉시 재연결하지 않고 백오프 (연결 직후 끊김 반복 방지)
+STABLE_CONNECTION_SECONDS = 10.0
+
+
+class MQTTConnectionManager:
+    """
+    Owns the paho network loop and reconnects with jittered exponential backoff.
+
+    start() returns immediately; a "MQTTNetwork" thread connects, runs
+    client.loop() while the connection is up, and after a failure or
+    disconnect waits before the next attempt. The first retry after a lost
+    connection is immediate, so a short network blip costs one round trip
+    (unless the connection lasted under STABLE_CONNECTION_SECONDS); after
+    that the delay doubles from `min_delay` up to `max_delay`, and
+    each delay is reduced by a random fraction up to `jitter` so a fleet of
+    controllers does not reconnect to a restarted broker in lockstep.
+
+    A dropped connection is detected within about 1.5 x keepalive even if
+    the socket is not closed, so full control (CONNACK + SUBACK) returns
+    within 1.5 x keepalive + max_delay + one connect round trip.
+
+    Counters: connects, reconnects, connect failures, an outage histogram
+    (disconnect until resubscribed) and resubscription latency
+    (CONNACK to SUBACK).
+    """
+
+    def __init__(
+        self,
+        client: mqtt.Client,
+        host: str,
+        port: int,
+        keepalive: Optional[int] = None,
+        min_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        jitter: Optional[float] = None
+    ) -> None:
+        """
+        Initialize MQTTConnectionManager.
+
+        Args:
+            client: paho client (its network loop must not be started elsewhere)
+            host: MQTT broker hostname or IP
+            port: MQTT broker port
+            keepalive: Keepalive in seconds (defaults to settings.mqtt_keepalive)
+            min_delay: First backoff delay in seconds (defaults to settings.mqtt_reconnect_min_delay)
+            max_delay: Backoff cap in seconds (defaults to settings.mqtt_reconnect_max_delay)
+            jitter: Fraction 0-1 of each delay that is randomized (defaults to settings.mqtt_reconnect_jitter)
+        """
+        self.client = client
+        self.host = host
+        self.port = port
+        self.keepalive = keepalive or settings.mqtt_keepalive
+        self.min_delay = settings.mqtt_reconnect_min_delay if min_delay is None else min_delay
+        self.max_delay = settings.mqtt_reconnect_max_delay if max_delay is None else max_delay
+        self.jitter = min(1.0, max(0.0, settings.mqtt_reconnect_jitter if jitter is None else jitter))
+
+        self._connected = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._attempt = 0  # 연속 실패 횟수
+        self._disconnected_at: Optional[float] = time.monotonic()  # 시작 시에는 연결 전
+        self._connected_at: Optional[float] = None
+        self._ever_connected = False
+
+        self.connects = 0
+        self.reconnects = 0
+        self.connect_failures = 0
+        self.disconnects = 0
+        self.outages = Histogram(OUTAGE_BUCKETS)
+        self.resubscribe_latency = LatencyRecorder()
+        self.last_outage: Optional[float] = None
+
+    @property
+    def connected(self) -> bool:
+        """브로커 연결(CONNACK 수신) 여부"""
+        return self._connected.is_set()
+
+    def start(self) -> None:
+        """백그라운드 연결 시작 (호출 스레드를 막지 않음)"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="MQTTNetwork", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """연결 종료 및 네트워크 스레드 정지"""
+        self._stop.set()
+        try:
+            self.client.disconnect()
+        except Exception as e:
+            custom_logger.debug(f"MQTT disconnect 중 오류 (무시): {e}")
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def wait_until_connected(self, timeout: Optional[float] = None) -> bool:
+        """
+        연결될 때까지 대기 (이벤트 기반, 폴링 없음)
+
+        Returns:
+            bool: True if connected within timeout
+        """
+        return self._connected.wait(timeout)
+
+    def next_delay(self) -> float:
+        """다음 연결 시도까지의 대기 시간 (연결 끊김 직후 첫 시도는 즉시)"""
+        if self._attempt == 0:
+            return 0.0
+        delay = min(self.max_delay, self.min_delay * (2 ** (self._attempt - 1)))
+        return delay * (1.0 - self.jitter * random.random())
+
+    def _run(self) -> None:
+        """연결 -> client.loop() 반복 -> 끊기면 백오프 후 재연결"""
+        while not self._stop.is_set():
+            delay = self.next_delay()
+            if delay and self._stop.wait(delay):
+                break
+            connects = self.connects
+            try:
+                self.client.connect(self.host, self.port, keepalive=self.keepalive)
+            except OSError as e:
+                self._connect_failed(e)
+                continue
+
+            rc = mqtt.MQTT_ERR_SUCCESS
+            while rc == mqtt.MQTT_ERR_SUCCESS and not self._stop.is_set():
+                rc = self.client.loop(timeout=1.0)
+            if self._stop.is_set():
+                break
+            if self.connects == connects:
+                # CONNACK 전에 끊기거나 거부된 경우 (인증 실패 등)
+                self._connect_failed(None)
+            elif time.monotonic() - self._connected_at < STABLE_CONNECTION_SECONDS:
+                self._attempt += 1
+            else:
+                self._attempt = 0
+
+    def _connect_failed(self, error: Optional[Exception]) -> None:
+        """연결 실패 기록 (같은 끊김 구간에서는 첫 실패만 ERROR 로그)"""
+        self._attempt += 1
+        self.connect_failures += 1
+        if self._attempt == 1 or self._attempt % 10 == 0:
+            reason = str(error) if error is not None else "CONNACK 전에 연결 종료 또는 연결 거부"
+            if not self._ever_connected and self._attempt == 1:
+                custom_logger.error(
+                    f"MQTT 브로커 연결 실패: {self.host}:{self.port}\n"
+                    f"에러: {reason}\n"
+                    f"해결 방법:\n"
+                    f"1. MQTT 브로커가 실행 중인지 확인: docker ps | grep mqtt\n"
+                    f"2. .env.development 파일에서 MQTT_HOST가 올바른지 확인\n"
+                    f"3. 로컬 개발: MQTT_HOST=127.0.0.1 또는 localhost\n"
+                    f"4. Docker 내부: MQTT_HOST=mqtt"
+                )
+            else:
+                custom_logger.warning(
+                    f"MQTT 재연결 실패 {self._attempt}회: {reason} (최대 간격 {self.max_delay:g}초로 재시도)"
+                )
+
+    def on_connected(self) -> None:
+        """CONNACK 성공 시 호출 (paho on_connect)"""
+        self._connected_at = time.monotonic()
+        self.connects += 1
+        if self._ever_connected:
+            self.reconnects += 1
+        self._ever_connected = True
+        self._connected.set()
+
+    def on_disconnected(self) -> None:
+        """연결 끊김 시 호출 (paho on_disconnect)"""
+        if not self._connected.is_set():
+            return
+        self._connected.clear()
+        self.disconnects += 1
+        self._disconnected_at = time.monotonic()
+
+    def on_subscribed(self) -> None:
+        """재구독 완료(SUBACK) 시 호출: 자동화가 센서 메시지를 다시 받기 시작한 시점"""
+        now = time.monotonic()
+        if self._connected_at is not None:
+            self.resubscribe_latency.record(now - self._connected_at)
+        if self._disconnected_at is not None and self.disconnects:
+            self.last_outage = now - self._disconnected_at
+            self.outages.record(self.last_outage)
+            custom_logger.info(f"MQTT 제어 복구: 연결 끊김 후 {self.last_outage:.2f}초 만에 재구독 완료")
+        self._disconnected_at = None
+
+    def report(self) -> str:
+        """연결 지표 요약"""
+        return (
+            f"connected={self.connected} connects={self.connects} reconnects={self.reconnects} "
+            f"failures={self.connect_failures} outages {self.outages.summary()} | "
+            f"resubscribe {self.resubscribe_latency.summary()}"
+        )
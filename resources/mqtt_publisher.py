@@ -0,0 +1,482 @@
+"""MQTT 발행 큐: 한 번 직렬화, 스위치 명령 병합, QoS 1 응답 추적, 연결 끊김 시 outbox 보관"""
+
+import itertools
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+import paho.mqtt.client as mqtt
+from logger.custom_logger import custom_logger
+from config import settings
+from utils.metrics import LatencyRecorder
+from utils.mqtt_codec import PayloadCodec
+
+# 토픽별 발행률 지수 평균 시간 상수 (초)
+RATE_TIME_CONSTANT = 60.0
+# 등록 전에 도착한 응답 mid 보관 개수 (QoS 0 전송 완료 알림도 섞여 들어오므로 오래된 것부터 버림)
+EARLY_ACK_LIMIT = 1024
+
+
+class OutboundMessage:
+    """발행 대기/응답 대기 중인 메시지"""
+
+    __slots__ = ("topic", "payload", "qos", "retain", "coalesce", "enqueued_at", "not_before", "mid")
+
+    def __init__(
+        self, topic: str, payload: bytes, qos: int, retain: bool, enqueued_at: float, coalesce: bool = False
+    ) -> None:
+        self.topic = topic
+        self.payload = payload
+        self.qos = qos
+        self.retain = retain
+        self.coalesce = coalesce
+        self.enqueued_at = enqueued_at
+        self.not_before = enqueued_at
+        self.mid: Optional[int] = None
+
+
+class MQTTOutbox:
+    """
+    Bounded in-memory outbox for messages published while disconnected.
+
+    Only the latest message per topic is kept (a switch command or sensor
+    reading supersedes the previous one), ordered by when each topic was last
+    written, so a reconnect replays the final state of every topic in the
+    order it was reached. When `max_topics` is exceeded the topic written
+    longest ago is dropped; messages older than `max_age` seconds are
+    discarded at flush instead of replaying stale state.
+    """
+
+    def __init__(self, max_topics: int, max_age: float = 0.0) -> None:
+        """
+        Initialize MQTTOutbox.
+
+        Args:
+            max_topics: Maximum buffered topics
+            max_age: Discard messages older than this at flush (seconds, 0 = keep all)
+        """
+        self.max_topics = max_topics
+        self.max_age = max_age
+        self._messages: 'OrderedDict[str, OutboundMessage]' = OrderedDict()
+        self.buffered = 0
+        self.compacted = 0
+        self.dropped = 0
+        self.expired = 0
+        self.flushed = 0
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def put(self, message: OutboundMessage) -> None:
+        """메시지 보관 (같은 토픽의 이전 메시지는 교체)"""
+        self.buffered += 1
+        if self._messages.pop(message.topic, None) is not None:
+            self.compacted += 1
+        elif len(self._messages) >= self.max_topics:
+            self._messages.popitem(last=False)
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                custom_logger.warning(f"MQTT outbox가 가득 차 오래된 토픽을 버림 (누적 {self.dropped}건)")
+        self._messages[message.topic] = message
+
+    def drain(self, now: float) -> List[OutboundMessage]:
+        """보관 중인 메시지를 순서대로 꺼냄 (max_age 초과 메시지 제외)"""
+        messages = list(self._messages.values())
+        self._messages.clear()
+        if self.max_age > 0:
+            fresh = [message for message in messages if now - message.enqueued_at <= self.max_age]
+            self.expired += len(messages) - len(fresh)
+            messages = fresh
+        self.flushed += len(messages)
+        return messages
+
+    def report(self) -> str:
+        """outbox 상태 요약"""
+        return (
+            f"size={len(self._messages)} buffered={self.buffered} compacted={self.compacted} "
+            f"dropped={self.dropped} expired={self.expired} flushed={self.flushed}"
+        )
+
+
+class TopicRate:
+    """토픽별 발행 수와 지수 감쇠 발행률 (msg/s)"""
+
+    __slots__ = ("count", "coalesced", "_decayed", "_first_at", "_updated_at")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.coalesced = 0
+        self._decayed = 0.0
+        self._first_at: Optional[float] = None
+        self._updated_at = 0.0
+
+    def record(self, now: float) -> None:
+        """발행 1건 기록"""
+        if self._first_at is None:
+            self._first_at = now
+        else:
+            self._decayed *= math.exp(-(now - self._updated_at) / RATE_TIME_CONSTANT)
+        self._decayed += 1.0 / RATE_TIME_CONSTANT
+        self._updated_at = now
+        self.count += 1
+
+    def rate(self, now: float) -> float:
+        """now 시점의 발행률 (최근 약 RATE_TIME_CONSTANT초 가중 평균, 기록 초기에는 경과 시간으로 보정)"""
+        if self._first_at is None:
+            return 0.0
+        decayed = self._decayed * math.exp(-(now - self._updated_at) / RATE_TIME_CONSTANT)
+        elapsed = max(now - self._first_at, 1.0)
+        return decayed / (1.0 - math.exp(-elapsed / RATE_TIME_CONSTANT))
+
+
+class MQTTPublisher:
+    """
+    Outbound MQTT queue drained by one publisher thread.
+
+    publish() serializes the payload once on the caller's thread (JSON, or
+    the compact layout for topic families configured in the PayloadCodec) and
+    only enqueues it, so automations and sensor loops never wait on the paho
+    socket lock. Messages published with coalesce=True (switch commands) are
+    held for `coalesce_window` seconds; a newer command for the same topic
+    that arrives while one is still held or queued replaces its payload, so
+    flapping commands reach the broker once with the final state.
+
+    QoS 1/2 messages occupy an in-flight slot from client.publish() until the
+    broker acknowledges them (on_publish). At `max_in_flight` unacknowledged
+    messages the publisher thread waits instead of piling more into paho's
+    own queue. End-to-end latency (enqueue to PUBACK) and per-topic publish
+    rates are exposed through report() and topic_rates().
+
+    While disconnected, messages go to an MQTTOutbox (last value per topic)
+    instead of paho; set_connected(True) from on_connect replays the outbox
+    in order ahead of newer messages.
+
+    Before start() publish() sends inline on the calling thread.
+    """
+
+    def __init__(
+        self,
+        client: mqtt.Client,
+        queue_size: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        coalesce_window: Optional[float] = None,
+        connected: bool = True,
+        codec: Optional[PayloadCodec] = None
+    ) -> None:
+        """
+        Initialize MQTTPublisher.
+
+        Args:
+            client: paho client used to send
+            queue_size: Maximum queued messages (defaults to settings.mqtt_publish_queue_size)
+            max_in_flight: Maximum unacknowledged QoS 1/2 messages (defaults to settings.mqtt_max_in_flight)
+            coalesce_window: Seconds a coalescable message is held (defaults to settings.mqtt_coalesce_window)
+            connected: Initial connection state (False buffers into the outbox until set_connected(True))
+            codec: Payload encoder (defaults to PayloadCodec() with settings.mqtt_compact_topics)
+        """
+        self.client = client
+        self.queue_size = queue_size or settings.mqtt_publish_queue_size
+        self.max_in_flight = max_in_flight or settings.mqtt_max_in_flight
+        self.coalesce_window = settings.mqtt_coalesce_window if coalesce_window is None else coalesce_window
+        self.codec = codec or PayloadCodec()
+
+        self._cond = threading.Condition()
+        self._ready: Deque[OutboundMessage] = deque()
+        self._held: Dict[str, OutboundMessage] = {}  # 병합 구간 대기 중 (토픽별)
+        self._queued: Dict[str, OutboundMessage] = {}  # 아직 전송되지 않은 병합 가능 메시지 (토픽별)
+        self._in_flight: Dict[int, OutboundMessage] = {}
+        self._early_acks: 'OrderedDict[int, None]' = OrderedDict()  # publish() 반환 전에 도착한 응답
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self.connected = connected
+        self.outbox = MQTTOutbox(settings.mqtt_outbox_size, settings.mqtt_outbox_max_age)
+
+        self.rates: Dict[str, TopicRate] = {}
+        self.send_latency = LatencyRecorder()  # 큐 추가 ~ client.publish() 완료
+        self.ack_latency = LatencyRecorder()  # 큐 추가 ~ 브로커 응답 (QoS 1/2)
+        self.published = 0
+        self.acked = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.failed = 0
+        self.max_depth = 0
+        self.max_in_flight_seen = 0
+
+        if hasattr(client, 'max_inflight_messages_set'):
+            client.max_inflight_messages_set(self.max_in_flight)
+
+    @property
+    def running(self) -> bool:
+        """발행 스레드가 실행 중인지 여부"""
+        return self._thread is not None and not self._stopping
+
+    @property
+    def depth(self) -> int:
+        """전송 대기 중인 메시지 수"""
+        return len(self._ready) + len(self._held)
+
+    @property
+    def in_flight(self) -> int:
+        """브로커 응답 대기 중인 메시지 수"""
+        return len(self._in_flight)
+
+    def start(self) -> None:
+        """발행 스레드 시작"""
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="MQTTPublish", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """대기 중인 메시지를 전송한 뒤 발행 스레드 종료"""
+        with self._cond:
+            if self._thread is None:
+                return
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join(timeout=timeout)
+        self._thread = None
+        if self.outbox:
+            custom_logger.warning(f"MQTT 연결이 끊긴 채 종료되어 outbox 메시지 {len(self.outbox)}건을 버림")
+
+    def set_connected(self, connected: bool) -> None:
+        """
+        연결 상태 변경 (paho on_connect/on_disconnect에서 호출)
+
+        On disconnect, queued messages move to the outbox. On connect the
+        outbox is replayed in order; in-flight slots from the old connection
+        are released because paho resends those messages itself.
+        """
+        with self._cond:
+            if connected == self.connected:
+                return
+            self.connected = connected
+            if not connected:
+                self._buffer_pending()
+                custom_logger.info(f"MQTT 연결 끊김: 발행 메시지를 outbox에 보관 (대기 {len(self.outbox)}건)")
+                return
+
+            self._in_flight.clear()
+            messages = self.outbox.drain(time.perf_counter())
+            if messages:
+                custom_logger.info(
+                    f"MQTT 재연결: outbox 메시지 {len(messages)}건 재전송 (만료 누적 {self.outbox.expired}건)"
+                )
+            if self.running:
+                for message in messages:
+                    message.not_before = 0.0
+                    if message.coalesce:
+                        self._queued[message.topic] = message
+                    self._ready.append(message)
+                self._track_depth()
+                self._cond.notify()
+                return
+        for message in messages:
+            self._send(message)
+
+    def _buffer_pending(self) -> None:
+        """전송 대기 중인 메시지를 outbox로 이동 (self._cond 보유 상태에서 호출)"""
+        # 병합 대기 중인 스위치 명령도 작성 시각 순서대로 섞어 넣어 outbox 순서를 유지
+        pending = sorted(list(self._ready) + list(self._held.values()), key=lambda message: message.enqueued_at)
+        self._ready.clear()
+        self._held.clear()
+        self._queued.clear()
+        for message in pending:
+            self.outbox.put(message)
+
+    def publish(self, topic: str, payload: Any, qos: int = 0, retain: bool = False, coalesce: bool = False) -> bool:
+        """
+        메시지 발행 요청
+
+        Args:
+            topic: MQTT topic
+            payload: Dict/list (JSON or compact encoded, see PayloadCodec), str or bytes
+            qos: Quality of Service level (0, 1, or 2)
+            retain: Whether to retain message
+            coalesce: Replace a still-queued message for the same topic (switch commands)
+
+        Returns:
+            bool: True if queued, buffered in the outbox or sent inline before start(),
+                False if dropped or failed
+        """
+        message = OutboundMessage(topic, self.codec.encode(topic, payload), qos, retain, time.perf_counter(), coalesce)
+        with self._cond:
+            if not self.connected:
+                self.outbox.put(message)
+                return True
+            if self.running:
+                return self._enqueue(message, coalesce)
+        return self._send(message)
+
+    def publish_many(self, messages: Iterable[Tuple[str, Any]], qos: int = 0) -> int:
+        """
+        여러 메시지를 한 번에 큐에 추가 (센서 값 묶음)
+
+        Args:
+            messages: (topic, payload) pairs
+            qos: Quality of Service level for every message
+
+        Returns:
+            int: Number of messages accepted (a payload that fails to encode is logged and skipped)
+        """
+        now = time.perf_counter()
+        encoded = []
+        for topic, payload in messages:
+            try:
+                encoded.append(OutboundMessage(topic, self.codec.encode(topic, payload), qos, False, now))
+            except (TypeError, ValueError) as e:
+                # 직렬화할 수 없는 값 하나 때문에 묶음 전체를 버리지 않음
+                custom_logger.error(f"MQTT 페이로드 인코딩 실패, 건너뜀 ({topic}): {e}")
+        with self._cond:
+            if not self.connected:
+                for message in encoded:
+                    self.outbox.put(message)
+                return len(encoded)
+            if self.running:
+                return sum(self._enqueue(message, False) for message in encoded)
+        return sum(self._send(message) for message in encoded)
+
+    def _enqueue(self, message: OutboundMessage, coalesce: bool) -> bool:
+        """큐에 추가 (self._cond 보유 상태에서 호출)"""
+        if coalesce:
+            queued = self._queued.get(message.topic)
+            if queued is not None:
+                # 아직 전송되지 않은 같은 토픽 명령은 최신 값으로 교체 (대기 시작 시각 유지)
+                queued.payload, queued.qos, queued.retain = message.payload, message.qos, message.retain
+                self.coalesced += 1
+                self._rate(message.topic).coalesced += 1
+                return True
+
+        if self.depth >= self.queue_size:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                custom_logger.warning(f"MQTT 발행 큐가 가득 차 메시지를 버림 (누적 {self.dropped}건)")
+            return False
+
+        if coalesce:
+            self._queued[message.topic] = message
+            if self.coalesce_window > 0:
+                message.not_before = message.enqueued_at + self.coalesce_window
+                self._held[message.topic] = message
+                self._cond.notify()
+                return self._track_depth()
+        self._ready.append(message)
+        self._cond.notify()
+        return self._track_depth()
+
+    def _track_depth(self) -> bool:
+        depth = self.depth
+        if depth > self.max_depth:
+            self.max_depth = depth
+        return True
+
+    def _rate(self, topic: str) -> TopicRate:
+        rate = self.rates.get(topic)
+        if rate is None:
+            rate = self.rates[topic] = TopicRate()
+        return rate
+
+    def _run(self) -> None:
+        """대기 중인 메시지를 순서대로 전송 (응답 대기 한도 초과 시 대기)"""
+        while True:
+            with self._cond:
+                while True:
+                    now = time.perf_counter()
+                    self._release_held(now)
+                    # 종료 중에는 응답 대기 한도와 무관하게 남은 메시지를 paho에 넘김
+                    if self._ready and (len(self._in_flight) < self.max_in_flight or self._stopping):
+                        break
+                    if self._stopping and not self._ready and not self._held:
+                        return
+                    timeout = None
+                    if self._held:
+                        timeout = max(0.0, min(m.not_before for m in self._held.values()) - now)
+                    if self._stopping:
+                        timeout = 0.05 if timeout is None else min(timeout, 0.05)
+                    self._cond.wait(timeout)
+                message = self._ready.popleft()
+                if self._queued.get(message.topic) is message:
+                    del self._queued[message.topic]
+            self._send(message)
+
+    def _release_held(self, now: float) -> None:
+        """병합 구간이 끝난 메시지를 전송 대기열로 이동 (종료 중이면 즉시)"""
+        if not self._held:
+            return
+        for topic, message in list(self._held.items()):
+            if message.not_before <= now or self._stopping:
+                del self._held[topic]
+                self._ready.append(message)
+
+    def _send(self, message: OutboundMessage) -> bool:
+        """client.publish() 호출 및 응답 추적 등록"""
+        try:
+            info = self.client.publish(message.topic, message.payload, qos=message.qos, retain=message.retain)
+        except Exception as e:
+            self.failed += 1
+            custom_logger.error(f"MQTT 메시지 발행 중 오류 ({message.topic}): {e}")
+            return False
+
+        sent_at = time.perf_counter()
+        if info.rc == mqtt.MQTT_ERR_NO_CONN and message.qos == 0:
+            # 연결 끊김을 알기 전에 전송한 경우 (QoS 1/2는 paho가 보관했다가 재연결 시 재전송)
+            with self._cond:
+                self.outbox.put(message)
+            return True
+        if info.rc not in (mqtt.MQTT_ERR_SUCCESS, mqtt.MQTT_ERR_NO_CONN):
+            self.failed += 1
+            custom_logger.error(f"MQTT 메시지 발행 실패 ({message.topic}): {mqtt.error_string(info.rc)}")
+            return False
+
+        self.send_latency.record(sent_at - message.enqueued_at)
+        with self._cond:
+            self.published += 1
+            self._rate(message.topic).record(time.monotonic())
+            if message.qos > 0:
+                if self._early_acks.pop(info.mid, False) is None:
+                    self._complete(message, sent_at)
+                else:
+                    message.mid = info.mid
+                    self._in_flight[info.mid] = message
+                    if len(self._in_flight) > self.max_in_flight_seen:
+                        self.max_in_flight_seen = len(self._in_flight)
+        return True
+
+    def on_publish(self, client: mqtt.Client, userdata: Any, mid: int, *args: Any) -> None:
+        """paho on_publish 콜백: QoS 1/2 응답 수신 시 응답 대기 슬롯 반환"""
+        now = time.perf_counter()
+        with self._cond:
+            message = self._in_flight.pop(mid, None)
+            if message is None:
+                # QoS 0 전송 완료이거나 publish() 반환 전에 도착한 응답
+                self._early_acks[mid] = None
+                if len(self._early_acks) > EARLY_ACK_LIMIT:
+                    self._early_acks.popitem(last=False)
+                return
+            self._complete(message, now)
+            self._cond.notify()
+
+    def _complete(self, message: OutboundMessage, now: float) -> None:
+        """응답 완료 기록 (self._cond 보유 상태에서 호출)"""
+        self.acked += 1
+        self.ack_latency.record(now - message.enqueued_at)
+
+    def topic_rates(self) -> Dict[str, float]:
+        """토픽별 현재 발행률 (msg/s)"""
+        now = time.monotonic()
+        with self._cond:
+            return {topic: rate.rate(now) for topic, rate in self.rates.items()}
+
+    def report(self) -> str:
+        """발행 큐 상태, 응답 지연 및 발행률 상위 토픽 요약"""
+        rates: List[Tuple[str, float]] = sorted(self.topic_rates().items(), key=lambda item: item[1], reverse=True)
+        top = " ".join(f"{topic}={rate * 60:.1f}/min" for topic, rate in itertools.islice(rates, 5))
+        return (
+            f"published={self.published} coalesced={self.coalesced} dropped={self.dropped} failed={self.failed} "
+            f"depth={self.depth} max_depth={self.max_depth} in_flight={self.in_flight} "
+            f"send {self.send_latency.summary()} | ack {self.ack_latency.summary()} | "
+            f"outbox {self.outbox.report()} | encoding {self.codec.report()} | rates {top or '-'}"
+        )
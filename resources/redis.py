@@ -1,4 +1,5 @@
 import json
+from typing import List, Optional
 import redis
 from logger.custom_logger import custom_logger
 from constants import REDIS_HOST, REDIS_PORT
@@ -32,6 +33,24 @@ class RedisClient:
             custom_logger.error(f"Redis get 실패: {str(e)}")
             return None
 
+    def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        """
+        여러 키를 한 번의 왕복(MGET)으로 조회
+
+        Args:
+            keys: Redis keys to fetch
+
+        Returns:
+            Values in the same order as keys (None for missing keys)
+        """
+        if not keys:
+            return []
+        try:
+            return self.client.mget(keys)
+        except Exception as e:
+            custom_logger.error(f"Redis mget 실패: {str(e)}")
+            return [None] * len(keys)
+
     def set(self, key: str, value: str) -> bool:
         """Redis에 값 저장"""
         try:
@@ -10,9 +10,10 @@ class MQTTTopics:
     SWITCH = "switch/{name}"
     AUTOMATION = "automation/{name}"
     ENVIRONMENT = "environment/{name}"
+    CURRENT = "current/{name}"
 
     # 구독 패턴 (와일드카드)
-    SUBSCRIBED = ["environment/#", "automation/#", "switch/#"]
+    SUBSCRIBED = ["environment/#", "automation/#", "switch/#", "current/#"]
 
     @staticmethod
     def switch(name: str) -> str:
@@ -49,3 +50,15 @@ class MQTTTopics:
             str: environment/{name} 형식의 토픽
         """
         return f"environment/{name}"
+
+    @staticmethod
+    def current(name: str) -> str:
+        """전류 센서 상태 토픽 생성
+
+        Args:
+            name: 디바이스 이름
+
+        Returns:
+            str: current/{name} 형식의 토픽
+        """
+        return f"current/{name}"
@@ -1,5 +1,9 @@
-from typing import List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 from models.Machine import BaseMachine
+from settings.mqtt_topics import MQTTTopics
 from models.Response import (
     AutomationResponse,
     AutomationSwitchResponse,
@@ -12,22 +16,40 @@ from models.Response import (
 )
 from resources import http, redis
 from logger.custom_logger import custom_logger
+from utils.diff import RecordDiff, diff_records
+
+# Store 변경 리스너: (store, {"machines" | "switches" | "automations": RecordDiff})
+StoreListener = Callable[['Store', Dict[str, RecordDiff]], None]
 
 
 class Store:
     def __init__(self):
+        self._lock = threading.RLock()
+        self._listeners: List[StoreListener] = []
+        # 조회용 인덱스
+        self._machines_by_id: Dict[int, BaseMachine] = {}
+        self._machines_by_name: Dict[str, BaseMachine] = {}
+        self._machines_by_lower_name: Dict[str, BaseMachine] = {}
+        self._automations_by_device_name: Dict[str, AutomationResponse] = {}
+        self._sensors_by_name: Dict[str, SensorResponse] = {}
+        self._sensors_by_lower_name: Dict[str, SensorResponse] = {}
         try:
-            # HTTP에서 데이터 가져오기
-            self.environment_type: List[EnvironmentTypeResponse] = http.get_environment_type()
-            self.environments: List[EnvironmentResponse] = http.get_environments()
-            self.switches: List[SwitchResponse] = http.get_switches()
-            self.machines: List[MachineResponse] = http.get_machines()
-            self.sensors: List[SensorResponse] = http.get_sensors()
-            self.automations: List[AutomationResponse] = http.get_automations()
-            self.interval_automated_switches: List[AutomationSwitchResponse] = http.get_interval_device_states()
-            self.currents: List[CurrentResponse] = http.get_currents()
-
-            custom_logger.info(f"Store 데이터 로드 완료:")
+            # HTTP에서 데이터 가져오기 (서로 독립적인 엔드포인트를 병렬로 요청)
+            started = time.monotonic()
+            data = self._fetch_all()
+            self.environment_type: List[EnvironmentTypeResponse] = data['environment_type']
+            self.environments: List[EnvironmentResponse] = data['environments']
+            self.switches: List[SwitchResponse] = data['switches']
+            self.machines: List[MachineResponse] = data['machines']
+            self.sensors: List[SensorResponse] = data['sensors']
+            self.automations: List[AutomationResponse] = data['automations']
+            self.interval_automated_switches: List[AutomationSwitchResponse] = data['interval_automated_switches']
+            self.currents: List[CurrentResponse] = data['currents']
+            # refresh() 비교용 원본 (self.machines는 BaseMachine 목록으로 교체됨)
+            self._raw_machines: List[MachineResponse] = self.machines
+            self.load_seconds = time.monotonic() - started
+
+            custom_logger.info(f"Store 데이터 로드 완료 ({self.load_seconds:.2f}초):")
             custom_logger.info(f"- Machines: {len(self.machines)}")
             custom_logger.info(f"- Sensors: {len(self.sensors)}")
             custom_logger.info(f"- Automations: {len(self.automations)}")
@@ -35,6 +57,7 @@ class Store:
 
             # 기기 정보 업데이트
             self._update_machines()
+            self._rebuild_indexes()
 
             # Redis에 데이터 저장
             self._save_to_redis()
@@ -44,6 +67,188 @@ class Store:
             custom_logger.error(f"Store 초기화 실패: {str(e)}")
             raise
 
+    def _fetch_all(self, conditional: bool = False) -> dict:
+        """
+        모든 HTTP 엔드포인트를 스레드 풀에서 동시에 조회
+
+        Args:
+            conditional: Use conditional GETs; unchanged endpoints map to None
+        """
+        loaders = {
+            'environment_type': http.get_environment_type,
+            'environments': http.get_environments,
+            'switches': http.get_switches,
+            'machines': http.get_machines,
+            'sensors': http.get_sensors,
+            'automations': http.get_automations,
+            'interval_automated_switches': http.get_interval_device_states,
+            'currents': http.get_currents,
+        }
+        with ThreadPoolExecutor(max_workers=len(loaders), thread_name_prefix="StoreLoader") as executor:
+            futures = {name: executor.submit(loader, conditional) for name, loader in loaders.items()}
+            # 하나라도 실패하면 result()가 예외를 다시 발생시켜 초기화 실패로 처리됨
+            return {name: future.result() for name, future in futures.items()}
+
+    def add_listener(self, listener: StoreListener) -> None:
+        """refresh()로 machines/switches/automations가 바뀌었을 때 호출할 리스너 등록"""
+        self._listeners.append(listener)
+
+    def refresh(self) -> Dict[str, RecordDiff]:
+        """
+        변경된 엔드포인트만 다시 받아 차이를 기존 객체에 적용
+
+        ETag/Last-Modified 조건부 GET으로 304를 받은 엔드포인트는 건너뛰고,
+        machines/switches/automations는 레코드 단위 diff를 계산해 BaseMachine을
+        제자리에서 갱신한 뒤 리스너에 전달한다.
+
+        Returns:
+            Dict[str, RecordDiff]: Non-empty diffs keyed by resource name
+        """
+        data = self._fetch_all(conditional=True)
+        changes: Dict[str, RecordDiff] = {}
+
+        with self._lock:
+            if data['machines'] is not None:
+                machine_diff = diff_records(self._raw_machines, data['machines'], key=lambda m: m['id'])
+                self._raw_machines = data['machines']
+                if machine_diff:
+                    changes['machines'] = machine_diff
+
+            if data['switches'] is not None:
+                switch_diff = diff_records(self.switches, data['switches'], key=lambda s: s['device_id'])
+                self.switches = data['switches']
+                if switch_diff:
+                    changes['switches'] = switch_diff
+
+            if data['automations'] is not None:
+                automation_diff = diff_records(
+                    self.automations,
+                    data['automations'],
+                    key=lambda a: (a.get('device_id') or {}).get('id')
+                )
+                self.automations = data['automations']
+                if automation_diff:
+                    changes['automations'] = automation_diff
+
+            if 'machines' in changes or 'switches' in changes:
+                self._apply_machine_changes(changes.get('machines'), changes.get('switches'))
+
+            # 나머지 목록은 통째로 교체
+            changed_names = [name for name in ('machines', 'switches', 'automations') if name in changes]
+            for name in ('environment_type', 'environments', 'sensors', 'interval_automated_switches', 'currents'):
+                if data[name] is not None and data[name] != getattr(self, name):
+                    setattr(self, name, data[name])
+                    changed_names.append(name)
+
+            if changed_names:
+                self._rebuild_indexes()
+
+            for name in changed_names:
+                redis.set(name, getattr(self, name))
+
+        if changes:
+            custom_logger.info(
+                "Store 변경 감지: " + ", ".join(f"{name} {diff.summary()}" for name, diff in changes.items())
+            )
+            for listener in self._listeners:
+                try:
+                    listener(self, changes)
+                except Exception as e:
+                    custom_logger.error(f"Store 리스너 실행 실패: {str(e)}")
+
+        return changes
+
+    def get_machine(self, machine_id: int) -> Optional[BaseMachine]:
+        """ID로 machine 조회"""
+        return self._machines_by_id.get(machine_id)
+
+    def get_machine_by_name(self, name: str, ignore_case: bool = False) -> Optional[BaseMachine]:
+        """이름으로 machine 조회 (기본은 정확히 일치, ignore_case=True면 대소문자 무시)"""
+        if ignore_case:
+            return self._machines_by_lower_name.get(name.lower())
+        return self._machines_by_name.get(name)
+
+    def get_automation_by_device_name(self, name: str) -> Optional[AutomationResponse]:
+        """기기 이름으로 automation 설정 조회"""
+        return self._automations_by_device_name.get(name)
+
+    def get_sensor_by_name(self, name: str, ignore_case: bool = False) -> Optional[SensorResponse]:
+        """이름으로 sensor 조회 (기본은 정확히 일치, ignore_case=True면 대소문자 무시)"""
+        if ignore_case:
+            return self._sensors_by_lower_name.get(name.lower())
+        return self._sensors_by_name.get(name)
+
+    def _rebuild_indexes(self) -> None:
+        """
+        목록이 바뀐 뒤 조회용 인덱스를 다시 생성
+
+        새 dict를 만든 뒤 한 번에 교체하므로 잠금 없이 조회하는 쪽은
+        항상 이전 또는 새 인덱스 중 하나의 완전한 상태를 본다.
+        """
+        # 같은 이름이 여럿이면 목록 순서상 첫 항목 (이전 선형 탐색과 같은 결과)
+        machines_by_name: Dict[str, BaseMachine] = {}
+        machines_by_lower_name: Dict[str, BaseMachine] = {}
+        for machine in self.machines:
+            machines_by_name.setdefault(machine.name, machine)
+            machines_by_lower_name.setdefault(machine.name.lower(), machine)
+
+        automations_by_device_name: Dict[str, AutomationResponse] = {}
+        for automation in self.automations:
+            device_name = (automation.get('device_id') or {}).get('name')
+            if device_name:
+                automations_by_device_name.setdefault(device_name, automation)
+
+        sensors_by_name: Dict[str, SensorResponse] = {}
+        sensors_by_lower_name: Dict[str, SensorResponse] = {}
+        for sensor in self.sensors:
+            sensor_name = sensor.get('name')
+            if sensor_name:
+                sensors_by_name.setdefault(sensor_name, sensor)
+                sensors_by_lower_name.setdefault(sensor_name.lower(), sensor)
+
+        self._machines_by_id = {machine.machine_id: machine for machine in self.machines}
+        self._machines_by_name = machines_by_name
+        self._machines_by_lower_name = machines_by_lower_name
+        self._automations_by_device_name = automations_by_device_name
+        self._sensors_by_name = sensors_by_name
+        self._sensors_by_lower_name = sensors_by_lower_name
+
+    def _apply_machine_changes(self, machine_diff: Optional[RecordDiff], switch_diff: Optional[RecordDiff]) -> None:
+        """machine/switch diff를 기존 BaseMachine 객체에 제자리 적용"""
+        machines_by_id = dict(self._machines_by_id)
+
+        if machine_diff:
+            for record in machine_diff.removed:
+                machines_by_id.pop(record['id'], None)
+
+            for _, record in machine_diff.changed:
+                machine = machines_by_id.get(record['id'])
+                if machine:
+                    machine.pin = record['pin']
+                    if machine.name != record['name']:
+                        machine.name = record['name']
+                        machine.mqtt_topic = MQTTTopics.switch(record['name'])
+
+            switches_by_device = {s['device_id']: s for s in self.switches}
+            for record in machine_diff.added:
+                switch = switches_by_device.get(record['id'])
+                machines_by_id[record['id']] = BaseMachine(
+                    machine_id=record['id'],
+                    name=record['name'],
+                    pin=record['pin'],
+                    status=switch['status'] if switch else 0,
+                    switch_created_at=switch['created_at'] if switch else None
+                )
+
+        if switch_diff:
+            for record in switch_diff.added + [after for _, after in switch_diff.changed]:
+                machine = machines_by_id.get(record['device_id'])
+                if machine:
+                    machine.set_status(record['status'])
+                    machine.switch_created_at = record['created_at']
+
+        self.machines = list(machines_by_id.values())
+
     def _save_to_redis(self) -> None:
         """데이터를 Redis에 저장"""
         try:
@@ -63,16 +268,17 @@ class Store:
             raise
 
     def _update_machines(self) -> None:
-        """기기 정보 업데이트"""
-        merged_data = BaseMachine.merge_device_data(self.switches, self.machines)
+        """기기 정보 업데이트 (응답 dict를 변경하지 않고 switch 상태를 합쳐 BaseMachine 생성)"""
+        switches_by_device = {switch['device_id']: switch for switch in self.switches}
 
-        self.machines = [
-            BaseMachine(
+        machines = []
+        for data in self.machines:
+            switch = switches_by_device.get(data['id'])
+            machines.append(BaseMachine(
                 machine_id=data['id'],
                 name=data['name'],
                 pin=data['pin'],
-                status=data['status'],
-                switch_created_at=data['switch_created_at']
-            )
-            for data in merged_data
-        ]
+                status=switch['status'] if switch else 0,
+                switch_created_at=switch['created_at'] if switch else None
+            ))
+        self.machines = machines
@@ -0,0 +1,48 @@
+"""Store 레코드 목록 비교 유틸리티"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+
+@dataclass
+class RecordDiff:
+    """두 레코드 목록 간의 변경 사항"""
+    added: List[Dict[str, Any]] = field(default_factory=list)
+    removed: List[Dict[str, Any]] = field(default_factory=list)
+    changed: List[Tuple[Dict[str, Any], Dict[str, Any]]] = field(default_factory=list)  # (이전, 이후)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def summary(self) -> str:
+        """로그용 요약 문자열"""
+        return f"+{len(self.added)} -{len(self.removed)} ~{len(self.changed)}"
+
+
+def diff_records(
+    old: List[Dict[str, Any]],
+    new: List[Dict[str, Any]],
+    key: Callable[[Dict[str, Any]], Any]
+) -> RecordDiff:
+    """키 기준으로 두 레코드 목록 비교
+
+    Args:
+        old: 이전 레코드 목록
+        new: 새 레코드 목록
+        key: 레코드의 식별 키를 반환하는 함수
+
+    Returns:
+        RecordDiff: 추가/삭제/변경된 레코드
+    """
+    old_by_key = {key(record): record for record in old}
+    new_by_key = {key(record): record for record in new}
+
+    diff = RecordDiff()
+    for record_key, record in new_by_key.items():
+        previous = old_by_key.get(record_key)
+        if previous is None:
+            diff.added.append(record)
+        elif previous != record:
+            diff.changed.append((previous, record))
+
+    diff.removed = [record for record_key, record in old_by_key.items() if record_key not in new_by_key]
+    return diff
@@ -0,0 +1,121 @@
+"""런타임 지표 수집 유틸리티"""
+import threading
+import time
+from bisect import bisect_right
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+from logger.custom_logger import custom_logger
+
+
+class StartupMetrics:
+    """프로세스 시작부터 첫 control() 실행까지의 콜드 스타트 시간 측정
+
+    측정 기준 시각은 이 모듈이 처음 import된 시점이므로 main.py에서 가장 먼저 import한다.
+    """
+
+    def __init__(self) -> None:
+        self.started_at: float = time.monotonic()
+        self.phases: Dict[str, float] = {}
+        self.first_control_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def mark(self, phase: str) -> None:
+        """시작 이후 경과 시간을 단계 이름으로 기록"""
+        self.phases[phase] = time.monotonic() - self.started_at
+
+    def mark_first_control(self) -> None:
+        """첫 control() 실행 시각 기록 (최초 1회만 로그 출력)"""
+        if self.first_control_at is not None:
+            return
+        with self._lock:
+            if self.first_control_at is not None:
+                return
+            self.first_control_at = time.monotonic() - self.started_at
+
+        breakdown = ", ".join(f"{name}={elapsed:.2f}s" for name, elapsed in self.phases.items())
+        custom_logger.info(f"콜드 스타트 완료: 첫 control()까지 {self.first_control_at:.2f}초 ({breakdown})")
+
+    @property
+    def cold_start_seconds(self) -> Optional[float]:
+        """첫 control()까지 걸린 시간 (초)"""
+        return self.first_control_at
+
+
+class LatencyRecorder:
+    """최근 지연 시간 샘플을 보관하고 백분위수를 계산
+
+    Samples live in a bounded deque, so recording is O(1) and safe to call
+    from the MQTT network thread; sorting happens only when a report is read.
+    """
+
+    def __init__(self, size: int = 2048) -> None:
+        self._samples: deque = deque(maxlen=size)
+        self.count = 0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """지연 시간 샘플 추가 (초)"""
+        self._samples.append(seconds)
+        self.count += 1
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentiles(self, points: Sequence[float] = (50, 95, 99)) -> Dict[float, float]:
+        """
+        최근 샘플의 백분위수 계산
+
+        Args:
+            points: Percentiles to compute (0-100)
+
+        Returns:
+            Dict[float, float]: Percentile -> seconds (empty if no samples)
+        """
+        samples = sorted(self._samples)
+        if not samples:
+            return {}
+        last = len(samples) - 1
+        return {point: samples[min(last, int(round(point / 100 * last)))] for point in points}
+
+    def summary(self) -> str:
+        """로그용 요약 문자열 (ms)"""
+        values = self.percentiles()
+        if not values:
+            return "샘플 없음"
+        parts = " ".join(f"p{point:g}={seconds * 1000:.2f}ms" for point, seconds in values.items())
+        return f"{parts} max={self.max * 1000:.2f}ms (n={self.count})"
+
+
+class Histogram:
+    """고정 구간 히스토그램 (연결 끊김 시간 등 드물게 발생하는 값의 분포)
+
+    Bucket i counts values < bounds[i] (and >= bounds[i-1]); the last bucket
+    counts values >= bounds[-1]. Unlike LatencyRecorder nothing is evicted,
+    so rare long outages stay visible for the life of the process.
+    """
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = tuple(sorted(bounds))
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """값 추가"""
+        self.counts[bisect_right(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def summary(self, unit: str = "s") -> str:
+        """로그용 요약 문자열"""
+        if not self.count:
+            return "샘플 없음"
+        labels = [f"<{bound:g}{unit}" for bound in self.bounds] + [f">={self.bounds[-1]:g}{unit}"]
+        buckets = " ".join(f"{label}:{count}" for label, count in zip(labels, self.counts) if count)
+        return f"{buckets} mean={self.total / self.count:.2f}{unit} max={self.max:.2f}{unit} (n={self.count})"
+
+
+# 전역 인스턴스
+startup_metrics = StartupMetrics()
@@ -0,0 +1,154 @@
+"""MQTT 페이로드 코덱: 표준 JSON 스키마 + 숫자/불리언 값용 고정 struct 압축 형식"""
+
+import json
+import struct
+from typing import Any, Iterable, Optional
+from config import settings
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
+
+# 압축 페이로드 첫 바이트: UTF-8 텍스트(JSON)에는 나올 수 없는 바이트라서 두 형식이 섞여도 구분됨
+COMPACT_PREFIX = b"\xc1"
+
+# [0xC1][타입 1바이트][값 big-endian]
+_BOOL = struct.Struct("!BB?")  # 3 bytes
+_INT32 = struct.Struct("!BBi")  # 6 bytes
+_INT64 = struct.Struct("!BBq")  # 10 bytes
+_FLOAT64 = struct.Struct("!BBd")  # 10 bytes (JSON 숫자와 같은 값으로 복원)
+_LAYOUTS = {ord("?"): _BOOL, ord("i"): _INT32, ord("q"): _INT64, ord("d"): _FLOAT64}
+_MARKER = COMPACT_PREFIX[0]
+
+
+def encode_payload(payload: Any) -> bytes:
+    """
+    발행 페이로드 JSON 직렬화 (orjson이 있으면 사용)
+
+    Strings and bytes are sent as-is; everything else is encoded as compact
+    JSON. orjson rejects a few types the standard encoder accepts (e.g.
+    non-str keys), so those fall back to json.dumps.
+    """
+    if isinstance(payload, bytes):
+        return payload
+    if isinstance(payload, str):
+        return payload.encode()
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            pass
+    return json.dumps(payload, separators=(',', ':')).encode()
+
+
+def standard_payload(topic: str, value: Any) -> dict:
+    """토픽과 값으로 표준 JSON 스키마 페이로드 생성"""
+    return {"pattern": topic, "data": {"name": topic.partition('/')[2], "value": value}}
+
+
+def encode_compact(topic: str, payload: Any) -> Optional[bytes]:
+    """
+    표준 스키마 페이로드를 압축 형식으로 변환
+
+    Only payloads that decode back to an identical dict are converted:
+    {"pattern": topic, "data": {"name": <topic name>, "value": v}} where v
+    is a bool, an int that fits in 64 bits or a float. Anything else
+    (extra keys, another name, strings, None) returns None and should be
+    sent as JSON.
+    """
+    if type(payload) is not dict or len(payload) != 2 or payload.get("pattern") != topic:
+        return None
+    data = payload.get("data")
+    if type(data) is not dict or len(data) != 2 or data.get("name") != topic.partition('/')[2]:
+        return None
+
+    value = data.get("value")
+    kind = type(value)
+    if kind is bool:
+        return _BOOL.pack(_MARKER, ord("?"), value)
+    if kind is float:
+        return _FLOAT64.pack(_MARKER, ord("d"), value)
+    if kind is int:
+        if -2 ** 31 <= value < 2 ** 31:
+            return _INT32.pack(_MARKER, ord("i"), value)
+        if -2 ** 63 <= value < 2 ** 63:
+            return _INT64.pack(_MARKER, ord("q"), value)
+    return None
+
+
+def decode_compact(raw: bytes) -> Any:
+    """
+    압축 페이로드에서 값 추출
+
+    Raises:
+        ValueError: If the payload is not a well-formed compact payload
+    """
+    layout = _LAYOUTS.get(raw[1]) if len(raw) > 1 and raw[0] == _MARKER else None
+    if layout is None or len(raw) != layout.size:
+        raise ValueError(f"잘못된 압축 페이로드: {raw[:16]!r}")
+    return layout.unpack(raw)[2]
+
+
+def decode_payload(topic: str, raw: bytes) -> Any:
+    """
+    수신 페이로드 해석 (두 형식 모두 지원)
+
+    Compact payloads are expanded to the standard JSON schema, so handlers
+    see the same dict whichever format the sender used.
+
+    Raises:
+        ValueError: If the payload is neither JSON nor a compact payload
+    """
+    if raw[:1] == COMPACT_PREFIX:
+        return standard_payload(topic, decode_compact(raw))
+    return json.loads(raw)
+
+
+class PayloadCodec:
+    """
+    Chooses the wire format of outgoing payloads per topic family.
+
+    Topic families (first topic level, e.g. "environment") listed in
+    `compact_families` are sent in the compact struct layout when the payload
+    allows it; everything else stays JSON. Receivers detect the format from
+    the first byte, so a family should only be switched once every consumer
+    of it understands the compact layout (see README).
+    """
+
+    def __init__(self, compact_families: Optional[Iterable[str]] = None) -> None:
+        """
+        Initialize PayloadCodec.
+
+        Args:
+            compact_families: Topic families sent compact (defaults to settings.mqtt_compact_topics)
+        """
+        families = settings.mqtt_compact_topics if compact_families is None else compact_families
+        self.compact_families = frozenset(families)
+        self.compact_messages = 0
+        self.compact_bytes = 0
+        self.json_messages = 0
+        self.json_bytes = 0
+
+    def encode(self, topic: str, payload: Any) -> bytes:
+        """토픽 계열 설정에 따라 압축 형식 또는 JSON으로 직렬화"""
+        if self.compact_families and topic.partition('/')[0] in self.compact_families:
+            encoded = encode_compact(topic, payload)
+            if encoded is not None:
+                self.compact_messages += 1
+                self.compact_bytes += len(encoded)
+                return encoded
+        encoded = encode_payload(payload)
+        self.json_messages += 1
+        self.json_bytes += len(encoded)
+        return encoded
+
+    def report(self) -> str:
+        """형식별 발행 메시지 수와 평균 크기"""
+        def average(total: int, count: int) -> str:
+            return f"{total / count:.0f}B" if count else "-"
+
+        return (
+            f"compact={self.compact_messages} (avg {average(self.compact_bytes, self.compact_messages)}) "
+            f"json={self.json_messages} (avg {average(self.json_bytes, self.json_messages)})"
+        )
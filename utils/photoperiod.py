@@ -0,0 +1,197 @@
+"""LED 광주기(명/암) 상태를 공유하는 서비스"""
+import math
+import threading
+import time
+import weakref
+from datetime import datetime
+from typing import Any, Callable, List, Optional
+from logger.custom_logger import custom_logger
+from config import settings
+from utils.led_time_utils import load_led_time_range
+from utils.schedule import Schedule
+
+# LED 상태 변경 콜백 (LED ON 여부)
+PhotoperiodCallback = Callable[[bool], None]
+
+
+class PhotoperiodService:
+    """
+    Single source of truth for the LED photoperiod.
+
+    The LED's Range settings are compiled once into a Schedule (shared with
+    the LED's RangeAutomation, which pushes every settings change here), and
+    the current phase is cached together with the instant it stays valid
+    until, so is_on() is a comparison rather than a time-string parse.
+
+    The service is registered with the AutomationScheduler like an
+    automation: next_run_time() is the next LED edge and control() publishes
+    the edge to subscribers. Subscribers are also notified when the LED
+    settings change. Bound methods are held weakly so removed automations do
+    not have to unsubscribe.
+    """
+
+    def __init__(self, device_name: str = 'led', off_target_offset: float = 5.0) -> None:
+        """
+        Initialize PhotoperiodService.
+
+        Args:
+            device_name: Name of the LED device whose Range automation defines the photoperiod
+            off_target_offset: Subtracted from Target automation targets while the LED is off
+        """
+        self.device_name = device_name
+        self.off_target_offset = off_target_offset
+        self.name = f"photoperiod:{device_name}"  # 스케줄러 등록 이름
+        self.reschedule_callback: Optional[Callable[..., None]] = None
+
+        self.schedule: Optional[Schedule] = None
+        self.active = False
+        self.edges_published = 0
+
+        self._lock = threading.Lock()
+        self._listeners: List[Any] = []
+        # 캐시된 현재 상태와 유효 구간 [valid_from, valid_until)
+        self._phase = False
+        self._valid_from = math.inf
+        self._valid_until = -math.inf
+        self._published: Optional[bool] = None
+        self._config_key = None
+
+    @property
+    def configured(self) -> bool:
+        """LED 시간 설정이 있는지 여부 (비활성화 설정 포함)"""
+        return self.schedule is not None
+
+    def load(self, store) -> None:
+        """Store의 LED Range 자동화 설정으로 구성 (RangeAutomation과 같은 windows/days/timezone 사용)"""
+        led_automation = load_led_time_range(store, self.device_name, self.device_name)
+        if not led_automation:
+            self.configure(None, False)
+            return
+        try:
+            schedule = Schedule.from_settings(led_automation, settings.schedule_timezone)
+        except ValueError as e:
+            custom_logger.warning(f"Device {self.device_name}: LED 시간 범위 파싱 실패: {str(e)}")
+            schedule = None
+        self.configure(schedule, bool(led_automation.get('active')))
+
+    def configure(self, schedule: Optional[Schedule], active: bool) -> None:
+        """
+        LED 스케줄 변경 (변경된 경우에만 구독자에게 알림)
+
+        Args:
+            schedule: Compiled LED schedule, or None if the LED has no Range settings
+            active: Whether the LED automation is active (inactive means the LED is treated as off)
+        """
+        config_key = (schedule.windows, schedule.tz) if schedule is not None else None
+        with self._lock:
+            if config_key == self._config_key and active == self.active:
+                return
+            self._config_key = config_key
+            self.schedule = schedule
+            self.active = active
+            self._valid_from, self._valid_until = math.inf, -math.inf
+
+        custom_logger.info(
+            "LED 광주기 설정 변경: %s", schedule.describe() if schedule else "없음", active=active
+        )
+        self._refresh(time.time(), force_notify=True)
+        # 다음 LED 전환 시각이 바뀌었을 수 있음
+        if self.reschedule_callback:
+            self.reschedule_callback(self.name, None)
+
+    def subscribe(self, callback: PhotoperiodCallback) -> None:
+        """LED 상태/설정 변경 콜백 등록 (바운드 메서드는 약한 참조로 보관, 이미 등록된 콜백은 무시)"""
+        reference = weakref.WeakMethod(callback) if hasattr(callback, '__self__') else (lambda: callback)
+        with self._lock:
+            # 설정 변경으로 장치를 다시 조회할 때 같은 콜백이 중복 등록되지 않도록 함
+            if any(ref() == callback for ref in self._listeners):
+                return
+            self._listeners.append(reference)
+
+    def unsubscribe(self, callback: PhotoperiodCallback) -> None:
+        """콜백 등록 해제"""
+        with self._lock:
+            self._listeners = [ref for ref in self._listeners if ref() not in (None, callback)]
+
+    def is_on(self, now: Optional[float] = None) -> bool:
+        """
+        현재 LED가 켜져 있어야 하는지 여부 (캐시된 상태)
+
+        Args:
+            now: Epoch seconds (time.time() if None)
+        """
+        now = time.time() if now is None else now
+        if self._valid_from <= now < self._valid_until:
+            return self._phase
+        return self._refresh(now)
+
+    def is_on_at(self, timestamp: float) -> bool:
+        """임의 시각의 LED 상태 (캐시를 바꾸지 않음)"""
+        if self.schedule is None or not self.active:
+            return False
+        return self.schedule.is_on(datetime.fromtimestamp(timestamp))
+
+    def next_edge(self, timestamp: float) -> Optional[float]:
+        """timestamp 이후 첫 LED 전환 시각 (epoch 초, 없으면 None)"""
+        if self.schedule is None or not self.active:
+            return None
+        edge = self.schedule.next_transition(datetime.fromtimestamp(timestamp))
+        return edge.timestamp() if edge is not None else None
+
+    def effective_target(self, target: float, now: Optional[float] = None) -> float:
+        """
+        LED 상태에 따른 유효 목표값
+
+        Returns:
+            float: target while the LED is on or when no LED settings exist (safe mode),
+                target - off_target_offset while the LED is off
+        """
+        if self.schedule is None:
+            return target
+        return target if self.is_on(now) else target - self.off_target_offset
+
+    def _refresh(self, now: float, force_notify: bool = False) -> bool:
+        """현재 상태/유효 구간 재계산 후 상태가 바뀌었으면 구독자에게 알림"""
+        with self._lock:
+            if self.schedule is None or not self.active:
+                phase, valid_from, valid_until = False, -math.inf, math.inf
+            else:
+                wall = datetime.fromtimestamp(now)
+                phase = self.schedule.is_on(wall)
+                edge = self.schedule.next_transition(wall)
+                valid_from, valid_until = now, edge.timestamp() if edge is not None else math.inf
+            self._phase, self._valid_from, self._valid_until = phase, valid_from, valid_until
+
+            changed = self._published is not None and phase != self._published
+            self._published = phase
+            listeners = list(self._listeners) if changed or force_notify else []
+
+        if changed:
+            self.edges_published += 1
+            custom_logger.info("LED 광주기 전환: %s", "ON" if phase else "OFF")
+        for reference in listeners:
+            callback = reference()
+            if callback is None:
+                continue
+            try:
+                callback(phase)
+            except Exception as e:
+                custom_logger.error(f"LED 광주기 콜백 실패: {str(e)}")
+        if listeners:
+            with self._lock:
+                self._listeners = [ref for ref in self._listeners if ref() is not None]
+        return phase
+
+    # AutomationScheduler 인터페이스 (LED 전환 시각마다 실행)
+    def next_run_time(self, now: datetime) -> Optional[datetime]:
+        """다음 LED 전환 시각"""
+        edge = self.next_edge(now.timestamp())
+        return datetime.fromtimestamp(edge, now.tzinfo) if edge is not None else None
+
+    def control(self) -> None:
+        """전환 시각 도달 시 상태 갱신 및 구독자 알림"""
+        self._refresh(time.time())
+
+
+# 전역 인스턴스
+photoperiod = PhotoperiodService()
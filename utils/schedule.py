@@ -0,0 +1,308 @@
+"""요일/시간대 스케줄을 주간 타임라인으로 미리 컴파일해 ON 여부와 다음 전환 시각 조회"""
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, time as dt_time, timedelta, tzinfo
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:  # Python 3.8: 시스템 로컬 시간대만 사용
+    ZoneInfo = None
+    ZoneInfoNotFoundError = KeyError
+
+DAY_SECONDS = 86400
+WEEK_SECONDS = 7 * DAY_SECONDS
+WEEKDAY_NAMES = ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+ALL_DAYS = 0b1111111
+DAY_ALIASES = {
+    'daily': ALL_DAYS,
+    'everyday': ALL_DAYS,
+    'weekdays': 0b0011111,
+    'weekends': 0b1100000,
+}
+
+
+def parse_clock(value: str) -> int:
+    """
+    "HH:MM" 또는 "HH:MM:SS"를 자정 기준 초로 변환 ("24:00"은 하루 끝)
+
+    Raises:
+        ValueError: Malformed or out-of-range time
+    """
+    parts = str(value).strip().split(':')
+    if not 2 <= len(parts) <= 3:
+        raise ValueError(f"시간 형식 오류: {value!r}")
+    hour, minute = int(parts[0]), int(parts[1])
+    second = int(parts[2]) if len(parts) == 3 else 0
+    seconds = hour * 3600 + minute * 60 + second
+    if not (0 <= minute < 60 and 0 <= second < 60 and 0 <= seconds <= DAY_SECONDS):
+        raise ValueError(f"시간 범위 오류: {value!r}")
+    return seconds
+
+
+def parse_days(value: Any) -> int:
+    """
+    요일 설정을 비트마스크로 변환 (bit 0 = 월요일)
+
+    Accepts None (every day), an alias ("daily", "weekdays", "weekends"), a
+    comma separated string with ranges ("mon-fri,sun"), or a list of day names
+    or numbers (0 = Monday).
+
+    Raises:
+        ValueError: Unknown day
+    """
+    if value is None or value == '':
+        return ALL_DAYS
+    if isinstance(value, str):
+        alias = DAY_ALIASES.get(value.strip().lower())
+        if alias is not None:
+            return alias
+        value = value.split(',')
+
+    mask = 0
+    for item in value:
+        if isinstance(item, int):
+            if not 0 <= item <= 6:
+                raise ValueError(f"요일 번호 오류: {item}")
+            mask |= 1 << item
+            continue
+        token = str(item).strip().lower()
+        if token in DAY_ALIASES:
+            mask |= DAY_ALIASES[token]
+        elif '-' in token:
+            first, last = (_day_index(part) for part in token.split('-', 1))
+            day = first
+            while True:
+                mask |= 1 << day
+                if day == last:
+                    break
+                day = (day + 1) % 7
+        else:
+            mask |= 1 << _day_index(token)
+    return mask
+
+
+def _day_index(token: str) -> int:
+    """요일 이름(앞 3글자)을 0=월요일 인덱스로 변환"""
+    try:
+        return WEEKDAY_NAMES.index(token.strip().lower()[:3])
+    except ValueError:
+        raise ValueError(f"알 수 없는 요일: {token!r}") from None
+
+
+def resolve_timezone(name: Optional[str]) -> Optional[tzinfo]:
+    """
+    시간대 이름을 tzinfo로 변환 (None/빈 값은 시스템 로컬 시간)
+
+    Raises:
+        ValueError: Unknown zone, or zoneinfo unavailable
+    """
+    if not name:
+        return None
+    if ZoneInfo is None:
+        raise ValueError(f"시간대 {name}를 사용하려면 Python 3.9+ (zoneinfo)가 필요합니다.")
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        raise ValueError(f"알 수 없는 시간대: {name}") from e
+
+
+@dataclass(frozen=True)
+class TimeWindow:
+    """하루 중 ON 구간 (end <= start면 다음날 end까지)"""
+    start: int  # 자정 기준 초
+    end: int
+    days: int = ALL_DAYS  # 구간이 시작하는 요일의 비트마스크
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], default_days: Any = None) -> 'TimeWindow':
+        """{"start": "06:00", "end": "18:00", "days": "mon-fri"} 형식에서 생성"""
+        start = config.get('start', config.get('start_time'))
+        end = config.get('end', config.get('end_time'))
+        if start is None or end is None:
+            raise ValueError(f"구간에 start/end가 없습니다: {config}")
+        return cls(parse_clock(start), parse_clock(end), parse_days(config.get('days', default_days)))
+
+    def intervals(self) -> Iterable[Tuple[int, int]]:
+        """주 시작(월요일 00:00) 기준 [시작, 끝) 초 구간"""
+        length = self.end - self.start
+        if length <= 0:
+            # 종료 시간이 시작 시간 이전/같으면 다음날로 넘어감 (예: 22:00 ~ 06:00)
+            length += DAY_SECONDS
+        for day in range(7):
+            if self.days & (1 << day):
+                start = day * DAY_SECONDS + self.start
+                yield start, start + length
+
+
+class Schedule:
+    """
+    Weekly on/off timeline compiled once from time windows.
+
+    All windows are expanded over one week (Monday 00:00 wall time), merged,
+    and stored as a sorted list of edges. Queries cache the current segment
+    as absolute epoch seconds, so repeated is_on()/next_transition() calls
+    inside a segment are O(1) comparisons; crossing an edge costs one bisect
+    over the (small) edge list.
+
+    Edges are wall-clock times in `tz` (system local time when None) and are
+    converted to instants per date, so DST changes move them correctly: on a
+    fall-back night an edge fires at its first occurrence, and an edge inside
+    a spring-forward gap fires at the equivalent instant after the jump.
+    """
+
+    def __init__(self, windows: Sequence[TimeWindow], tz: Optional[tzinfo] = None) -> None:
+        """
+        Initialize Schedule.
+
+        Args:
+            windows: ON windows
+            tz: Time zone of the wall-clock times (system local time if None)
+        """
+        self.windows = tuple(windows)
+        self.tz = tz
+        self._offsets: List[int] = []
+        self._states: List[bool] = []
+        self.always_on = False
+        self._compile()
+        # 캐시된 현재 구간 [start, end) (epoch 초)
+        self._segment: Optional[Tuple[float, float, bool]] = None
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any], default_timezone: Optional[str] = None) -> 'Schedule':
+        """
+        Range 자동화 설정에서 스케줄 생성
+
+        Args:
+            settings: start_time/end_time (single window), or windows=[{start, end, days}];
+                      optional days (default for every window) and timezone
+            default_timezone: Zone used when settings has no timezone
+
+        Raises:
+            ValueError: Invalid time, day or zone
+        """
+        days = settings.get('days')
+        windows_config = settings.get('windows')
+        if windows_config:
+            windows = [TimeWindow.from_config(window, days) for window in windows_config]
+        else:
+            windows = [TimeWindow(
+                parse_clock(settings.get('start_time') or '00:00'),
+                parse_clock(settings.get('end_time') or '00:00'),
+                parse_days(days)
+            )]
+        return cls(windows, resolve_timezone(settings.get('timezone') or default_timezone))
+
+    def _compile(self) -> None:
+        """구간을 주간 전환 시점 목록으로 변환"""
+        intervals: List[Tuple[int, int]] = []
+        for window in self.windows:
+            for start, end in window.intervals():
+                # 일요일 밤에 시작해 주를 넘기는 구간은 월요일 쪽으로 나눔
+                if end > WEEK_SECONDS:
+                    intervals.append((start, WEEK_SECONDS))
+                    intervals.append((0, end - WEEK_SECONDS))
+                else:
+                    intervals.append((start, end))
+        intervals.sort()
+
+        merged: List[List[int]] = []
+        for start, end in intervals:
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        if len(merged) == 1 and merged[0] == [0, WEEK_SECONDS]:
+            self.always_on = True
+            return
+        if len(merged) > 1 and merged[0][0] == 0 and merged[-1][1] == WEEK_SECONDS:
+            # 주 경계에서 이어지는 구간은 하나로 합침
+            merged[-1][1] = WEEK_SECONDS + merged.pop(0)[1]
+
+        edges = sorted(
+            [(start, True) for start, _ in merged] + [(end % WEEK_SECONDS, False) for _, end in merged]
+        )
+        self._offsets = [offset for offset, _ in edges]
+        self._states = [state for _, state in edges]
+
+    def _wall(self, timestamp: float) -> datetime:
+        """epoch 초를 스케줄 시간대의 벽시계 시각으로 변환"""
+        return datetime.fromtimestamp(timestamp, self.tz)
+
+    def _instant(self, day: date, seconds: int) -> float:
+        """날짜 + 자정 기준 초(벽시계)를 epoch 초로 변환"""
+        day += timedelta(days=seconds // DAY_SECONDS)
+        seconds %= DAY_SECONDS
+        wall = datetime.combine(day, dt_time(seconds // 3600, seconds // 60 % 60, seconds % 60), self.tz)
+        return wall.timestamp()
+
+    def _edge_instant(self, week_start: date, index: int) -> float:
+        """전환 인덱스(주 단위로 넘어가는 음수/초과 인덱스 허용)의 epoch 초"""
+        weeks, position = divmod(index, len(self._offsets))
+        return self._instant(week_start + timedelta(days=7 * weeks), self._offsets[position])
+
+    def _locate(self, timestamp: float) -> Tuple[float, float, bool]:
+        """timestamp가 속한 구간 (start, end, state) 계산 및 캐시"""
+        segment = self._segment
+        if segment is not None and segment[0] <= timestamp < segment[1]:
+            return segment
+
+        wall = self._wall(timestamp)
+        week_start = wall.date() - timedelta(days=wall.weekday())
+        offset = wall.weekday() * DAY_SECONDS + wall.hour * 3600 + wall.minute * 60 + wall.second
+        # 벽시계 기준 다음 전환 (index 0이면 이전 전환은 지난주 마지막 전환)
+        index = bisect_right(self._offsets, offset)
+        start = self._edge_instant(week_start, index - 1)
+        end = self._edge_instant(week_start, index)
+
+        # DST 전환일에는 벽시계 순서와 실제 시각이 어긋날 수 있으므로 실제 시각 기준으로 보정
+        while start > timestamp:
+            index -= 1
+            start, end = self._edge_instant(week_start, index - 1), start
+        while end <= timestamp:
+            index += 1
+            start, end = end, self._edge_instant(week_start, index)
+
+        segment = (start, end, self._states[(index - 1) % len(self._states)])
+        self._segment = segment
+        return segment
+
+    def is_on(self, now: datetime) -> bool:
+        """now 시점에 ON이어야 하는지 여부"""
+        if self.always_on:
+            return True
+        if not self._offsets:
+            return False
+        return self._locate(now.timestamp())[2]
+
+    def next_transition(self, now: datetime) -> Optional[datetime]:
+        """
+        now 이후 첫 ON/OFF 전환 시각
+
+        Returns:
+            Optional[datetime]: Naive local time for a naive `now`, otherwise in
+                `now`'s zone; None if the schedule never changes
+        """
+        if self.always_on or not self._offsets:
+            return None
+        end = self._locate(now.timestamp())[1]
+        return datetime.fromtimestamp(end, now.tzinfo)
+
+    def describe(self) -> str:
+        """로그용 설명"""
+        parts = []
+        for window in self.windows:
+            days = '' if window.days == ALL_DAYS else ' ' + ','.join(
+                name for index, name in enumerate(WEEKDAY_NAMES) if window.days & (1 << index)
+            )
+            parts.append(f"{_format_clock(window.start)}-{_format_clock(window.end)}{days}")
+        zone = f" ({self.tz})" if self.tz else ''
+        return ', '.join(parts) + zone
+
+
+def _format_clock(seconds: int) -> str:
+    """자정 기준 초를 HH:MM(:SS)로 표시"""
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{hours:02d}:{minutes:02d}" + (f":{secs:02d}" if secs else '')
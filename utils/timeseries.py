@@ -0,0 +1,272 @@
+"""센서/전류 채널별 시계열 링 버퍼와 구간 통계"""
+import math
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from operator import mul
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+from logger.custom_logger import custom_logger
+from config import settings
+
+if TYPE_CHECKING:
+    from resources.mqtt import DispatchedMessage, MessageDispatcher
+
+# 샘플 하나가 차지하는 바이트 (timestamp + value, 각각 float64)
+SAMPLE_BYTES = 16
+
+
+@dataclass
+class WindowStats:
+    """구간 통계"""
+    count: int
+    last: float
+    mean: float
+    median: float
+    min: float
+    max: float
+    slope: float  # 단위/분 (최소제곱 기울기)
+    since: float  # 구간 첫 샘플의 시각
+
+
+class RingSeries:
+    """
+    Fixed-capacity ring buffer of (timestamp, value) samples.
+
+    Both columns are preallocated array('d') buffers, so append is O(1) with
+    no per-sample objects. Timestamps are expected to be non-decreasing;
+    window lookups binary-search the logical order and slice at most two
+    contiguous runs out of the ring, and the statistics run over those arrays
+    with C-level builtins (math.fsum, min/max, sorted, map) instead of Python
+    loops.
+    """
+
+    __slots__ = ("capacity", "count", "_next", "_times", "_values")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.count = 0
+        self._next = 0
+        self._times = array('d', bytes(8 * capacity))
+        self._values = array('d', bytes(8 * capacity))
+
+    def append(self, timestamp: float, value: float) -> None:
+        """샘플 추가 (가득 차면 가장 오래된 샘플을 덮어씀)"""
+        index = self._next
+        self._times[index] = timestamp
+        self._values[index] = value
+        self._next = index + 1 if index + 1 < self.capacity else 0
+        if self.count < self.capacity:
+            self.count += 1
+
+    def _physical(self, logical: int) -> int:
+        """논리 위치(0=가장 오래된 샘플)를 버퍼 인덱스로 변환"""
+        start = self._next - self.count
+        return (start + logical) % self.capacity
+
+    def latest(self) -> Optional[Tuple[float, float]]:
+        """가장 최근 (timestamp, value)"""
+        if not self.count:
+            return None
+        index = self._physical(self.count - 1)
+        return self._times[index], self._values[index]
+
+    def window(self, seconds: float, now: float) -> Tuple[array, array]:
+        """
+        최근 구간의 샘플 복사본
+
+        Args:
+            seconds: Window length
+            now: End of the window in epoch seconds
+
+        Returns:
+            Tuple[array, array]: (timestamps, values) oldest first
+        """
+        cutoff = now - seconds
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._times[self._physical(mid)] < cutoff:
+                lo = mid + 1
+            else:
+                hi = mid
+        size = self.count - lo
+        if size <= 0:
+            return array('d'), array('d')
+
+        first = self._physical(lo)
+        end = first + size
+        if end <= self.capacity:
+            return self._times[first:end], self._values[first:end]
+        wrap = end - self.capacity
+        return self._times[first:] + self._times[:wrap], self._values[first:] + self._values[:wrap]
+
+
+def compute_stats(times: Sequence[float], values: Sequence[float]) -> Optional[WindowStats]:
+    """
+    구간 통계 계산
+
+    Args:
+        times: Sample timestamps (oldest first)
+        values: Sample values
+
+    Returns:
+        Optional[WindowStats]: None if there are no samples
+    """
+    count = len(values)
+    if not count:
+        return None
+
+    mean = math.fsum(values) / count
+    ordered = sorted(values)
+    middle = count // 2
+    median = ordered[middle] if count % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
+    slope = 0.0
+    if count > 1:
+        # 기준 시각을 첫 샘플로 옮겨 큰 epoch 값으로 인한 정밀도 손실 방지
+        offsets = array('d', map((-times[0]).__add__, times))
+        sum_t = math.fsum(offsets)
+        denominator = count * math.fsum(map(mul, offsets, offsets)) - sum_t * sum_t
+        if denominator > 0:
+            numerator = count * math.fsum(map(mul, offsets, values)) - sum_t * mean * count
+            slope = numerator / denominator * 60.0
+
+    return WindowStats(
+        count=count,
+        last=values[-1],
+        mean=mean,
+        median=median,
+        min=ordered[0],
+        max=ordered[-1],
+        slope=slope,
+        since=times[0]
+    )
+
+
+class TimeSeriesStore:
+    """
+    In-process time-series store: one RingSeries per sensor/current channel.
+
+    Memory is bounded up front: at most `max_series` series of `capacity`
+    samples each (16 bytes per sample). Series beyond the limit are not
+    created and their samples are counted as rejected.
+    """
+
+    def __init__(self, capacity: int = 1024, max_series: int = 64) -> None:
+        """
+        Initialize TimeSeriesStore.
+
+        Args:
+            capacity: Samples kept per series
+            max_series: Maximum number of series
+        """
+        self.capacity = capacity
+        self.max_series = max_series
+        self._series: Dict[str, RingSeries] = {}
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    @property
+    def memory_budget(self) -> int:
+        """최대 메모리 사용량 (바이트, 샘플 버퍼 기준)"""
+        return self.capacity * self.max_series * SAMPLE_BYTES
+
+    @property
+    def memory_bytes(self) -> int:
+        """현재 할당된 샘플 버퍼 크기 (바이트)"""
+        return len(self._series) * self.capacity * SAMPLE_BYTES
+
+    def names(self) -> List[str]:
+        """등록된 시계열 이름"""
+        return sorted(self._series)
+
+    def append(self, name: str, value: float, timestamp: Optional[float] = None) -> bool:
+        """
+        샘플 추가
+
+        Args:
+            name: Series name (e.g. "environment/temperature")
+            value: Sample value
+            timestamp: Epoch seconds (now if None)
+
+        Returns:
+            bool: False if the series could not be created because of the memory budget
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                if len(self._series) >= self.max_series:
+                    self.rejected += 1
+                    if self.rejected == 1 or self.rejected % 1000 == 0:
+                        custom_logger.warning(
+                            "시계열 개수 한도(%d) 초과로 샘플을 버림: %s (누적 %d건)",
+                            self.max_series, name, self.rejected
+                        )
+                    return False
+                series = self._series[name] = RingSeries(self.capacity)
+            series.append(timestamp, value)
+        return True
+
+    def latest(self, name: str) -> Optional[Tuple[float, float]]:
+        """가장 최근 (timestamp, value)"""
+        with self._lock:
+            series = self._series.get(name)
+            return series.latest() if series else None
+
+    def window(self, name: str, seconds: float, now: Optional[float] = None) -> Tuple[array, array]:
+        """최근 구간의 (timestamps, values) 복사본"""
+        now = time.time() if now is None else now
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                return array('d'), array('d')
+            return series.window(seconds, now)
+
+    def stats(self, name: str, seconds: float, now: Optional[float] = None) -> Optional[WindowStats]:
+        """
+        최근 구간 통계 (평균/중앙값/최소/최대/기울기)
+
+        Args:
+            name: Series name
+            seconds: Window length
+            now: End of the window (now if None)
+
+        Returns:
+            Optional[WindowStats]: None if the window has no samples
+        """
+        times, values = self.window(name, seconds, now)
+        # 복사본으로 계산하므로 잠금 밖에서 수행
+        return compute_stats(times, values)
+
+    def record_message(self, message: 'DispatchedMessage') -> None:
+        """MQTT 메시지 값을 토픽 이름의 시계열에 기록 (숫자/불리언만)"""
+        value = message.value
+        if isinstance(value, bool):
+            value = 1.0 if value else 0.0
+        elif isinstance(value, str):
+            lowered = value.strip().lower()
+            if lowered in ('true', 'on'):
+                value = 1.0
+            elif lowered in ('false', 'off'):
+                value = 0.0
+        try:
+            sample = float(value)
+        except (TypeError, ValueError):
+            return
+        self.append(message.topic, sample)
+
+    def attach(self, dispatcher: 'MessageDispatcher', prefixes: Sequence[str] = ("environment", "current")) -> None:
+        """디스패처에 등록해 센서/전류 메시지를 자동으로 기록"""
+        for prefix in prefixes:
+            dispatcher.add(f"{prefix}/#", self.record_message)
+
+    def detach(self, dispatcher: 'MessageDispatcher', prefixes: Sequence[str] = ("environment", "current")) -> None:
+        """디스패처 등록 해제"""
+        for prefix in prefixes:
+            dispatcher.remove(f"{prefix}/#", self.record_message)
+
+
+# 전역 인스턴스
+timeseries = TimeSeriesStore(settings.timeseries_capacity, settings.timeseries_max_series)
@@ -0,0 +1,154 @@
+"""키별 순서를 보장하고 최신 값으로 병합하는 작업 큐"""
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, Hashable, List, Set, Tuple
+from logger.custom_logger import custom_logger
+from utils.metrics import LatencyRecorder
+
+# (key, subkey, item) 처리 함수
+WorkHandler = Callable[[Hashable, Hashable, Any], None]
+
+
+class KeyedCoalescingQueue:
+    """
+    Bounded work queue with per-key ordering and latest-value coalescing.
+
+    Items are grouped by key (e.g. device name). At most one worker handles a
+    key at a time and takes that key's items in arrival order, so handlers for
+    the same device never run concurrently or out of order. Within a key,
+    items with the same subkey (e.g. MQTT topic) that are still waiting are
+    replaced by the newest one in place, keeping the subkey's original
+    position among that key's items. Under backpressure the queue therefore holds
+    at most one pending item per subkey instead of growing without bound.
+    New subkeys are dropped once `maxsize` items are pending.
+    """
+
+    def __init__(self, handler: WorkHandler, workers: int = 2, maxsize: int = 1000, name: str = "WorkQueue") -> None:
+        """
+        Initialize KeyedCoalescingQueue.
+
+        Args:
+            handler: Called as handler(key, subkey, item) on a worker thread
+            workers: Number of worker threads
+            maxsize: Maximum number of pending items
+            name: Worker thread name prefix
+        """
+        self.handler = handler
+        self.workers = workers
+        self.maxsize = maxsize
+        self.name = name
+
+        self._pending: Dict[Hashable, 'OrderedDict[Hashable, Tuple[Any, float]]'] = {}
+        self._ready: Deque[Hashable] = deque()
+        self._in_flight: Set[Hashable] = set()
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._stopping = False
+
+        self.depth = 0
+        self.max_depth = 0
+        self.submitted = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.wait_latency = LatencyRecorder()
+
+    def start(self) -> None:
+        """워커 스레드 시작"""
+        with self._cond:
+            if self._threads:
+                return
+            self._stopping = False
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run_worker, name=f"{self.name}-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    @property
+    def running(self) -> bool:
+        """워커가 실행 중인지 여부"""
+        return bool(self._threads) and not self._stopping
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """남은 작업을 처리한 뒤 워커 스레드 종료"""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+
+    def submit(self, key: Hashable, subkey: Hashable, item: Any) -> bool:
+        """
+        작업 추가
+
+        Args:
+            key: Ordering key (one worker at a time per key)
+            subkey: Coalescing key within `key`
+            item: Work item passed to the handler
+
+        Returns:
+            bool: False if the item was dropped because the queue is full
+        """
+        now = time.perf_counter()
+        with self._cond:
+            self.submitted += 1
+            items = self._pending.get(key)
+            if items is not None and subkey in items:
+                # 아직 처리되지 않은 같은 subkey는 제자리에서 최신 값으로 교체
+                # (키 안의 subkey 처리 순서와 대기 시작 시각은 유지해 대기 지연이 과소 측정되지 않도록 함)
+                items[subkey] = (item, items[subkey][1])
+                self.coalesced += 1
+                return True
+
+            if self.depth >= self.maxsize:
+                self.dropped += 1
+                if self.dropped == 1 or self.dropped % 1000 == 0:
+                    custom_logger.warning(f"{self.name} 큐가 가득 차 작업을 버림 (누적 {self.dropped}건)")
+                return False
+
+            if items is None:
+                items = self._pending[key] = OrderedDict()
+                if key not in self._in_flight:
+                    self._ready.append(key)
+            items[subkey] = (item, now)
+            self.depth += 1
+            if self.depth > self.max_depth:
+                self.max_depth = self.depth
+            self._cond.notify()
+            return True
+
+    def _run_worker(self) -> None:
+        """키 단위로 대기 중인 작업을 꺼내 순서대로 처리"""
+        while True:
+            with self._cond:
+                while not self._ready and not self._stopping:
+                    self._cond.wait()
+                if not self._ready:
+                    return
+                key = self._ready.popleft()
+                items = self._pending.pop(key)
+                self._in_flight.add(key)
+                self.depth -= len(items)
+
+            started = time.perf_counter()
+            for subkey, (item, enqueued_at) in items.items():
+                self.wait_latency.record(started - enqueued_at)
+                try:
+                    self.handler(key, subkey, item)
+                except Exception as e:
+                    custom_logger.error(f"{self.name} 작업 처리 실패 ({key}/{subkey}): {str(e)}")
+
+            with self._cond:
+                self._in_flight.discard(key)
+                # 처리 중에 들어온 같은 키의 작업은 다시 대기열로
+                if key in self._pending:
+                    self._ready.append(key)
+                    self._cond.notify()
+
+    def report(self) -> str:
+        """큐 상태 요약"""
+        return (
+            f"depth={self.depth} max_depth={self.max_depth} submitted={self.submitted} "
+            f"coalesced={self.coalesced} dropped={self.dropped} wait {self.wait_latency.summary()}"
+        )